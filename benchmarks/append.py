@@ -0,0 +1,36 @@
+"""Regression benchmark for the length counter and tail reference: append 10^6 items one by one and check that the \
+cost per append does not grow with the length.
+
+Run with :code:`python benchmarks/append.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 6
+STEP = N // 4
+
+if __name__ == "__main__":
+    print(f"{'list':<20}{'total (s)':>10}" + "".join(f"{f'ns/append @{i + STEP:,}':>22}" for i in range(0, N, STEP))
+          + f"{'len() (ns)':>12}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        ll = ds()
+        per_append = []
+        total = 0
+        for i in range(0, N, STEP):
+            start = perf_counter()
+            for j in range(STEP):
+                ll.append(j)
+            elapsed = perf_counter() - start
+            total += elapsed
+            per_append.append(elapsed / STEP * 1e9)
+        start = perf_counter()
+        for _ in range(1000):
+            len(ll)
+        len_ns = (perf_counter() - start) / 1000 * 1e9
+        assert len(ll) == N
+        print(f"{ds.__name__:<20}{total:>10.2f}" + "".join(f"{t:>22.0f}" for t in per_append) + f"{len_ns:>12.0f}")
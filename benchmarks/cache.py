@@ -0,0 +1,86 @@
+"""Serve a skewed stream of keys through an LRU / LFU cache: LRUCache and LFUCache, against an LRU cache built on \
+DoublyLinkedList.pop() / append() with a dict, collections.OrderedDict and functools.lru_cache.
+
+Run with :code:`python benchmarks/cache.py`.
+"""
+import random
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.cache import LFUCache, LRUCache  # noqa: E402
+from pydsa.data_structures.linked_list import DoublyLinkedList  # noqa: E402
+
+
+def load(key):
+    return key * 2
+
+
+def serve_pydsa(cache, keys):
+    for key in keys:
+        value = cache.get(key)
+        if value is None:
+            cache[key] = load(key)
+    return cache.hits / len(keys)
+
+
+def serve_by_index(capacity, keys):
+    # Positional bookkeeping, every hit walks the list to find its key
+    order, values, hits = DoublyLinkedList(), {}, 0
+    for key in keys:
+        if key in values:
+            hits += 1
+            order.pop(order.index(key))
+        else:
+            if len(values) == capacity:
+                del values[order.pop(0).value]
+            values[key] = load(key)
+        order.append(key)
+    return hits / len(keys)
+
+
+def serve_ordered_dict(capacity, keys):
+    cache, hits = OrderedDict(), 0
+    for key in keys:
+        value = cache.get(key)
+        if value is None:
+            if len(cache) == capacity:
+                cache.popitem(last=False)
+            cache[key] = load(key)
+        else:
+            hits += 1
+            cache.move_to_end(key)
+    return hits / len(keys)
+
+
+def serve_lru_cache(capacity, keys):
+    cached = lru_cache(maxsize=capacity)(load)
+    for key in keys:
+        cached(key)
+    return cached.cache_info().hits / len(keys)
+
+
+def bench(name, stmt):
+    times = []
+    for _ in range(3):
+        start = perf_counter()
+        hit_rate = stmt()
+        times.append(perf_counter() - start)
+    print(f"{name:<44}{min(times) * 1e3:>12.3f}{hit_rate:>12.3f}")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    n = 10 ** 5
+    keys = [int(random.paretovariate(0.5)) for _ in range(n)]
+    print(f"{'workload':<44}{'time (ms)':>12}{'hit rate':>12}")
+    for capacity in (100, 1000):
+        bench(f"LRUCache (capacity={capacity})", lambda: serve_pydsa(LRUCache(capacity), keys))
+        bench(f"LFUCache (capacity={capacity})", lambda: serve_pydsa(LFUCache(capacity), keys))
+        bench(f"DoublyLinkedList by index (capacity={capacity})", lambda: serve_by_index(capacity, keys))
+        bench(f"OrderedDict (capacity={capacity})", lambda: serve_ordered_dict(capacity, keys))
+        bench(f"functools.lru_cache (capacity={capacity})", lambda: serve_lru_cache(capacity, keys))
@@ -0,0 +1,44 @@
+"""Positional access on linked lists of 10^5 nodes, with and without checkpoints.
+
+Run with :code:`python benchmarks/checkpoints.py`.
+"""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 5
+OPS = 1000
+
+
+def traverse(ll, indices):
+    for idx in indices:
+        ll.traverse(idx)
+
+
+def insert_pop(ll, indices):
+    for idx in indices:
+        ll.insert(idx, idx)
+        ll.pop(idx)
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    indices = [random.randrange(-N, N) for _ in range(OPS)]
+    print(f"{'list':<20}{'checkpoints':<20}{'us/traverse':>14}{'us/insert+pop':>16}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        for stride in (None, 16, 64, 256):
+            ll = ds(range(N))
+            if stride is not None:
+                ll.enable_checkpoints(stride)
+            times = []
+            for bench in (traverse, insert_pop):
+                start = perf_counter()
+                bench(ll, indices)
+                times.append((perf_counter() - start) / OPS * 1e6)
+            name = "none" if stride is None else f"stride={stride}"
+            print(f"{ds.__name__:<20}{name:<20}{times[0]:>14.1f}{times[1]:>16.1f}")
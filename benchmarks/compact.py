@@ -0,0 +1,56 @@
+"""Memory per element, objects tracked by the garbage collector, time of a full collection and iteration speed of \
+linked lists of 10^6 values: singly and doubly linked lists against compact linked lists, whose slots are shuffled by \
+inserting in the middle, then renumbered by compact().
+
+Run with :code:`python benchmarks/compact.py`.
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import CompactLinkedList, DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+
+def measure(name, build):
+    gc.collect()
+    tracked = len(gc.get_objects())
+    tracemalloc.start()
+    ds = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracked = len(gc.get_objects()) - tracked
+    collect = min(repeat(gc.collect, number=1, repeat=3))
+    iterate = min(repeat(lambda: sum(1 for _ in ds), number=1, repeat=3))
+    print(f"{name:<48}{size / N:>14.1f}{tracked:>14}{collect * 1e3:>14.1f}{iterate / N * 1e9:>14.1f}")
+    return ds
+
+
+def shuffled(values, doubly):
+    # Half of the values are inserted in the middle, so the slots are no longer in traversal order
+    cll = CompactLinkedList(values[:N // 2], doubly=doubly)
+    for value in values[N // 2:]:
+        cll.insert(1, value)
+    return cll
+
+
+def compacted(cll):
+    cll.compact()
+    return cll
+
+
+if __name__ == "__main__":
+    values = list(range(N))
+    print(f"{'data structure':<48}{'bytes/elem':>14}{'gc objects':>14}{'gc (ms)':>14}{'iter ns/elem':>14}")
+    measure("SinglyLinkedList", lambda: SinglyLinkedList(values))
+    measure("DoublyLinkedList", lambda: DoublyLinkedList(values))
+    for doubly in (False, True):
+        name = f"CompactLinkedList(doubly={doubly})"
+        measure(name, lambda: CompactLinkedList(values, doubly))
+        cll = measure(f"{name}, shuffled", lambda: shuffled(values, doubly))
+        measure(f"{name}, compacted", lambda: compacted(cll))
@@ -0,0 +1,84 @@
+"""Share a linked list between threads: ConcurrentDoublyLinkedList, which locks each end separately, against \
+DoublyLinkedList behind one global lock which every call is wrapped in.
+
+Two workloads, like a work queue: every thread appends and pops (mixed), or half of the threads only append at the \
+tail while the other half only pop at the head (producers / consumers), which is what separate end locks are for. \
+Now and then a thread reads all the values. The values are checked afterwards, nothing should be lost nor duplicated.
+
+Run with :code:`python benchmarks/concurrent_list.py`.
+"""
+import sys
+from pathlib import Path
+from threading import Lock, Thread
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import ConcurrentDoublyLinkedList, DoublyLinkedList  # noqa: E402
+
+
+def work_concurrent(ll, thread_id, ops, read_every, role):
+    for i in range(ops):
+        if role != "consumer":
+            ll.append((thread_id, i))
+        if role == "consumer" or (role == "mixed" and i % 2):
+            ll.pop_left()
+        if i % read_every == 0:
+            sum(1 for _ in ll.values())
+
+
+def work_global_lock(ll, lock, thread_id, ops, read_every, role):
+    for i in range(ops):
+        if role != "consumer":
+            with lock:
+                ll.append((thread_id, i))
+        if role == "consumer" or (role == "mixed" and i % 2):
+            with lock:
+                ll.pop(0)
+        if i % read_every == 0:
+            # The lock is held while the values are read
+            with lock:
+                sum(1 for _ in ll.values())
+
+
+def run(n_threads, ops, read_every, split, concurrent):
+    # Enough values that consumers never run out, however far ahead of producers they get
+    initial = n_threads // 2 * ops if split else 1000
+    ll = ConcurrentDoublyLinkedList(range(initial)) if concurrent else DoublyLinkedList(range(initial))
+    lock = Lock()
+    roles = ["producer", "consumer"] * (n_threads // 2) if split else ["mixed"] * n_threads
+    if concurrent:
+        threads = [Thread(target=work_concurrent, args=(ll, t, ops, read_every, role)) for t, role in enumerate(roles)]
+    else:
+        threads = [Thread(target=work_global_lock, args=(ll, lock, t, ops, read_every, role))
+                   for t, role in enumerate(roles)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+    values = ll.to_list()
+    # Consumers pop as many values as producers append
+    expected = initial if split else initial + n_threads * (ops - ops // 2)
+    assert len(ll) == len(values) == expected
+    assert len(set(map(repr, values))) == len(values)
+    return elapsed
+
+
+def bench(name, n_threads, ops, read_every, split, concurrent):
+    elapsed = min(run(n_threads, ops, read_every, split, concurrent) for _ in range(5))
+    print(f"{name:<88}{elapsed * 1e3:>12.3f}{n_threads * ops / elapsed / 1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    print(f"{'workload':<88}{'time (ms)':>12}{'kops/s':>14}")
+    ops = 5000
+    for split in (False, True):
+        workload = "producers / consumers" if split else "mixed"
+        for n_threads in (2, 4, 8):
+            for read_every in (500, 10 ** 9):
+                reads = "no reads" if read_every > ops else f"read every {read_every} ops"
+                setting = f"{workload}, {n_threads} threads, {reads}"
+                bench(f"ConcurrentDoublyLinkedList ({setting})", n_threads, ops, read_every, split, True)
+                bench(f"DoublyLinkedList + global lock ({setting})", n_threads, ops, read_every, split, False)
@@ -0,0 +1,32 @@
+"""Copy linked lists and static lists of 10^5 and 10^6 elements, shallow and deep, against copying a built-in list.
+
+Run with :code:`python benchmarks/copying.py`.
+"""
+import sys
+from copy import deepcopy
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+from pydsa.data_structures.list import StaticList  # noqa: E402
+
+
+def bench(name, f, n):
+    print(f"{name:<40}{min(repeat(f, number=1, repeat=3)) / n * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    print(f"{'copy':<40}{'ns/element':>12}")
+    for n in (10 ** 5, 10 ** 6):
+        values = list(range(n))
+        for ds in (SinglyLinkedList, DoublyLinkedList):
+            ll = ds(values)
+            bench(f"{ds.__name__}.copy() n={n}", ll.copy, n)
+            bench(f"{ds.__name__} deepcopy n={n}", lambda: deepcopy(ll), n)
+        sl = StaticList(values)
+        bench(f"StaticList.copy() n={n}", sl.copy, n)
+        bench(f"StaticList deepcopy n={n}", lambda: deepcopy(sl), n)
+        bench(f"list.copy() n={n}", values.copy, n)
+        bench(f"list deepcopy n={n}", lambda: deepcopy(values), n)
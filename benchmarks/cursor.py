@@ -0,0 +1,57 @@
+"""Edit linked lists at a moving position, like a text buffer: with a cursor, against insert() / pop() at an index.
+
+Run with :code:`python benchmarks/cursor.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+
+def edit_by_index(ll, n):
+    # Every third node is replaced by two, every fifth one is dropped
+    index = 0
+    for step in range(n):
+        if step % 5 == 0:
+            ll.pop(index)
+            continue
+        if step % 3 == 0:
+            ll.insert(index, "x")
+            index += 1
+        index += 1
+
+
+def edit_by_cursor(ll, n):
+    cur = ll.cursor()
+    for step in range(n):
+        if step % 5 == 0:
+            cur.remove_here()
+            continue
+        if step % 3 == 0:
+            cur.insert_before("x")
+        cur.next()
+
+
+def bench(name, stmt, setup):
+    times = []
+    for _ in range(3):
+        arg = setup()
+        start = perf_counter()
+        stmt(arg)
+        times.append(perf_counter() - start)
+    print(f"{name:<44}{min(times) * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    print(f"{'workload':<44}{'time (ms)':>12}")
+    for n in (10 ** 3, 10 ** 4):
+        for ds in (SinglyLinkedList, DoublyLinkedList):
+            name = ds.__name__
+            bench(f"{name} by index (n={n})", lambda ll: edit_by_index(ll, n), lambda: ds(range(n)))
+            bench(f"{name} by cursor (n={n})", lambda ll: edit_by_cursor(ll, n), lambda: ds(range(n)))
+    n = 10 ** 6
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        bench(f"{ds.__name__} by cursor (n={n})", lambda ll: edit_by_cursor(ll, n), lambda: ds(range(n)))
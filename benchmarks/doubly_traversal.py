@@ -0,0 +1,36 @@
+"""Reach nodes near the end of a :class:`DoublyLinkedList` of 10^6 nodes, and iterate it backwards.
+
+Run with :code:`python benchmarks/doubly_traversal.py`.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+
+def timed(f):
+    start = perf_counter()
+    f()
+    return (perf_counter() - start) * 1e3
+
+
+if __name__ == "__main__":
+    ll = DoublyLinkedList(range(N))
+    print(f"{'operation':<40}{'time (ms)':>12}{'peak memory (KiB)':>20}")
+    for name, f in [("traverse(10)", lambda: ll.traverse(10)),
+                    ("traverse(N - 10)", lambda: ll.traverse(N - 10)),
+                    ("traverse(-10)", lambda: ll.traverse(-10)),
+                    ("traverse(N // 2)", lambda: ll.traverse(N // 2)),
+                    ("for node in reversed(ll)", lambda: sum(1 for _ in reversed(ll))),
+                    ("for node in ll", lambda: sum(1 for _ in ll))]:
+        tracemalloc.start()
+        elapsed = timed(f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:<40}{elapsed:>12.3f}{peak / 1024:>20.1f}")
@@ -0,0 +1,40 @@
+"""Cold-start cost of importing each pydsa module, parsed from :code:`python -X importtime`.
+
+Every module is imported in a fresh interpreter (after a warm-up run, so that bytecode is cached). The self time is \
+the time spent executing the module itself, the cumulative time includes everything it imports for the first time.
+
+Run with :code:`python benchmarks/import_time.py`.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.absolute()
+MODULES = ["pydsa", "pydsa.algorithms", "pydsa.algorithms.math", "pydsa.algorithms.searching",
+           "pydsa.algorithms.sorting", "pydsa.data_structures", "pydsa.data_structures.linked_list",
+           "pydsa.data_structures.list"]
+RUNS = 7
+
+
+def import_time(module):
+    """Return {imported module: (self time, cumulative time)} in microseconds, best of RUNS runs."""
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    best = {}
+    for _ in range(RUNS + 1):  # The first run writes the bytecode cache
+        stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT, env=env,
+                                capture_output=True, text=True, check=True).stderr
+        timings = {}
+        for line in stderr.splitlines()[1:]:  # Skip the header
+            self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+        best = {name: tuple(map(min, timing, best.get(name, timing))) for name, timing in timings.items()}
+    return best
+
+
+if __name__ == "__main__":
+    print(f"{'module':<40}{'self (us)':>12}{'cumulative (us)':>18}")
+    for module in MODULES:
+        timings = import_time(module)
+        self_us, cumulative_us = timings[module]
+        print(f"{module:<40}{self_us:>12}{cumulative_us:>18}")
@@ -0,0 +1,98 @@
+"""Time functions which call other pydsa functions internally: through the undecorated cores, against the same \
+functions calling the decorated public ones, i.e. validating the arguments again on every internal call.
+
+Run with :code:`python benchmarks/internal_calls.py`.
+"""
+import sys
+from functools import reduce
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa import Any, Sequence, validate_args  # noqa: E402
+from pydsa.algorithms.math import gcd, lcm  # noqa: E402
+from pydsa.algorithms.searching import binary_search, exponential_search, jump_search, linear_search  # noqa: E402
+from pydsa.data_structures import Node  # noqa: E402
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+
+@validate_args
+def validated_lcm(a: int, b: int, *num: int) -> int:
+    """lcm() calling the public gcd() for every pair."""
+    return reduce(lambda x, y: abs(x * y) // gcd(x, y), [a, b, *num])
+
+
+@validate_args
+def validated_exponential_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
+    """exponential_search() calling the public binary_search()."""
+    if len(arr) == 0:
+        return -1
+    elif arr[0] == target:
+        return 0
+    end = 1
+    while end < len(arr) and arr[end] <= target:
+        if arr[end] == target:
+            return end
+        end *= 2
+    start = end // 2
+    idx = binary_search(arr[start:end], target, pre_check=False)
+    return -1 if idx == -1 else start + idx
+
+
+@validate_args
+def validated_jump_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
+    """jump_search() calling the public linear_search()."""
+    if len(arr) == 0:
+        return -1
+    block_size = int(len(arr) ** 0.5)
+    idx = 0
+    for idx in range(0, len(arr), block_size):
+        if arr[idx] == target:
+            return idx
+        elif idx + block_size > len(arr) - 1 or arr[idx + block_size] > target:
+            break
+    result = linear_search(arr[idx: idx + block_size], target)
+    return -1 if result == -1 else result + idx
+
+
+class ValidatedSinglyLinkedList(SinglyLinkedList):
+    """SinglyLinkedList creating its nodes with the validated Node.__init__()."""
+    __slots__ = ()
+
+    def _create_node(self, value):
+        return Node(value, next_node=None)
+
+
+class ValidatedDoublyLinkedList(DoublyLinkedList):
+    """DoublyLinkedList creating its nodes with the validated Node.__init__()."""
+    __slots__ = ()
+
+    def _create_node(self, value):
+        return Node(value, last_node=None, next_node=None)
+
+
+def _best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 1e3
+
+
+def bench(name, validated, internal, number):
+    before = _best(validated, number)
+    after = _best(internal, number)
+    print(f"{name:<40}{before:>16.3f}{after:>16.3f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    nums = range(1, 5000)
+    arr = list(range(10 ** 5))
+
+    print(f"{'call':<40}{'validated (ms)':>16}{'internal (ms)':>16}{'gain':>10}")
+    bench("lcm(*range(1, 5000))", lambda: validated_lcm(*nums), lambda: lcm(*nums), 5)
+    bench("exponential_search(n=10^5)", lambda: validated_exponential_search(arr, 77777, pre_check=False),
+          lambda: exponential_search(arr, 77777, pre_check=False), 100)
+    bench("jump_search(n=10^5)", lambda: validated_jump_search(arr, 77777, pre_check=False),
+          lambda: jump_search(arr, 77777, pre_check=False), 100)
+    for validated_ds, ds in ((ValidatedSinglyLinkedList, SinglyLinkedList),
+                             (ValidatedDoublyLinkedList, DoublyLinkedList)):
+        bench(f"{ds.__name__}(range(90)).insert(45, 1)", lambda: validated_ds(range(90)).insert(45, 1),
+              lambda: ds(range(90)).insert(45, 1), 100)
@@ -0,0 +1,45 @@
+"""Iterate over linked lists of 10^6 nodes: the length-bounded iteration against a walk which checks a counter on \
+every step (how iteration used to guard against cycles), and against a bare pointer walk.
+
+Run with :code:`python benchmarks/iteration.py`.
+"""
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+
+def counted_walk(ll, max_iter=sys.maxsize):
+    count = 0
+    current = ll.head
+    while current is not None:
+        count += 1
+        if count > max_iter:
+            raise RuntimeError
+        yield current
+        current = current.next_node
+
+
+def bare_walk(ll):
+    current = ll.head
+    while current is not None:
+        yield current
+        current = current.next_node
+
+
+def bench(name, f):
+    print(f"{name:<40}{min(repeat(f, number=1, repeat=5)) / N * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    print(f"{'walk':<40}{'ns/node':>12}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        ll = ds(range(N))
+        bench(f"{ds.__name__}.__iter__", lambda: sum(1 for _ in ll))
+        bench(f"{ds.__name__} counter per step", lambda: sum(1 for _ in counted_walk(ll)))
+        bench(f"{ds.__name__} bare pointer walk", lambda: sum(1 for _ in bare_walk(ll)))
@@ -0,0 +1,47 @@
+"""Push bursts of nodes to the head of a linked list and pop them again, with and without a :class:`NodePool`: time, \
+allocated nodes and garbage collections.
+
+Run with :code:`python benchmarks/node_pool.py`.
+"""
+import gc
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, NodePool, SinglyLinkedList  # noqa: E402
+
+BURST = 1000
+ROUNDS = 200
+
+
+def gc_runs():
+    return sum(stat["collections"] for stat in gc.get_stats())
+
+
+def churn(ds, pool):
+    ll = ds(pool=pool)
+    collections = gc_runs()
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        for i in range(BURST):
+            ll.insert(0, i)
+        for _ in range(BURST):
+            node = ll.pop(0)
+            if pool is not None:
+                pool.release(node)
+    return perf_counter() - start, gc_runs() - collections
+
+
+if __name__ == "__main__":
+    print(f"{'list':<40}{'time (s)':>10}{'new nodes':>12}{'GC runs':>10}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        elapsed, collections = churn(ds, None)
+        print(f"{ds.__name__:<40}{elapsed:>10.3f}{BURST * ROUNDS:>12,}{collections:>10}")
+
+        pool = NodePool(ds._node_type, max_size=BURST)
+        pool.reserve(BURST)
+        elapsed, collections = churn(ds, pool)
+        name = f"{ds.__name__} + NodePool"
+        print(f"{name:<40}{elapsed:>10.3f}{pool.misses:>12,}{collections:>10}")
@@ -0,0 +1,52 @@
+"""Compare :class:`Node` with the slotted :class:`SinglyNode` / :class:`DoublyNode`: memory per node and relink \
+throughput, at 10^6 nodes.
+
+Run with :code:`python benchmarks/nodes.py`.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures import DoublyNode, Node, SinglyNode, set_debug  # noqa: E402
+
+N = 10 ** 6
+
+
+def make_nodes(factory):
+    return [factory(i) for i in range(N)]
+
+
+def bytes_per_node(factory):
+    tracemalloc.start()
+    nodes = make_nodes(factory)
+    size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(nodes)
+    tracemalloc.stop()
+    del nodes
+    return size / N
+
+
+def relinks_per_second(factory, attr):
+    nodes = make_nodes(factory)
+    start = perf_counter()
+    for a, b in zip(nodes, nodes[1:]):
+        setattr(a, attr, b)
+    return N / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    cases = [("Node(next_node=...)", lambda i: Node(i, next_node=None)),
+             ("Node(last_node=..., next_node=...)", lambda i: Node(i, last_node=None, next_node=None)),
+             ("SinglyNode", SinglyNode),
+             ("DoublyNode", DoublyNode)]
+
+    print(f"{'node':<40}{'bytes/node':>12}{'relinks/s':>14}")
+    for name, factory in cases:
+        print(f"{name:<40}{bytes_per_node(factory):>12.1f}{relinks_per_second(factory, 'next_node'):>14,.0f}")
+    set_debug(True)
+    for name, factory in cases[2:]:
+        name += " (debug)"
+        print(f"{name:<40}{bytes_per_node(factory):>12.1f}{relinks_per_second(factory, 'next_node'):>14,.0f}")
+    set_debug(False)
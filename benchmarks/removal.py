@@ -0,0 +1,52 @@
+"""Remove values from linked lists: remove() near the end, against finding the index and popping it (how it used to be \
+done), and remove_all() / remove_if() against calling remove() in a loop.
+
+Run with :code:`python benchmarks/removal.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import (CompactLinkedList, DoublyLinkedList, SinglyLinkedList,  # noqa: E402
+                                               UnrolledLinkedList)
+
+
+def find_and_pop(ll, value):
+    for idx, node in enumerate(ll):
+        if node == value:
+            ll.pop(idx)
+            return
+
+
+def remove_in_loop(ll, value):
+    while value in ll:
+        ll.remove(value)
+
+
+def bench(name, stmt, setup):
+    times = []
+    for _ in range(3):
+        arg = setup()
+        start = perf_counter()
+        stmt(arg)
+        times.append(perf_counter() - start)
+    print(f"{name:<48}{min(times) * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    print(f"{'operation':<48}{'time (ms)':>12}")
+    n = 10 ** 5
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        name = ds.__name__
+        bench(f"{name} find and pop (n={n})", lambda ll: find_and_pop(ll, n - 2), lambda: ds(range(n)))
+        bench(f"{name}.remove() (n={n})", lambda ll: ll.remove(n - 2), lambda: ds(range(n)))
+    n = 10 ** 4
+    for ds in (SinglyLinkedList, DoublyLinkedList, UnrolledLinkedList, CompactLinkedList):
+        name = ds.__name__
+        bench(f"{name} remove() in a loop (n={n})", lambda ll: remove_in_loop(ll, 0), lambda: ds([0, 1] * (n // 2)))
+        bench(f"{name}.remove_all() (n={n})", lambda ll: ll.remove_all(0), lambda: ds([0, 1] * (n // 2)))
+    n = 10 ** 6
+    for ds in (SinglyLinkedList, DoublyLinkedList, UnrolledLinkedList, CompactLinkedList):
+        bench(f"{ds.__name__}.remove_if() (n={n})", lambda ll: ll.remove_if(lambda x: x % 2), lambda: ds(range(n)))
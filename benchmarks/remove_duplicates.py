@@ -0,0 +1,29 @@
+"""Remove duplicates from linked lists of 10^6 nodes.
+
+Run with :code:`python benchmarks/remove_duplicates.py`.
+"""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+if __name__ == "__main__":
+    random.seed(0)
+    cases = [("10^3 distinct ints", [random.randrange(1000) for _ in range(N)], None),
+             ("all distinct ints", list(range(N)), None),
+             ("ints, key=x % 1000", list(range(N)), lambda x: x % 1000),
+             ("10^3 distinct lists (N=10^4)", [[random.randrange(1000)] for _ in range(10 ** 4)], None)]
+
+    print(f"{'list':<20}{'values':<32}{'time (s)':>10}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        for name, values, key in cases:
+            ll = ds(values)
+            start = perf_counter()
+            ll.remove_duplicates(key)
+            print(f"{ds.__name__:<20}{name:<32}{perf_counter() - start:>10.3f}")
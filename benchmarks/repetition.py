@@ -0,0 +1,50 @@
+"""Repeat linked lists and static lists k times: :code:`*=` against how it used to be done, by adding a copy of the \
+list k - 1 times (linked lists) or extending item by item (static lists).
+
+Run with :code:`python benchmarks/repetition.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+from pydsa.data_structures.list import DynamicList, StaticList  # noqa: E402
+
+
+def copy_and_add(ll, k):
+    new = ll.copy()
+    for _ in range(k - 1):
+        ll += new
+        new = new.copy()
+    return ll
+
+
+def extend_items(sl, k):
+    content = sl[:]
+    for _ in range(k - 1):
+        sl.extend(content)
+    return sl
+
+
+def bench(name, stmt, setup):
+    times = []
+    for _ in range(3):
+        arg = setup()
+        start = perf_counter()
+        stmt(arg)
+        times.append(perf_counter() - start)
+    print(f"{name:<48}{min(times) * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    print(f"{'operation':<48}{'time (ms)':>12}")
+    for n, k in [(10, 10 ** 4), (10 ** 3, 100), (10 ** 5, 10)]:
+        for ds in (SinglyLinkedList, DoublyLinkedList):
+            bench(f"{ds.__name__} *= {k} (n={n})", lambda ll: ll.__imul__(k), lambda: ds(range(n)))
+            bench(f"{ds.__name__} copy and add (n={n}, k={k})", lambda ll: copy_and_add(ll, k), lambda: ds(range(n)))
+        bench(f"StaticList *= {k} (n={n})", lambda sl: sl.__imul__(k), lambda: StaticList(range(n), n * k))
+        bench(f"StaticList extend items (n={n}, k={k})", lambda sl: extend_items(sl, k),
+              lambda: StaticList(range(n), n * k))
+        bench(f"DynamicList *= {k} (n={n})", lambda dl: dl.__imul__(k), lambda: DynamicList(range(n)))
@@ -0,0 +1,67 @@
+"""Flip the order of a linked list often: DoublyLinkedList.reverse() only flips a flag, against rewriting the links \
+each time (reverse() then materialize(), as reverse() used to do) and SinglyLinkedList.reverse().
+
+Then alternate reverse() with a node-level access. head and traverse() give a node away, so they rewrite the links \
+first, in O(n) once per flip. swap(), reversed() and move_to_end() work on the links as they are.
+
+Run with :code:`python benchmarks/reversal.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+
+def flip(ll, times, eager=False):
+    # Take from one end, then the other one, like a deque which alternates its direction
+    for _ in range(times):
+        ll.reverse()
+        if eager:
+            ll.materialize()
+        ll.append(ll.pop(0).value)
+
+
+def alternate(ll, times, access):
+    for _ in range(times):
+        ll.reverse()
+        access(ll)
+
+
+def bench(name, stmt, setup):
+    times = []
+    for _ in range(3):
+        arg = setup()
+        start = perf_counter()
+        stmt(arg)
+        times.append(perf_counter() - start)
+    print(f"{name:<72}{min(times) * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    print(f"{'workload':<72}{'time (ms)':>12}")
+    flips = 100
+    for n in (10 ** 3, 10 ** 5):
+        bench(f"DoublyLinkedList lazy (n={n}, {flips} flips)", lambda ll: flip(ll, flips),
+              lambda: DoublyLinkedList(range(n)))
+        bench(f"DoublyLinkedList materialized (n={n}, {flips} flips)", lambda ll: flip(ll, flips, True),
+              lambda: DoublyLinkedList(range(n)))
+        bench(f"SinglyLinkedList (n={n}, {flips} flips)", lambda ll: flip(ll, flips),
+              lambda: SinglyLinkedList(range(n)))
+    accesses = (("head", lambda ll: ll.head),
+                ("traverse(1)", lambda ll: ll.traverse(1)),
+                ("swap(0, 1)", lambda ll: ll.swap(0, 1)),
+                ("next(reversed())", lambda ll: next(reversed(ll))),
+                ("move_to_end(next(reversed()), False)", lambda ll: ll.move_to_end(next(reversed(ll)), False)))
+    for n in (10 ** 3, 10 ** 5):
+        for access_name, access in accesses:
+            bench(f"reverse() + {access_name} (n={n}, {flips} flips)", lambda ll: alternate(ll, flips, access),
+                  lambda: DoublyLinkedList(range(n)))
+    n = 10 ** 6
+    ll = DoublyLinkedList(range(n))
+    ll.reverse()
+    start = perf_counter()
+    ll.materialize()
+    print(f"{f'DoublyLinkedList.materialize() (n={n})':<72}{(perf_counter() - start) * 1e3:>12.3f}")
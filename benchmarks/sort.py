@@ -0,0 +1,59 @@
+"""Sort linked lists with :meth:`sort` (merge sort), with the insertion sort it replaced and with :code:`sorted()` \
+over the extracted values.
+
+Run with :code:`python benchmarks/sort.py`.
+"""
+import random
+import sys
+from operator import lt
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+
+def insertion_sort(ll):
+    """The former implementation of sort(), for SinglyLinkedList."""
+    dummy_node = ll._node_type(-1, next_node=ll.head)
+    next_ = ll.head.next_node
+    cur = ll.head
+    while next_ is not None:
+        if not lt(next_.value, cur.value):
+            next_ = next_.next_node
+            cur = cur.next_node
+            continue
+        correct_place = dummy_node
+        while not lt(next_.value, correct_place.next_node.value):
+            correct_place = correct_place.next_node
+        cur.next_node = next_.next_node
+        next_.next_node = correct_place.next_node
+        correct_place.next_node = next_
+        next_ = cur.next_node
+
+
+def bench(name, make, sort):
+    times = []
+    for _ in range(3):
+        ll = make()
+        start = perf_counter()
+        sort(ll)
+        times.append(perf_counter() - start)
+    print(f"{name:<50}{min(times) * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'sort':<50}{'time (ms)':>12}")
+    for n in (2000, 10 ** 5):
+        values = [random.random() for _ in range(n)]
+        for ds in (SinglyLinkedList, DoublyLinkedList):
+            bench(f"{ds.__name__}.sort() n={n:,}", lambda: ds(values), lambda ll: ll.sort())
+            bench(f"{ds.__name__}.sort(key=neg) n={n:,}", lambda: ds(values), lambda ll: ll.sort(key=lambda x: -x))
+            bench(f"sorted(values of {ds.__name__}) n={n:,}", lambda: ds(values),
+                  lambda ll: sorted(node.value for node in ll))
+        if n <= 2000:
+            bench(f"insertion sort n={n:,}", lambda: SinglyLinkedList(values), insertion_sort)
+    bench("SinglyLinkedList.sort() n=100,000, already sorted", lambda: SinglyLinkedList(range(10 ** 5)),
+          lambda ll: ll.sort())
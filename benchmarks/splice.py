@@ -0,0 +1,42 @@
+"""Concatenate and partition linked lists of 10^5 and 10^6 nodes: splice() and split(), which relink nodes, against \
+:code:`+=` and rebuilding from values, which copy them.
+
+Run with :code:`python benchmarks/splice.py`.
+"""
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+
+def bench(name, stmt, setup):
+    # setup() builds fresh linked lists before every run, only stmt is timed
+    times = []
+    for _ in range(3):
+        args = setup()
+        start = perf_counter()
+        stmt(*args)
+        times.append(perf_counter() - start)
+    print(f"{name:<48}{min(times) * 1e3:>12.3f}")
+
+
+def copy_split(ll, at):
+    values = [node.value for node in ll]
+    return type(ll)(values[:at]), type(ll)(values[at:])
+
+
+if __name__ == "__main__":
+    print(f"{'operation':<48}{'time (ms)':>12}")
+    for n in (10 ** 5, 10 ** 6):
+        for ds in (SinglyLinkedList, DoublyLinkedList):
+            name = ds.__name__
+            bench(f"{name} += other (n={n})", lambda a, b: a.__iadd__(b), lambda: (ds(range(n)), ds(range(n))))
+            bench(f"{name}.extend_from(other) (n={n})", lambda a, b: a.extend_from(b),
+                  lambda: (ds(range(n)), ds(range(n))))
+            bench(f"{name}.splice(other, 0) (n={n})", lambda a, b: a.splice(b, 0), lambda: (ds(range(n)), ds(range(n))))
+            bench(f"{name} copy into halves (n={n})", lambda a: copy_split(a, n // 2), lambda: (ds(range(n)),))
+            bench(f"{name}.split(n // 2) (n={n})", lambda a: a.split(n // 2), lambda: (ds(range(n)),))
+            bench(f"{name}.split(n - 1) (n={n})", lambda a: a.split(n - 1), lambda: (ds(range(n)),))
@@ -0,0 +1,35 @@
+"""Memory per element and iteration speed of linked lists of 10^6 values: singly, doubly and unrolled linked lists \
+with several block sizes, against a built-in list. The values are created beforehand, only the memory taken by the \
+data structure itself is measured.
+
+Run with :code:`python benchmarks/unrolled.py`.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList, UnrolledLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+
+def measure(name, build):
+    tracemalloc.start()
+    ds = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    seconds = min(repeat(lambda: sum(1 for _ in ds), number=1, repeat=5))
+    print(f"{name:<40}{size / N:>12.1f}{seconds / N * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    values = list(range(N))
+    print(f"{'data structure':<40}{'bytes/elem':>12}{'ns/elem':>12}")
+    measure("list", lambda: list(values))
+    measure("SinglyLinkedList", lambda: SinglyLinkedList(values))
+    measure("DoublyLinkedList", lambda: DoublyLinkedList(values))
+    for block_size in (16, 64, 256):
+        measure(f"UnrolledLinkedList(block_size={block_size})", lambda: UnrolledLinkedList(values, block_size))
@@ -0,0 +1,66 @@
+"""Per-call overhead of :func:`pydsa.validate_args`, before and after compiling the validation plan.
+
+Run with :code:`python benchmarks/validate_args.py`.
+"""
+import sys
+from functools import wraps
+from inspect import Parameter, signature
+from itertools import zip_longest
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa import check_arg  # noqa: E402
+from pydsa.algorithms.searching import linear_search  # noqa: E402
+from pydsa.algorithms.sorting import bubble_sort  # noqa: E402
+from pydsa.data_structures import Node  # noqa: E402
+
+
+def legacy_validate_args(f):
+    """validate_args as it was before the plan was compiled at decoration time."""
+
+    @wraps(f)
+    def _wrapper(*args, **kwargs):
+        params = signature(f).parameters.values()
+        for idx, [inp, accept] in enumerate(zip_longest(args, params, fillvalue=Parameter.empty)):
+            if idx == 0 and "." in f.__qualname__:
+                continue
+            if inp == Parameter.empty:
+                kwarg = kwargs.get(accept.name)
+                if kwarg is not None:
+                    inp = kwarg
+                else:
+                    continue
+            if accept == Parameter.empty:
+                continue
+            accept_types = accept.annotation
+            if accept_types == Parameter.empty:
+                continue
+            check_arg(accept.name, inp, accept_types)
+        return f(*args, **kwargs)
+
+    return _wrapper
+
+
+def _best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def bench(name, decorated, call, number=20000):
+    core = decorated.__wrapped__
+    legacy = legacy_validate_args(core)
+    bare = _best(lambda: call(core), number)
+    before = _best(lambda: call(legacy), number) - bare
+    after = _best(lambda: call(decorated), number) - bare
+    print(f"{name:<16}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    arr = [3, 1, 2]
+    node = Node.__new__(Node)
+
+    print(f"{'function':<16}{'before (us)':>12}{'after (us)':>12}{'speedup':>10}")
+    bench("linear_search", linear_search, lambda f: f(arr, 2))
+    bench("Node.__init__", Node.__init__, lambda f: f(node, 10, next_node=None))
+    bench("bubble_sort", bubble_sort, lambda f: f(arr, reverse=True))
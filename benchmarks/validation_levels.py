@@ -0,0 +1,26 @@
+"""Time a few sorts at n = 10^5 under each validation level.
+
+Run with :code:`python benchmarks/validation_levels.py`.
+"""
+import random
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa import VALIDATION_LEVELS, validation  # noqa: E402
+from pydsa.algorithms.sorting import bucket_sort, counting_sort, merge_sort, radix_sort  # noqa: E402
+
+N = 10 ** 5
+
+if __name__ == "__main__":
+    arr = [random.randint(-N, N) for _ in range(N)]
+
+    print(f"{'function':<16}" + "".join(f"{level + ' (ms)':>16}" for level in VALIDATION_LEVELS))
+    for f in (counting_sort, radix_sort, bucket_sort, merge_sort):
+        timings = []
+        for level in VALIDATION_LEVELS:
+            with validation(level):
+                timings.append(min(repeat(lambda: f(arr), number=1, repeat=5)) * 1e3)
+        print(f"{f.__name__:<16}" + "".join(f"{t:>16.1f}" for t in timings))
@@ -0,0 +1,52 @@
+"""Read the values of linked lists of 10^6 nodes: values(), to_list(), to_array() and iter_chunks() against unwrapping \
+the nodes, and count / index / :code:`in` / :code:`==` on the values against comparing the nodes (how they used to \
+be done).
+
+Run with :code:`python benchmarks/values.py`.
+"""
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from pydsa.data_structures.linked_list import DoublyLinkedList, SinglyLinkedList  # noqa: E402
+
+N = 10 ** 6
+
+
+def node_count(ll, value):
+    return sum(1 for node in ll if node == value)
+
+
+def node_index(ll, value):
+    for idx, node in enumerate(ll):
+        if node == value:
+            return idx
+
+
+def node_eq(a, b):
+    return all(not node1 != node2 for node1, node2 in zip(a, b))
+
+
+def bench(name, f):
+    print(f"{name:<48}{min(repeat(f, number=1, repeat=5)) * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    print(f"{'operation (n=10^6)':<48}{'time (ms)':>12}")
+    for ds in (SinglyLinkedList, DoublyLinkedList):
+        name = ds.__name__
+        ll = ds(range(N))
+        other = ds(range(N))
+        bench(f"{name} [node.value for node in ll]", lambda: [node.value for node in ll])
+        bench(f"{name}.to_list()", ll.to_list)
+        bench(f"{name}.to_array('q')", lambda: ll.to_array("q"))
+        bench(f"{name}.iter_chunks(1024)", lambda: sum(map(len, ll.iter_chunks(1024))))
+        bench(f"{name} count by nodes", lambda: node_count(ll, N - 1))
+        bench(f"{name}.count()", lambda: ll.count(N - 1))
+        bench(f"{name} index by nodes", lambda: node_index(ll, N - 1))
+        bench(f"{name}.index()", lambda: ll.index(N - 1))
+        bench(f"{name} in", lambda: N - 1 in ll)
+        bench(f"{name} == by nodes", lambda: node_eq(ll, other))
+        bench(f"{name} ==", lambda: ll == other)
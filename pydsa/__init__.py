@@ -1,10 +1,31 @@
+from collections import abc
 from functools import wraps
-from inspect import getmembers, isclass, isfunction, Parameter, signature
-from itertools import zip_longest
-from typing import NewType
+from importlib import import_module
+from itertools import islice
+from os import environ
+from time import perf_counter
+from types import FunctionType
 
 __all__ = ["Any", "Function", "IntList", "Iterable", "IntFloatList", "Sequence", "NumberSequence", "NonNegativeInt",
-           "PositiveInt", "check_arg", "inherit_docstrings", "validate_args"]
+           "PositiveInt", "ELEMENT_CHECK_STRATEGIES", "VALIDATION_LEVELS", "check_arg", "disable_profiling",
+           "enable_profiling", "get_element_check", "get_profile", "get_validation", "inherit_docstrings",
+           "reset_profile", "set_element_check", "set_validation", "validate_args", "validation"]
+
+
+class NewType:
+    """Same as :code:`typing.NewType`, which is not used since importing typing costs more than the rest of the \
+    package."""
+
+    def __init__(self, name, tp):
+        self.__name__ = name
+        self.__qualname__ = name
+        self.__supertype__ = tp
+
+    def __call__(self, x):
+        return x
+
+    def __repr__(self):
+        return "{}.{}".format(__name__, self.__name__)
 
 
 class _Any:
@@ -42,21 +63,147 @@ NumberSequence = NewType("NumberSequence", _Sequence())
 NonNegativeInt = NewType('NonNegativeInt', int)
 PositiveFloat = NewType("PositiveFloat", float)
 PositiveInt = NewType('PositiveInt', int)
-check_functs = {NumberSequence: lambda x: all(type(item) in [int, float] for item in x),
-                IntFloatList: lambda x: all(type(item) in [int, float] for item in x),
-                IntList: lambda x: all(type(item) == int for item in x),
+# Types of elements accepted by container annotations
+element_types = {NumberSequence: frozenset((int, float)),
+                 IntFloatList: frozenset((int, float)),
+                 IntList: frozenset((int,))}
+# Containers which tell the type of their elements without looking at them
+_typecode_types = {**dict.fromkeys("bBhHiIlLqQnN", int), **dict.fromkeys("efd", float), "?": bool, "u": str, "w": str}
+_homogeneous_types = {range: int, bytes: int, bytearray: int}
+
+ELEMENT_CHECK_STRATEGIES = ("all", "prefix", "sample")
+_ALL, _PREFIX, _SAMPLE = ELEMENT_CHECK_STRATEGIES
+_element_check = (_ALL, 64)
+
+
+def get_element_check():
+    """Return the current element check strategy and size, see :func:`set_element_check`."""
+    return _element_check
+
+
+def set_element_check(strategy, size=64):
+    """Choose which elements of a container (e.g. :code:`IntList`) are checked by :func:`validate_args`.
+
+    * "all": every element is checked, :code:`O(n)`. This is the default.
+    * "prefix": the first :code:`size` elements are checked, :code:`O(k)`.
+    * "sample": :code:`size` elements picked at random are checked, :code:`O(k)`. Containers without random access \
+      fall back to "prefix".
+
+    Whatever the strategy is, containers which know the type of their elements (:code:`array.array`, \
+    :code:`memoryview`, :code:`range`, :code:`bytes` and :code:`bytearray`) are not scanned at all.
+
+    :raises ValueError: Raised when strategy is not one of :data:`ELEMENT_CHECK_STRATEGIES` or size is less than 1.
+    """
+    global _element_check
+    if strategy not in ELEMENT_CHECK_STRATEGIES:
+        raise ValueError("element check strategy should be one of the following: {}, not {!r}".format(
+            list(ELEMENT_CHECK_STRATEGIES), strategy))
+    if not isinstance(size, int) or size < 1:
+        raise ValueError("size should be a positive integer, not {!r}".format(size))
+    _element_check = (ELEMENT_CHECK_STRATEGIES[ELEMENT_CHECK_STRATEGIES.index(strategy)], size)
+
+
+def sample_elements(x):
+    """Return the elements of x to be checked under the current element check strategy."""
+    strategy, size = _element_check
+    if strategy is _ALL:
+        return x
+    if strategy is _SAMPLE and isinstance(x, abc.Sequence):
+        if len(x) <= size:
+            return x
+        from random import sample
+        return [x[idx] for idx in sample(range(len(x)), size)]
+    return islice(x, size)
+
+
+def _known_element_type(x):
+    x_type = type(x)
+    if x_type is memoryview:
+        return _typecode_types.get(x.format)
+    elif x_type.__module__ == "array":  # array.array, without importing array for everyone
+        return _typecode_types.get(x.typecode)
+    return _homogeneous_types.get(x_type)
+
+
+def _elements_of(accept):
+    def _check(x):
+        known = _known_element_type(x)
+        if known is not None:
+            return known in accept or len(x) == 0
+        return {*map(type, sample_elements(x))} <= accept
+
+    return _check
+
+
+check_functs = {**{annot: _elements_of(types) for annot, types in element_types.items()},
                 NonNegativeInt: lambda x: x >= 0,
                 PositiveFloat: lambda x: x >= 0,
                 PositiveInt: lambda x: x >= 1}
+# Check functions which scan the elements of a container, skipped unless validation level is "full"
+element_checks = set(element_types)
 
+VALIDATION_LEVELS = ("off", "shallow", "full")
+_OFF, _SHALLOW, _FULL = VALIDATION_LEVELS
 
-def check_arg(arg_name, inp, accept_types):
-    """Check inp is one of the accept_types."""
-    message = ""  # to pass pycharm check
-    inp_type = type(inp)
+
+def _to_validation_level(level):
+    if level not in VALIDATION_LEVELS:
+        raise ValueError("validation level should be one of the following: {}, not {!r}".format(
+            list(VALIDATION_LEVELS), level))
+    return VALIDATION_LEVELS[VALIDATION_LEVELS.index(level)]  # So that it can be compared with 'is'
+
+
+_validation_level = _to_validation_level(environ.get("PYDSA_VALIDATION", "full"))
+
+
+def get_validation():
+    """Return the current process-wide validation level, one of :data:`VALIDATION_LEVELS`."""
+    return _validation_level
+
+
+def set_validation(level):
+    """Set the process-wide validation level for all functions decorated by :func:`validate_args`.
+
+    The initial level is read from the environment variable :code:`PYDSA_VALIDATION` (default to "full").
+
+    * "off": arguments are not validated at all.
+    * "shallow": types are validated, elements of containers (e.g. :code:`IntList`) are not.
+    * "full": everything is validated.
+
+    :raises ValueError: Raised when level is not one of :data:`VALIDATION_LEVELS`.
+    """
+    global _validation_level
+    _validation_level = _to_validation_level(level)
+
+
+# noinspection PyPep8Naming
+class validation:
+    """Context manager, set the validation level temporarily and restore the previous one on exit.
+
+    Example::
+
+        with validation("off"):
+            counting_sort(trusted_input)
+    """
+
+    def __init__(self, level):
+        self.level = _to_validation_level(level)
+        self.previous = []
+
+    def __enter__(self):
+        self.previous.append(_validation_level)
+        set_validation(self.level)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        set_validation(self.previous.pop())
+
+
+def _compile_annotation(accept_types):
+    """Resolve an annotation into a tuple of (type to compare, annotation, check function, is element check)."""
     if not isinstance(accept_types, list):
         accept_types = [accept_types]
 
+    compiled = []
     for at in accept_types:
         # Replace None with NoneType
         if at is None:
@@ -64,56 +211,164 @@ def check_arg(arg_name, inp, accept_types):
 
         _at = at
         # Check if annotation is 'NewType'
-        if not isclass(at):
+        if not isinstance(at, type):
             at = at.__supertype__
+        compiled.append((at, _at, check_functs.get(_at), _at in element_checks))
+    return tuple(compiled), accept_types
+
 
+def _check_compiled(arg_name, inp, compiled):
+    """Check inp against an annotation compiled by _compile_annotation."""
+    inp_type = type(inp)
+    for at, matching_type, to_test, scans_elements in compiled[0]:
         if at == inp_type:
-            matching_type = _at
             break
     else:
-        if type(accept_types) == list:
-            message = " or ".join(("'{}'".format(t if t is None else t.__name__) for t in accept_types))
+        message = " or ".join(("'{}'".format(t if t is None else t.__name__) for t in compiled[1]))
         raise TypeError(
             "{} accepts {}, not '{}'".format(arg_name, message, inp_type.__name__))
 
-    to_test = check_functs.get(matching_type)
-    if (to_test is not None) and (not to_test(inp)):
+    # noinspection PyUnboundLocalVariable
+    if to_test is None or (scans_elements and _validation_level is not _FULL):
+        return
+    if not to_test(inp):
+        # noinspection PyUnboundLocalVariable
         raise ValueError("{} is not a(n) '{}'".format(inp, matching_type.__name__))
 
 
-def validate_args(f):
-    """Validate function's argument(s) type."""
+def check_arg(arg_name, inp, accept_types):
+    """Check inp is one of the accept_types."""
+    _check_compiled(arg_name, inp, _compile_annotation(accept_types))
 
-    @wraps(f)
-    def _wrapper(*args, **kwargs):
-        # Check args
-        params = signature(f).parameters.values()
-        for idx, [inp, accept] in enumerate(zip_longest(args, params, fillvalue=Parameter.empty)):
-            if idx == 0 and "." in f.__qualname__:
-                continue
+
+_profiling = False
+_profile = {}
+
+
+def enable_profiling():
+    """Start recording, for every function decorated by :func:`validate_args`, the number of calls, the time spent \
+    validating arguments and the time spent in the function body. See :func:`get_profile`."""
+    global _profiling
+    _profiling = True
+
+
+def disable_profiling():
+    """Stop recording. Records collected so far are kept until :func:`reset_profile` is called."""
+    global _profiling
+    _profiling = False
+
+
+def reset_profile():
+    """Discard all records."""
+    _profile.clear()
+
+
+def get_profile(as_json=False):
+    """Return the records collected since profiling was enabled, keyed by qualified function name.
+
+    Each record contains :code:`calls`, :code:`validation_time` and :code:`body_time` (in seconds). The body time of \
+    a function includes the time spent in the decorated functions it calls.
+
+    :param as_json: Return a JSON string rather than a dict, default to False.
+    :type as_json: bool
+    :rtype: dict or str
+    """
+    report = {name: {"calls": calls, "validation_time": validation_time, "body_time": body_time}
+              for name, [calls, validation_time, body_time] in sorted(_profile.items())}
+    if as_json:
+        import json
+        return json.dumps(report, indent=4)
+    return report
+
+
+def _annotated_parameters(f):
+    """Return (position, name, annotation) of the annotated parameters of f, in the same order as \
+    :code:`inspect.signature(f).parameters`."""
+    # Like inspect.signature, follow the chain of functools.wraps
+    while hasattr(f, "__wrapped__"):
+        f = f.__wrapped__
+    if not isinstance(f, FunctionType):
+        # Slow path, importing inspect costs more than everything else in this package
+        from inspect import Parameter, signature
+        return [(idx, param.name, param.annotation) for idx, param in enumerate(signature(f).parameters.values())
+                if param.annotation is not Parameter.empty]
+
+    # Read the parameters from the code object: positional, *args, keyword-only and **kwargs
+    code = f.__code__
+    n_pos = code.co_argcount
+    n_kw_only = code.co_kwonlyargcount
+    names = list(code.co_varnames[:n_pos])
+    var_idx = n_pos + n_kw_only
+    if code.co_flags & 0x04:  # CO_VARARGS
+        names.append(code.co_varnames[var_idx])
+        var_idx += 1
+    names.extend(code.co_varnames[n_pos:n_pos + n_kw_only])
+    if code.co_flags & 0x08:  # CO_VARKEYWORDS
+        names.append(code.co_varnames[var_idx])
+
+    annotations = f.__annotations__
+    return [(idx, name, annotations[name]) for idx, name in enumerate(names) if name in annotations]
+
+
+def _run_plan(plan, args, kwargs):
+    n_args = len(args)
+    for idx, name, compiled in plan:
+        if idx < n_args:
+            inp = args[idx]
+        else:
             # Handle empty input
-            if inp == Parameter.empty:
-                kwarg = kwargs.get(accept.name)
-                if kwarg is not None:
-                    inp = kwarg
-                else:
-                    continue
-
-            if accept == Parameter.empty:
+            inp = kwargs.get(name)
+            if inp is None:
                 continue
-            accept_types = accept.annotation
+        _check_compiled(name, inp, compiled)
 
-            if accept_types == Parameter.empty:
-                continue
-            check_arg(accept.name, inp, accept_types)
 
-        # Call function
-        ret = f(*args, **kwargs)
-        return ret
+def validate_args(f):
+    """Validate function's argument(s) type.
+
+    The signature of :code:`f` is inspected only once, here. It is compiled into a plan of (position, name, \
+    annotation) entries, so that each call only runs the checks without introspecting the function again.
+
+    How much is checked depends on the process-wide validation level, see :func:`set_validation`. The time spent can \
+    be measured with :func:`enable_profiling`.
+    """
+    # Skip 'self' / 'cls' for methods
+    first = 1 if "." in f.__qualname__ else 0
+    plan = tuple((idx, name, _compile_annotation(annotation))
+                 for idx, name, annotation in _annotated_parameters(f) if idx >= first)
+    qualname = "{}.{}".format(f.__module__, f.__qualname__)
+
+    @wraps(f)
+    def _wrapper(*args, **kwargs):
+        if _profiling:
+            return _profiled_call(qualname, plan, f, args, kwargs)
+        if _validation_level is not _OFF:
+            _run_plan(plan, args, kwargs)
+        return f(*args, **kwargs)
 
     return _wrapper
 
 
+def _profiled_call(qualname, plan, f, args, kwargs):
+    record = _profile.get(qualname)
+    if record is None:
+        record = _profile[qualname] = [0, 0.0, 0.0]
+    record[0] += 1
+
+    start = perf_counter()
+    try:
+        if _validation_level is not _OFF:
+            _run_plan(plan, args, kwargs)
+    finally:
+        record[1] += perf_counter() - start
+
+    start = perf_counter()
+    try:
+        return f(*args, **kwargs)
+    finally:
+        record[2] += perf_counter() - start
+
+
 # Notes for PyDSA-styled annotations:
 # - If there is built-in type available, don't hesitate to use it
 # - For logic OR, write it like this: "[int, str]" rather than "int or str"
@@ -125,10 +380,27 @@ def validate_args(f):
 def inherit_docstrings(cls):
     """Class decorator. Inherit docstrings from parent class."""
     # Code from: https://stackoverflow.com/a/17393254/13080049
-    for name, func in getmembers(cls, isfunction):
-        if func.__doc__:
+    # Only look at the functions defined in cls, inherited ones are the same objects as in the parents
+    for name, func in vars(cls).items():
+        if not isinstance(func, FunctionType) or func.__doc__:
             continue
         for parent in cls.__mro__[1:]:
-            if hasattr(parent, name):
-                func.__doc__ = getattr(parent, name).__doc__
+            doc = getattr(getattr(parent, name, None), "__doc__", None)
+            if doc:
+                func.__doc__ = doc
+                break
     return cls
+
+
+_submodules = ("algorithms", "data_structures")
+
+
+def __getattr__(name):
+    # PEP 562, sub-packages are imported on first access
+    if name in _submodules:
+        return import_module("." + name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules})
@@ -0,0 +1,14 @@
+from importlib import import_module
+
+_submodules = ("math", "searching", "sorting")
+
+
+def __getattr__(name):
+    # PEP 562, submodules are imported on first access
+    if name in _submodules:
+        return import_module("." + name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules})
@@ -49,6 +49,15 @@ def wilsons_theorem(n: NonNegativeInt) -> bool:
         return (factorial(n - 1) + 1) % n == 0
 
 
+def _gcd(x, y):
+    # Undecorated core of gcd(), for internal callers which have validated x and y already
+    while x != 0:
+        x, y = y % x, x
+    if y == 0:
+        raise ArithmeticError("GCD of 0 and 0 is undefined")
+    return abs(y)
+
+
 @validate_args
 def gcd(a: int, b: int, *num: int) -> int:
     """The greatest common divisor (GCD) of two or more integers, which are not all zero, is the largest positive
@@ -57,18 +66,9 @@ def gcd(a: int, b: int, *num: int) -> int:
     # Time Complexity: O(log(a+b)), for two integers, a and b
     # GCD(a, b) = (|a * b|) / LCM(a, b)
 
-    def _gcd(x, y):
-        if x == 0:
-            if y == 0:
-                raise ArithmeticError("GCD of 0 and 0 is undefined")
-            return abs(y)
-        else:
-            return _gcd(y % x, x)
-
     b = _gcd(a, b)
-    while len(num) != 0:
-        b = _gcd(b, num[0])
-        num = num[1:]
+    for n in num:
+        b = _gcd(b, n)
     return b
 
 
@@ -83,7 +83,7 @@ def lcm(a: int, b: int, *num: int) -> int:
     def _lcm(x, y):
         if x == 0 or y == 0:
             raise ArithmeticError("LCM of {} and {} is undefined".format(x, y))
-        return abs(x * y) // gcd(x, y)
+        return abs(x * y) // _gcd(x, y)
 
     return reduce(_lcm, [a, b, *num])
 
@@ -104,6 +104,16 @@ def digital_root(num: NonNegativeInt) -> int:
     return 0 if num == 0 else (1 + (num - 1) % 9)
 
 
+def _ackermann_peter(m, n):
+    # Undecorated core of ackermann_peter(), which recurses without validating m and n again
+    if m == 0:
+        return n + 1
+    elif n == 0:
+        return _ackermann_peter(m - 1, 1)
+    else:
+        return _ackermann_peter(m - 1, _ackermann_peter(m, n - 1))
+
+
 @validate_args
 def ackermann_peter(m: NonNegativeInt, n: NonNegativeInt) -> PositiveInt:
     """
@@ -112,12 +122,8 @@ def ackermann_peter(m: NonNegativeInt, n: NonNegativeInt) -> PositiveInt:
      A(m, n) <     A(m - 1 , 1),         m > 0 and n = 0
               L    A(m - 1, A(m, n-1))   m > 0 and n > 0
     """
-    if m == 0:
-        return n + 1  # noqa
-    elif n == 0:
-        return ackermann_peter(m - 1, 1)  # noqa
-    else:
-        return ackermann_peter(m - 1, ackermann_peter(m, n - 1))  # noqa
+
+    return _ackermann_peter(m, n)
 
 
 # todo: use formula to get nth fibonacci --> ((1+sqrt(5))**n - (1-sqrt(5))**n) / (2**n * sqrt(5))
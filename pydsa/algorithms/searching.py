@@ -6,12 +6,20 @@
 from math import sqrt
 
 from pydsa import Any, Iterable, Sequence, NumberSequence, validate_args
-from pydsa.algorithms.sorting import is_sorted
+from pydsa.algorithms.sorting import _is_sorted
 
 __all__ = ["linear_search", "binary_search", "jump_search", "interpolation_search", "exponential_search",
            "ternary_search"]
 
 
+def _linear_search(arr, target):
+    # Undecorated core of linear_search(), for internal callers which have validated the arguments already
+    for idx, item in enumerate(arr):
+        if item == target:
+            return idx
+    return -1
+
+
 @validate_args
 def linear_search(arr: Iterable, target: Any) -> int:
     """Search sequentially from left to right.
@@ -32,10 +40,30 @@ def linear_search(arr: Iterable, target: Any) -> int:
     :paramref:`~pydsa.algorithms.searching.linear_search.arr`.
     :rtype: int
     """
-    for idx, item in enumerate(arr):
-        if item == target:
-            return idx
-    return -1
+    return _linear_search(arr, target)
+
+
+def _binary_search(arr, target, pre_check):
+    # Undecorated core of binary_search(), for internal callers which have validated the arguments already
+    if pre_check:
+        if not _is_sorted(arr, lambda x: x, False):
+            raise ValueError("this algorithm only works for sorted sequence")
+
+    start = 0
+    end = len(arr) - 1
+    if end == -1:
+        return -1
+
+    mid = start + (end - start) // 2
+    while arr[mid] != target:
+        if arr[mid] < target:
+            start = mid + 1
+        else:
+            end = mid - 1
+        if start > end:
+            return -1
+        mid = start + (end - start) // 2
+    return mid
 
 
 @validate_args
@@ -63,26 +91,7 @@ def binary_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
     :raises ValueError: Raised when :paramref:`~pydsa.algorithms.searching.binary_search.arr` is not sorted and \
     :paramref:`~pydsa.algorithms.searching.binary_search.pre_check` is set to True.
     """
-
-    if pre_check:
-        if not is_sorted(arr):
-            raise ValueError("this algorithm only works for sorted sequence")
-
-    start = 0
-    end = len(arr) - 1
-    if end == -1:
-        return -1
-
-    mid = start + (end - start) // 2
-    while arr[mid] != target:
-        if arr[mid] < target:
-            start = mid + 1
-        else:
-            end = mid - 1
-        if start > end:
-            return -1
-        mid = start + (end - start) // 2
-    return mid
+    return _binary_search(arr, target, pre_check)
 
 
 @validate_args
@@ -138,7 +147,7 @@ def jump_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
     :paramref:`~pydsa.algorithms.searching.jump_search.pre_check` is set to True.
     """
     if pre_check:
-        if not is_sorted(arr):
+        if not _is_sorted(arr, lambda x: x, False):
             raise ValueError("this algorithm only works for sorted sequence")
 
     if len(arr) == 0:
@@ -152,7 +161,7 @@ def jump_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
         elif idx + optimal_block_size > len(arr) - 1 or arr[idx + optimal_block_size] > target:
             break
 
-    result = linear_search(arr[idx: idx + optimal_block_size], target)
+    result = _linear_search(arr[idx: idx + optimal_block_size], target)
     if result != -1:
         return result + idx
     else:
@@ -242,7 +251,7 @@ def interpolation_search(arr: NumberSequence, target: Any, pre_check: bool = Tru
     """
 
     if pre_check:
-        if not is_sorted(arr):
+        if not _is_sorted(arr, lambda x: x, False):
             raise ValueError("this algorithm only works for sorted sequence")
 
     start = 0
@@ -287,7 +296,7 @@ def exponential_search(arr: Sequence, target: Any, pre_check: bool = True) -> in
     :paramref:`~pydsa.algorithms.searching.exponential_search.pre_check` is set to True.
     """
     if pre_check:
-        if not is_sorted(arr):
+        if not _is_sorted(arr, lambda x: x, False):
             raise ValueError("this algorithm only works for sorted sequence")
 
     if len(arr) == 0:
@@ -302,7 +311,7 @@ def exponential_search(arr: Sequence, target: Any, pre_check: bool = True) -> in
         end *= 2
     start = end // 2
 
-    idx = binary_search(arr[start:end], target)
+    idx = _binary_search(arr[start:end], target, False)
     if idx != -1:
         return start + idx
     else:
@@ -367,7 +376,7 @@ def ternary_search(arr: Sequence, target: Any, pre_check: bool = True) -> int:
     :paramref:`~pydsa.algorithms.searching.ternary_search.pre_check` is set to True.
     """
     if pre_check:
-        if not is_sorted(arr):
+        if not _is_sorted(arr, lambda x: x, False):
             raise ValueError("this algorithm only works for sorted sequence")
 
     start = 0
@@ -1,14 +1,9 @@
 """Sorting algorithms are used to rearrange a given array according to a comparison operator on the elements."""
-from copy import deepcopy
-from itertools import permutations
 from math import ceil, sqrt
 from operator import le, lt, ge, gt
-from random import randint, shuffle
-from threading import Thread
-from time import sleep
-from warnings import warn
 
-from pydsa import check_arg, Function, IntList, NonNegativeInt, IntFloatList, validate_args
+from pydsa import element_types, Function, IntList, NonNegativeInt, IntFloatList, get_validation, sample_elements, \
+    validate_args
 
 __all__ = ["is_sorted", "bubble_sort", "cocktail_sort", "odd_even_sort", "comb_sort", "gnome_sort", "quicksort",
            "slowsort", "heap_sort", "stooge_sort", "worstsort", "bogosort", "bogobogosort", "bozosort",
@@ -16,10 +11,8 @@ __all__ = ["is_sorted", "bubble_sort", "cocktail_sort", "odd_even_sort", "comb_s
            "bucket_sort", "bead_sort", "proxmap_sort", "sleep_sort"]
 
 
-@validate_args
-def is_sorted(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False) -> bool:
-    """Check whether the list is sorted."""
-
+def _is_sorted(arr, key, reverse):
+    # Undecorated core of is_sorted(), for internal callers which have validated the arguments already
     if reverse:
         cmp = ge
     else:
@@ -31,24 +24,25 @@ def is_sorted(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
     return True
 
 
+@validate_args
+def is_sorted(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False) -> bool:
+    """Check whether the list is sorted."""
+    return _is_sorted(arr, key, reverse)
+
+
 def _check_key_arr(arr, key, annot):
-    try:
-        check_arg("arr", list(map(lambda item: key(item), arr)), annot)
-    except ValueError:
+    if get_validation() != "full":
+        return
+    if not {*map(type, map(key, sample_elements(arr)))} <= element_types[annot]:
         raise ValueError("'arr' is not a(n) '{}' after applying function 'key'.".format(annot.__name__))
 
 
 """Exchange Sorts"""
 
 
-@validate_args
-def bubble_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False) -> list:
-    """Sort by repeatedly swapping the adjacent elements if they are in wrong order."""
-    # Time complexity:
-    #   Worst (reverse sorted): O(n^2)
-    #   Average: Theta(n^2)
-    #   Best (sorted): Omega(n)
-    # Stable. In place.
+def _bubble_sort(arr, key, reverse):
+    # Undecorated core of bubble_sort(), for internal callers which have validated the arguments already
+    from copy import deepcopy
 
     if reverse:
         cmp = gt
@@ -72,6 +66,18 @@ def bubble_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fa
     return arr
 
 
+@validate_args
+def bubble_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False) -> list:
+    """Sort by repeatedly swapping the adjacent elements if they are in wrong order."""
+    # Time complexity:
+    #   Worst (reverse sorted): O(n^2)
+    #   Average: Theta(n^2)
+    #   Best (sorted): Omega(n)
+    # Stable. In place.
+
+    return _bubble_sort(arr, key, reverse)
+
+
 @validate_args
 def cocktail_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False) -> list:
     """A variation of Bubble Sort, sort by traversing through a given array in both directions alternatively."""
@@ -81,6 +87,8 @@ def cocktail_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool =
     #   Best (sorted): Omega(n)
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -120,6 +128,8 @@ def odd_even_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool =
     #   Best (sorted): Omega(n)
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -153,6 +163,8 @@ def comb_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
     #   Best: Omega(n^2/2^p), p is the number of increment
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -172,7 +184,7 @@ def comb_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
                 arr[idx], arr[idx1] = arr[idx1], arr[idx]
         gap = int(gap // shrink_factor)
 
-    return bubble_sort(arr, key=key, reverse=reverse)
+    return _bubble_sort(arr, key, reverse)
 
 
 @validate_args
@@ -190,6 +202,8 @@ def gnome_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fal
     # sort, however, gnome sort makes comparisons even after placing an element in its proper spot. If it encounters a
     # value that is out of place, it behaves like insertion sort again.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -228,6 +242,8 @@ def quicksort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
     #   Best (always picks the middle element as pivot): Omega(n^2)
     # Not stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -318,6 +334,8 @@ def slowsort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False
     #   Best: Omega(n^log n)
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -356,6 +374,8 @@ def heap_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
     #   Best: Omega(n log n)
     # Not stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -402,6 +422,8 @@ def stooge_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fa
     #   Best: Omega(n ^ log(3) /log(1.5))
     # Not stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -427,6 +449,23 @@ def stooge_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fa
     return arr
 
 
+def _worstsort(arr, key, reverse, recursion_depth, sorting_algorithm):
+    # Undecorated core of worstsort(), for internal callers which have validated the arguments already
+    from itertools import permutations
+
+    if recursion_depth == 0:
+        return _bubble_sort(arr, key, reverse)
+    else:
+        # noinspection PyTypeChecker
+        return _worstsort(
+            list(sorting_algorithm(
+                list(permutations(arr)),
+                key=lambda x: [key(item) for item in x],
+                reverse=reverse
+            )[0]),
+            key, reverse, recursion_depth - 1, sorting_algorithm)
+
+
 @validate_args
 def worstsort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False, recursion_depth: NonNegativeInt = 1,
               sorting_algorithm: Function = bubble_sort) -> list:
@@ -439,18 +478,27 @@ def worstsort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = Fals
     #   Best: Omega(n ^ k)
     # Stability depends on `sorting_algorithm`. Not in place.
 
-    if recursion_depth == 0:
-        return bubble_sort(arr, key=key, reverse=reverse)
+    return _worstsort(arr, key, reverse, recursion_depth, sorting_algorithm)
+
+
+def _bogosort(arr, key, reverse, randomized):
+    # Undecorated core of bogosort(), for internal callers which have validated the arguments already
+    if randomized:
+        from random import shuffle
+
+        while True:
+            if _is_sorted(arr, key, reverse):
+                break
+            shuffle(arr)
     else:
-        # noinspection PyTypeChecker
-        return worstsort(
-            list(sorting_algorithm(
-                list(permutations(arr)),
-                key=lambda x: [key(item) for item in x],
-                reverse=reverse
-            )[0]),
-            key=key, reverse=reverse, recursion_depth=recursion_depth - 1,
-            sorting_algorithm=sorting_algorithm)
+        from itertools import permutations
+
+        for perm in permutations(arr):
+            perm = list(perm)
+            if _is_sorted(perm, key, reverse):
+                arr = perm
+                break
+    return arr
 
 
 @validate_args
@@ -463,18 +511,7 @@ def bogosort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False
     #   Best: Omega(n)
     # Not stable. In place if `randomized` is `True`.
 
-    if randomized:
-        while True:
-            if is_sorted(arr, key=key, reverse=reverse):
-                break
-            shuffle(arr)
-    else:
-        for perm in permutations(arr):
-            perm = list(perm)
-            if is_sorted(perm, key=key, reverse=reverse):
-                arr = perm
-                break
-    return arr
+    return _bogosort(arr, key, reverse, randomized)
 
 
 @validate_args
@@ -490,9 +527,9 @@ def bogobogosort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = F
 
     def _bogobogosort(deck):
         if len(deck) > 1:
-            return bogosort(_bogobogosort(deck[:-1]) + [deck[-1]], key=key, reverse=reverse, randomized=randomized)
+            return _bogosort(_bogobogosort(deck[:-1]) + [deck[-1]], key, reverse, randomized)
         else:
-            return bogosort(deck, key=key, reverse=reverse, randomized=randomized)
+            return _bogosort(deck, key, reverse, randomized)
 
     return _bogobogosort(arr)
 
@@ -506,9 +543,12 @@ def bozosort(arr: list, /, *, key: Function = lambda x: x, reverse: bool = False
     #   Best: Omega(n)
     # Not stable. In place.
 
+    from copy import deepcopy
+    from random import randint
+
     arr = deepcopy(arr)
     end = len(arr) - 1
-    while not is_sorted(arr, key=key, reverse=reverse):
+    while not _is_sorted(arr, key, reverse):
         pick1 = randint(0, end)
         pick2 = randint(0, end)
         arr[pick1], arr[pick2] = arr[pick2], arr[pick1]
@@ -527,6 +567,8 @@ def selection_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool =
     #   Best (sorted): Omega(n^2)
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = max
     else:
@@ -555,6 +597,8 @@ def insertion_sort(arr: list, /, *, key: Function = lambda x: x, reverse: bool =
     #   Best (sorted): Omega(n)
     # Stable. In place.
 
+    from copy import deepcopy
+
     if reverse:
         cmp = gt
     else:
@@ -939,6 +983,10 @@ def sleep_sort(arr: IntFloatList, /, *, key: Function = lambda x: x, reverse: bo
     #   Best: Omega(n + max)
     # Not stable. Not in place. **Unreliable**.
 
+    from threading import Thread
+    from time import sleep
+    from warnings import warn
+
     # noinspection GrazieInspection
     warn("`sleep_sort()` does not guarantee the accuracy of the output, adjust `amplify` accordingly.", Warning)
 
@@ -1,40 +1,32 @@
-from typing import NewType
+from importlib import import_module
 
-from pydsa import Any, check_arg, validate_args
+from pydsa import Any, NewType, check_arg, validate_args
 
-__all__ = ["NodeType", "Node"]
+__all__ = ["DoublyNode", "NodeType", "Node", "SinglyNode", "get_debug", "set_debug"]
+
+_submodules = ("cache", "linked_list", "list")
 
 
 class _NodeType:
     def __eq__(self, other):
-        # Cannot directly use isinstance(other, Node) here, since 'other' is a type object,
-        # type() of two instances of a class is equal
-        node = Node()
-        return other == type(node)
+        # 'other' is a type object, any node class is accepted
+        return isinstance(other, type) and issubclass(other, _BaseNode)
 
 
 # noinspection PyTypeChecker
 NodeType = NewType("NodeType", _NodeType())
 
 
-class Node:
-    """A fundamental unit of which graphs/linked lists etc. are formed."""
+class _BaseNode:
+    """Behaviour shared by all node classes."""
 
-    __annots = {}
-
-    @validate_args
-    def __init__(self, value: Any = None, **attr):
-        self.value = value
-        if attr is not None:
-            for key, _value in attr.items():
-                self.__annots[key] = Any
-                self.__dict__[key] = _value
+    __slots__ = ()
 
     def __delattr__(self, item):
         raise TypeError("cannot delete attribute '{}'".format(item))
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__):
+        if isinstance(other, _BaseNode):
             other = other.value
 
         return self.value == other
@@ -49,7 +41,7 @@ class Node:
         return self.__lt__(other) or self.__eq__(other)
 
     def __lt__(self, other):
-        if isinstance(other, self.__class__):
+        if isinstance(other, _BaseNode):
             other = other.value
 
         return self.value < other
@@ -57,16 +49,6 @@ class Node:
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    def __setattr__(self, key, value):
-        if key == "value":
-            self.__dict__[key] = value
-        else:
-            annots = self.__annots.get(key)
-            if annots is None:
-                raise AttributeError("{} has no attribute '{}'".format(self.__class__.__name__, key))
-            check_arg(key, value, annots)
-            self.__dict__[key] = value
-
     def __str__(self):
         return str(self.value)
 
@@ -77,6 +59,30 @@ class Node:
             value = self.value
         return "{}({})".format(self.__class__.__name__, value)
 
+
+class Node(_BaseNode):
+    """A fundamental unit of which graphs/linked lists etc. are formed."""
+
+    __annots = {}
+
+    @validate_args
+    def __init__(self, value: Any = None, **attr):
+        self.value = value
+        if attr is not None:
+            for key, _value in attr.items():
+                self.__annots[key] = Any
+                self.__dict__[key] = _value
+
+    def __setattr__(self, key, value):
+        if key == "value":
+            self.__dict__[key] = value
+        else:
+            annots = self.__annots.get(key)
+            if annots is None:
+                raise AttributeError("{} has no attribute '{}'".format(self.__class__.__name__, key))
+            check_arg(key, value, annots)
+            self.__dict__[key] = value
+
     @validate_args
     def set_annotations(self, **annot: dict) -> None:
         """Annotate the attribute(s) and it will validate value(s) when calling __setattr__."""
@@ -85,3 +91,69 @@ class Node:
                 self.__annots[name] = _type
             else:
                 raise AttributeError("{} has no attribute '{}'".format(self.__class__.__name__, name))
+
+
+class SinglyNode(_BaseNode):
+    """Node of a singly linked list.
+
+    Attributes are stored in slots and assignments are not validated, which makes the node several times smaller and \
+    faster to relink than :class:`Node`. Call :func:`set_debug` to validate assignments to the link attributes.
+    """
+
+    __slots__ = ("value", "next_node")
+    __setattr__ = object.__setattr__
+    _annotations = {"next_node": [NodeType, None]}
+
+    def __init__(self, value=None, next_node=None):
+        self.value = value
+        self.next_node = next_node
+
+
+class DoublyNode(SinglyNode):
+    """Node of a doubly linked list, see :class:`SinglyNode`."""
+
+    __slots__ = ("last_node",)
+    _annotations = {"next_node": [NodeType, None], "last_node": [NodeType, None]}
+
+    def __init__(self, value=None, last_node=None, next_node=None):
+        self.value = value
+        self.last_node = last_node
+        self.next_node = next_node
+
+
+def _debug_setattr(self, key, value):
+    annots = self._annotations.get(key)
+    if annots is not None:
+        check_arg(key, value, annots)
+    object.__setattr__(self, key, value)
+
+
+def get_debug():
+    """Return whether assignments to the attributes of :class:`SinglyNode` and :class:`DoublyNode` are validated.
+
+    :rtype: bool
+    """
+    return SinglyNode.__setattr__ is _debug_setattr
+
+
+@validate_args
+def set_debug(enabled: bool) -> None:
+    """Validate assignments to the attributes of :class:`SinglyNode` and :class:`DoublyNode` (:code:`True`) or not \
+    (:code:`False`, the default).
+
+    :param enabled: Whether to validate.
+    :type enabled: bool
+    """
+    # DoublyNode inherits __setattr__ from SinglyNode
+    SinglyNode.__setattr__ = _debug_setattr if enabled else object.__setattr__
+
+
+def __getattr__(name):
+    # PEP 562, submodules are imported on first access
+    if name in _submodules:
+        return import_module("." + name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules})
@@ -0,0 +1,458 @@
+"""Bounded key-value stores which evict the least recently / least frequently used entries to make room."""
+from abc import ABC, abstractmethod
+from time import monotonic
+
+from pydsa import Any, Function, PositiveInt, inherit_docstrings, validate_args
+from pydsa.data_structures.linked_list import DoublyLinkedList
+
+__all__ = ["LRUCache", "LFUCache"]
+
+_MISSING = object()
+
+
+class _Entry:
+    """A cached value with its key, size, expiry time and number of uses, stored as the value of a node."""
+    __slots__ = ("key", "value", "size", "expires", "uses")
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.uses = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.key!r}: {self.value!r})"
+
+
+class _Cache(ABC):
+    """A mapping of limited capacity. Each key is indexed to a node of a :class:`DoublyLinkedList`, which keeps the \
+    eviction order and is relinked in :code:`O(1)` on every use.
+
+    :ivar hits: Number of lookups which found a value.
+    :type hits: int
+    :ivar misses: Number of lookups which did not, including the expired values.
+    :type misses: int
+    :ivar evictions: Number of values dropped to make room.
+    :type evictions: int
+    :ivar expirations: Number of values dropped because they outlived the time to live.
+    :type expirations: int
+    """
+    __slots__ = ("_capacity", "_size_of", "_ttl", "_timer", "_index", "_size", "hits", "misses", "evictions",
+                 "expirations")
+
+    @validate_args
+    def __init__(self, capacity: PositiveInt = 128, size_of: [Function, None] = None,
+                 ttl: [int, float, None] = None, timer: Function = monotonic) -> None:
+        """Initialize an empty cache.
+
+        :param capacity: Maximum total size of the values, default to 128.
+        :type capacity: int
+        :param size_of: A function which returns the size of a value, default to None, i.e. every value has a size of \
+        1 and capacity is the maximum number of values.
+        :type size_of: Callable or None
+        :param ttl: Number of seconds a value is kept after it is set, default to None, i.e. forever.
+        :type ttl: int or float or None
+        :param timer: A function which returns the current time in seconds, default to :code:`time.monotonic`.
+        :type timer: Callable
+        :raises ValueError: Raised when ttl is not positive.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl should be positive, not {ttl}")
+        self._capacity = capacity
+        self._size_of = size_of
+        self._ttl = ttl
+        self._timer = timer
+        self._index = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._reset()
+
+    def __contains__(self, key):
+        node = self._index.get(key)
+        return node is not None and not self._expired(node.value)
+
+    def __delitem__(self, key):
+        self._discard(self._index[key])
+
+    def __getitem__(self, key):
+        value = self._get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(size={self._size}, capacity={self._capacity})"
+
+    def __setitem__(self, key, value):
+        self._set(key, value)
+
+    @property
+    def capacity(self):
+        """Maximum total size of the values.
+
+        :type: int
+        """
+        return self._capacity
+
+    @property
+    def size(self):
+        """Total size of the values, i.e. the number of values if no size_of function is given.
+
+        :type: int or float
+        """
+        return self._size
+
+    @property
+    def ttl(self):
+        """Number of seconds a value is kept after it is set, None for forever.
+
+        :type: int or float or None
+        """
+        return self._ttl
+
+    # Undecorated cores of the public methods, :code:`cache[key]` and :code:`cache[key] = value` call them directly.
+
+    def _discard(self, node):
+        entry = node.value
+        self._unlink(node)
+        del self._index[entry.key]
+        self._size -= entry.size
+
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self._timer()
+
+    def _get(self, key, default):
+        node = self._index.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        entry = node.value
+        if entry.expires is not None and entry.expires <= self._timer():
+            self._discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return entry.value
+
+    @abstractmethod
+    def _link(self, entry):
+        """Store a new entry, used once, and return its node."""
+        pass
+
+    @abstractmethod
+    def _reset(self):
+        """Drop the eviction order."""
+        pass
+
+    def _set(self, key, value):
+        size = 1 if self._size_of is None else self._size_of(value)
+        if size > self._capacity:
+            raise ValueError(f"value of size {size} does not fit in {type(self).__name__} of capacity "
+                             f"{self._capacity}")
+        expires = None if self._ttl is None else self._timer() + self._ttl
+        node = self._index.get(key)
+        if node is None:
+            while self._size + size > self._capacity:
+                self._discard(self._victim(None))
+                self.evictions += 1
+            self._index[key] = self._link(_Entry(key, value, size, expires))
+            self._size += size
+            return
+        # Replaced in place and used, it is not evicted to make room for itself
+        entry = node.value
+        self._size += size - entry.size
+        entry.value = value
+        entry.size = size
+        entry.expires = expires
+        self._touch(node)
+        exclude = self._index[key]
+        while self._size > self._capacity:
+            self._discard(self._victim(exclude))
+            self.evictions += 1
+
+    @abstractmethod
+    def _touch(self, node):
+        """Record a use of the entry of node, :attr:`_index` is updated if it is stored in another node."""
+        pass
+
+    @abstractmethod
+    def _unlink(self, node):
+        pass
+
+    @abstractmethod
+    def _victim(self, exclude):
+        """Return the node of the entry to evict, other than node exclude (None for any). There is always another \
+        entry to evict."""
+        pass
+
+    @validate_args
+    def clear(self) -> None:
+        """Drop all values and reset the statistics.
+
+        :rtype: None
+        """
+        self._index.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._reset()
+
+    @validate_args
+    def expire(self) -> int:
+        """Drop every value which has outlived the time to live. Expired values are otherwise dropped when they are \
+        looked up or evicted.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :returns: Number of values dropped.
+        :rtype: int
+        """
+        if self._ttl is None:
+            return 0
+        now = self._timer()
+        expired = [node for node in self._index.values() if node.value.expires <= now]
+        for node in expired:
+            self._discard(node)
+        self.expirations += len(expired)
+        return len(expired)
+
+    @validate_args
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value of key and record the use, default if key is not cached or has expired.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param key: A hashable key.
+        :type key: Any
+        :param default: Value returned on a miss, default to None.
+        :type default: Any
+        :rtype: Any
+        """
+        return self._get(key, default)
+
+    @validate_args
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Remove key and return its value, or default if key is not cached or has expired. Neither a hit nor a miss \
+        is recorded.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param key: A hashable key.
+        :type key: Any
+        :param default: Value returned if key is not cached, default to raising :code:`KeyError`.
+        :type default: Any
+        :rtype: Any
+        :raises KeyError: Raised when key is not cached and no default is given.
+        """
+        node = self._index.get(key)
+        if node is None or self._expired(node.value):
+            if node is not None:
+                self._discard(node)
+                self.expirations += 1
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._discard(node)
+        return node.value.value
+
+    @validate_args
+    def put(self, key: Any, value: Any) -> None:
+        """Set the value of key, evicting values until it fits. Setting a cached key replaces its value and counts as \
+        a use.
+
+        Time complexity: :code:`O(1)` per evicted value.
+
+        Space complexity: :code:`O(1)`.
+
+        :param key: A hashable key.
+        :type key: Any
+        :param value: Value to cache.
+        :type value: Any
+        :rtype: None
+        :raises ValueError: Raised when the size of value is greater than :attr:`capacity`.
+        """
+        self._set(key, value)
+
+    @validate_args
+    def stats(self) -> dict:
+        """Return the number of hits, misses, evictions and expirations, the hit rate and the current size.
+
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "expirations": self.expirations, "hit_rate": self.hits / lookups if lookups else 0.0,
+                "length": len(self._index), "size": self._size}
+
+
+# noinspection PyMissingOrEmptyDocstring
+@inherit_docstrings
+class LRUCache(_Cache):
+    """A cache which evicts the least recently used value. The values are kept in a :class:`DoublyLinkedList` from \
+    the least to the most recently used one, a hit moves its node to the end.
+
+    :ivar hits: Number of lookups which found a value.
+    :type hits: int
+    :ivar misses: Number of lookups which did not, including the expired values.
+    :type misses: int
+    :ivar evictions: Number of values dropped to make room.
+    :type evictions: int
+    :ivar expirations: Number of values dropped because they outlived the time to live.
+    :type expirations: int
+    """
+    __slots__ = ("_order",)
+
+    def __iter__(self):
+        # From the least to the most recently used key
+        return (entry.key for entry in self._order.values())
+
+    # The nodes are relinked through the undecorated cores of DoublyLinkedList, the keys are validated by the cache
+
+    def _link(self, entry):
+        order = self._order
+        order._append(entry)
+        return order._tail
+
+    def _reset(self):
+        self._order = DoublyLinkedList()
+
+    def _touch(self, node):
+        self._order._move_to_end(node, True)
+
+    def _unlink(self, node):
+        self._order._detach(node)
+
+    def _victim(self, exclude):
+        # A value being replaced has just been used, it is at the other end
+        return self._order._head
+
+
+class _Bucket:
+    """The entries used the same number of times, from the least to the most recently used one, between the buckets \
+    of the next lower and higher numbers of uses."""
+    __slots__ = ("uses", "entries", "lower", "higher")
+
+    def __init__(self, uses, lower, higher):
+        self.uses = uses
+        self.entries = DoublyLinkedList()
+        self.lower = lower
+        self.higher = higher
+
+
+# noinspection PyMissingOrEmptyDocstring
+@inherit_docstrings
+class LFUCache(_Cache):
+    """A cache which evicts the least frequently used value, the least recently used one among equals. Values used \
+    the same number of times share a :class:`DoublyLinkedList`, and these lists are linked in order of uses, so that \
+    a hit moves a value to the next list and an eviction takes the first value of the lowest list, both in \
+    :code:`O(1)`.
+
+    :ivar hits: Number of lookups which found a value.
+    :type hits: int
+    :ivar misses: Number of lookups which did not, including the expired values.
+    :type misses: int
+    :ivar evictions: Number of values dropped to make room.
+    :type evictions: int
+    :ivar expirations: Number of values dropped because they outlived the time to live.
+    :type expirations: int
+    """
+    __slots__ = ("_buckets", "_lowest")
+
+    def __iter__(self):
+        # From the least to the most frequently used key
+        bucket = self._lowest
+        while bucket is not None:
+            yield from (entry.key for entry in bucket.entries.values())
+            bucket = bucket.higher
+
+    def _add_bucket(self, uses, lower):
+        """Create the bucket of uses right after lower (None for the lowest one) and return it."""
+        higher = self._lowest if lower is None else lower.higher
+        bucket = self._buckets[uses] = _Bucket(uses, lower, higher)
+        if lower is None:
+            self._lowest = bucket
+        else:
+            lower.higher = bucket
+        if higher is not None:
+            higher.lower = bucket
+        return bucket
+
+    # The nodes are relinked through the undecorated cores of DoublyLinkedList, the keys are validated by the cache
+
+    def _link(self, entry):
+        entry.uses = 1
+        bucket = self._lowest
+        if bucket is None or bucket.uses != 1:
+            bucket = self._add_bucket(1, None)
+        entries = bucket.entries
+        entries._append(entry)
+        return entries._tail
+
+    def _remove_bucket(self, bucket):
+        lower, higher = bucket.lower, bucket.higher
+        if lower is None:
+            self._lowest = higher
+        else:
+            lower.higher = higher
+        if higher is not None:
+            higher.lower = lower
+        del self._buckets[bucket.uses]
+
+    def _reset(self):
+        # Number of uses -> bucket, the buckets are linked from the lowest number of uses up
+        self._buckets = {}
+        self._lowest = None
+
+    def _touch(self, node):
+        entry = node.value
+        bucket = self._buckets[entry.uses]
+        entry.uses += 1
+        higher = bucket.higher
+        if higher is None or higher.uses != entry.uses:
+            if bucket.entries._size == 1:
+                # Alone in its bucket, which is moved up a number of uses instead of the node
+                del self._buckets[bucket.uses]
+                bucket.uses = entry.uses
+                self._buckets[entry.uses] = bucket
+                return
+            higher = self._add_bucket(entry.uses, bucket)
+        self._unlink_from(bucket, node)
+        entries = higher.entries
+        entries._append(entry)
+        self._index[entry.key] = entries._tail
+
+    def _unlink(self, node):
+        self._unlink_from(self._buckets[node.value.uses], node)
+
+    def _unlink_from(self, bucket, node):
+        entries = bucket.entries
+        entries._detach(node)
+        if entries._head is None:
+            self._remove_bucket(bucket)
+
+    def _victim(self, exclude):
+        node = self._lowest.entries._head
+        if node is exclude:
+            # A value being replaced is the last one used, it is first only if it is alone
+            node = self._lowest.higher.entries._head
+        return node
@@ -1,13 +1,17 @@
 """A linear data structure where each element is a separate object."""
 import sys
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from copy import deepcopy
-from operator import gt, lt
+from functools import partial, wraps
+from itertools import chain, islice, repeat
+from operator import attrgetter, countOf, eq, gt, lt
 
-from pydsa import Any, Iterable, validate_args, PositiveInt, inherit_docstrings, Function
-from pydsa.data_structures import Node, NodeType
+from pydsa import Any, Iterable, validate_args, NonNegativeInt, PositiveInt, inherit_docstrings, Function, Sequence
+from pydsa.data_structures import DoublyNode, NodeType, SinglyNode, _BaseNode
 
-__all__ = ["ExceedMaxIter", "SinglyLinkedList", "DoublyLinkedList"]
+__all__ = ["ExceedMaxIter", "NodePool", "Cursor", "DoublyCursor", "SinglyLinkedList", "DoublyLinkedList",
+           "ConcurrentDoublyLinkedList", "UnrolledLinkedList", "CompactLinkedList"]
 
 
 class ExceedMaxIter(RuntimeError):
@@ -15,48 +19,627 @@ class ExceedMaxIter(RuntimeError):
     pass
 
 
-class _LinkedList(ABC):
+class NodePool:
+    """A bounded free list of detached nodes. Linked lists sharing a pool take their new nodes from it, so that \
+    workloads which keep adding and removing nodes (e.g. queues) allocate far fewer objects.
+
+    Nodes unlinked by :meth:`~_LinkedList.remove`, :meth:`~_LinkedList.remove_all`, :meth:`~_LinkedList.remove_if` \
+    and :meth:`~_LinkedList.retain_if` are given back to the pool automatically. Nodes returned by \
+    :meth:`~_LinkedList.pop` are still owned by the caller, call :meth:`release` once they are no longer needed.
+
+    .. warning:: A released node is reset and reused, do not keep any reference to it.
+
+    :ivar node_type: Class of the pooled nodes.
+    :type node_type: type
+    :ivar max_size: Maximum number of free nodes kept, extra released nodes are left to the garbage collector.
+    :type max_size: int
+    :ivar hits: Number of nodes taken from the pool.
+    :type hits: int
+    :ivar misses: Number of nodes allocated because the pool was empty.
+    :type misses: int
+    """
+    __slots__ = ("node_type", "max_size", "hits", "misses", "_free")
+
+    @validate_args
+    def __init__(self, node_type: type = DoublyNode, max_size: PositiveInt = 1024) -> None:
+        """Initialize an empty pool.
+
+        :param node_type: :class:`~pydsa.data_structures.SinglyNode` or \
+        :class:`~pydsa.data_structures.DoublyNode`, default to the latter, which can be used by both kinds of linked \
+        lists.
+        :type node_type: type
+        :param max_size: Maximum number of free nodes kept, default to 1024.
+        :type max_size: int
+        :raises TypeError: Raised when node_type is not a slotted node class.
+        """
+        if not issubclass(node_type, SinglyNode):
+            raise TypeError(f"node_type should be SinglyNode or DoublyNode, not '{node_type.__name__}'")
+        self.node_type = node_type
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._free = []
+
+    def __copy__(self):
+        # A pool is shared, copying a linked list does not copy its pool
+        return self
+
+    def __deepcopy__(self, memodict):
+        return self
+
+    def __len__(self):
+        return len(self._free)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.node_type.__name__}, size={len(self._free)}, max_size={self.max_size})"
+
+    def acquire(self, value=None):
+        """Return an unlinked node holding value, recycled if possible.
+
+        Time complexity: :code:`O(1)`.
+
+        :param value: Value of the node, default to None.
+        :type value: Any
+        :rtype: SinglyNode or DoublyNode
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.value = value
+            return node
+        self.misses += 1
+        return self.node_type(value)
+
+    def release(self, node):
+        """Reset node and keep it for reuse, unless the pool is full.
+
+        Time complexity: :code:`O(1)`.
+
+        :param node: A node which is not linked to / from any linked list anymore.
+        :type node: SinglyNode or DoublyNode
+        :raises TypeError: Raised when node is not a(n) :attr:`node_type`.
+        """
+        if type(node) is not self.node_type:
+            raise TypeError(f"{type(self).__name__} of '{self.node_type.__name__}' cannot take "
+                            f"'{type(node).__name__}'")
+        if len(self._free) < self.max_size:
+            node.__init__()  # Drop the value and the links
+            self._free.append(node)
+
+    @validate_args
+    def reserve(self, n: PositiveInt) -> None:
+        """Pre-allocate nodes until the pool holds n free nodes (at most :attr:`max_size`).
+
+        :param n: Number of free nodes wanted.
+        :type n: int
+        :rtype: None
+        """
+        node_type = self.node_type
+        self._free.extend(node_type() for _ in range(min(n, self.max_size) - len(self._free)))
+
+    def clear(self):
+        """Drop all free nodes and reset the statistics.
+
+        :rtype: None
+        """
+        self._free.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return the number of hits, misses and free nodes.
+
+        :rtype: dict
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._free)}
+
+
+class _Checkpoints:
+    """References to some nodes of a linked list and their positions, about stride nodes apart, built lazily."""
+    __slots__ = ("stride", "max_checkpoints", "positions", "nodes")
+
+    def __init__(self, stride, max_checkpoints):
+        self.stride = stride
+        self.max_checkpoints = max_checkpoints
+        self.positions = []
+        self.nodes = []
+
+    def find(self, head, index):
+        """Return the node at index, which should be in range."""
+        positions = self.positions
+        nodes = self.nodes
+        if not positions or positions[-1] + self.stride <= index:
+            self._extend(head, index)
+
+        checkpoint = bisect_right(positions, index) - 1
+        if checkpoint < 0:
+            node, position = head, 0
+        else:
+            node, position = nodes[checkpoint], positions[checkpoint]
+        for _ in range(index - position):
+            node = node.next_node
+
+        if index - position >= 2 * self.stride:
+            # Nodes have been inserted since, add a checkpoint in between
+            positions.insert(checkpoint + 1, index)
+            nodes.insert(checkpoint + 1, node)
+            self._trim()
+        return node
+
+    def _extend(self, head, index):
+        positions = self.positions
+        nodes = self.nodes
+        if positions:
+            node, position = nodes[-1], positions[-1]
+        else:
+            node, position = head, 0
+            positions.append(0)
+            nodes.append(head)
+        stride = self.stride
+        while position + stride <= index:
+            for _ in range(stride):
+                node = node.next_node
+            position += stride
+            positions.append(position)
+            nodes.append(node)
+        self._trim()
+
+    def _trim(self):
+        while self.max_checkpoints is not None and len(self.positions) > self.max_checkpoints:
+            # Over budget, keep every other checkpoint
+            self.positions[:] = self.positions[::2]
+            self.nodes[:] = self.nodes[::2]
+            self.stride *= 2
+
+    def inserted(self, position):
+        """A node has been inserted at position."""
+        positions = self.positions
+        for checkpoint in range(bisect_left(positions, position), len(positions)):
+            positions[checkpoint] += 1
+
+    def removed(self, position, next_node):
+        """The node at position has been removed, next_node took its place."""
+        positions = self.positions
+        checkpoint = bisect_left(positions, position)
+        if checkpoint < len(positions) and positions[checkpoint] == position:
+            if next_node is None or (checkpoint + 1 < len(positions) and positions[checkpoint + 1] == position + 1):
+                del positions[checkpoint], self.nodes[checkpoint]
+            else:
+                self.nodes[checkpoint] = next_node
+                checkpoint += 1
+        for checkpoint in range(checkpoint, len(positions)):
+            positions[checkpoint] -= 1
+
+    def replaced(self, position, node):
+        """node has been moved to position."""
+        checkpoint = bisect_left(self.positions, position)
+        if checkpoint < len(self.positions) and self.positions[checkpoint] == position:
+            self.nodes[checkpoint] = node
+
+    def invalidate(self, position):
+        """Drop the checkpoints at or after position."""
+        checkpoint = bisect_left(self.positions, position)
+        del self.positions[checkpoint:], self.nodes[checkpoint:]
+
+
+_value_of = attrgetter("value")
+_next_node_of = attrgetter("next_node")
+_last_node_of = attrgetter("last_node")
+
+
+def _key_in_value(node):
+    return node.value[0]
+
+
+def _merge_sort(dummy_node, get_key, before):
+    """Sort the nodes after dummy_node by merging runs bottom-up, only next_node is relinked. Equal nodes keep their \
+    order, a node goes before another one only if before(its key, key of the other one) is true. Return the last node.
+    """
+    while True:
+        tail = dummy_node
+        cur = dummy_node.next_node
+        while cur is not None:
+            # Find two runs, a and b, which are in order already
+            a = a_end = cur
+            a_key = get_key(a)
+            cur = a.next_node
+            while cur is not None:
+                key = get_key(cur)
+                if before(key, a_key):
+                    break
+                a_end, a_key = cur, key
+                cur = cur.next_node
+            if cur is None:
+                if tail is dummy_node:  # Only one run is left
+                    return a_end
+                tail = a_end
+                break
+
+            b = b_end = cur
+            b_key = get_key(b)
+            cur = b.next_node
+            while cur is not None:
+                key = get_key(cur)
+                if before(key, b_key):
+                    break
+                b_end, b_key = cur, key
+                cur = cur.next_node
+
+            # Merge them after tail
+            a_end.next_node = None
+            b_end.next_node = None
+            a_key = get_key(a)
+            b_key = get_key(b)
+            try:
+                while True:
+                    if before(b_key, a_key):
+                        tail.next_node = tail = b
+                        b = b.next_node
+                        if b is None:
+                            tail.next_node = a
+                            tail = a_end
+                            break
+                        b_key = get_key(b)
+                    else:
+                        tail.next_node = tail = a
+                        a = a.next_node
+                        if a is None:
+                            tail.next_node = b
+                            tail = b_end
+                            break
+                        a_key = get_key(a)
+            except BaseException:
+                # Link back whatever is left
+                tail.next_node = a
+                a_end.next_node = b
+                b_end.next_node = cur
+                raise
+            tail.next_node = cur
+
+
+class _BaseLinkedList(ABC):
+    """Methods shared by all linked lists, built on :meth:`values` and on unlinking the values which satisfy a \
+    condition in one pass."""
+    __slots__ = ()
+
+    @abstractmethod
+    def _remove_where(self, condition):
+        """Unlink every value for which condition(value) is true in one pass, return how many were unlinked."""
+        pass
+
+    @validate_args
+    def iter_chunks(self, n: PositiveInt):
+        """Return an iterator over the values in lists of n values (fewer for the last one), e.g. to process them in \
+        batches.
+
+        Time complexity: :code:`O(n)` per chunk.
+
+        Space complexity: :code:`O(n)`.
+
+        :param n: Number of values in a chunk.
+        :type n: int
+        :rtype: Iterator[list]
+        """
+        values = self.values()
+        chunk = list(islice(values, n))
+        while chunk:
+            yield chunk
+            chunk = list(islice(values, n))
+
+    @validate_args
+    def remove_all(self, value: Any) -> int:
+        """Remove every occurrence of value in one pass.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to remove.
+        :type value: Any
+        :returns: Number of values removed.
+        :rtype: int
+        """
+        return self._remove_where(partial(eq, value))
+
+    @validate_args
+    def remove_if(self, predicate: Function) -> int:
+        """Remove every value for which predicate(value) is true in one pass. If predicate raises an exception, the \
+        values checked before are removed already.
+
+        Time complexity: :code:`O(n)` calls of predicate.
+
+        Space complexity: :code:`O(1)`.
+
+        :param predicate: A function of one value.
+        :type predicate: Callable
+        :returns: Number of values removed.
+        :rtype: int
+        """
+        return self._remove_where(predicate)
+
+    @validate_args
+    def retain_if(self, predicate: Function) -> int:
+        """Keep only the values for which predicate(value) is true, the opposite of :meth:`remove_if`.
+
+        Time complexity: :code:`O(n)` calls of predicate.
+
+        Space complexity: :code:`O(1)`.
+
+        :param predicate: A function of one value.
+        :type predicate: Callable
+        :returns: Number of values removed.
+        :rtype: int
+        """
+        return self._remove_where(lambda value: not predicate(value))
+
+    @validate_args
+    def to_array(self, typecode: str) -> Sequence:
+        """Return the values in an :code:`array.array` of typecode.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :param typecode: Typecode of the array, see :code:`array.typecodes`.
+        :type typecode: str
+        :rtype: array.array
+        :raises ValueError: Raised when typecode is not a valid typecode.
+        :raises TypeError: Raised when a value cannot be stored in the array.
+        :raises OverflowError: Raised when a value is out of the range of the array.
+        """
+        from array import array
+
+        return array(typecode, self.values())
+
+    @validate_args
+    def to_list(self) -> list:
+        """Return the values in a :code:`list`.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :rtype: list
+        """
+        return list(self.values())
+
+    @abstractmethod
+    def values(self):
+        """Return an iterator over the values, in order.
+
+        Time complexity: :code:`O(1)`, :code:`O(n)` to iterate.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: Iterator
+        """
+        pass
+
+
+class Cursor:
+    """A position in a :class:`SinglyLinkedList`, from which nodes can be inserted and removed in :code:`O(1)`. Get \
+    one with :meth:`~_LinkedList.cursor`.
+
+    The cursor is either at a node or past the last node (:attr:`index` equals the length), where only \
+    :meth:`insert_before` is allowed. It only moves forward, see :class:`DoublyCursor` for a cursor which can move \
+    back.
+
+    .. warning:: The cursor keeps the length, the last node and the checkpoints of its linked list up to date. \
+    Changing the linked list by other means while the cursor is in use leaves the cursor in an undefined state, get a \
+    new one instead.
+    """
+    __slots__ = ("_list", "_last", "_node", "_index")
+
+    def __init__(self, linked_list, last_node, node, index):
+        self._list = linked_list
+        self._last = last_node
+        self._node = node
+        self._index = index
+
+    def __repr__(self):
+        if self._node is None:
+            return f"{type(self).__name__}(<end>, index={self._index})"
+        return f"{type(self).__name__}({self._node.value!r}, index={self._index})"
+
+    @property
+    def at_end(self):
+        """Whether the cursor is past the last node.
+
+        :type: bool
+        """
+        return self._node is None
+
+    @property
+    def index(self):
+        """Position of the cursor.
+
+        :type: int
+        """
+        return self._index
+
+    @property
+    def node(self):
+        """Node at the cursor, None if the cursor is past the last node.
+
+        :type: SinglyNode or DoublyNode or None
+        """
+        return self._node
+
+    @property
+    def value(self):
+        """Value of the node at the cursor.
+
+        :type: Any
+        :raises IndexError: Raised when the cursor is past the last node.
+        """
+        return self._current().value
+
+    @value.setter
+    def value(self, value):
+        self._current().value = value
+
+    def _current(self):
+        if self._node is None:
+            raise IndexError(f"{type(self).__name__} is past the end of {type(self._list).__name__}")
+        return self._node
+
+    def next(self):
+        """Move the cursor to the next node, or past the last node.
+
+        Time complexity: :code:`O(1)`.
+
+        :rtype: None
+        :raises IndexError: Raised when the cursor is past the last node already.
+        """
+        node = self._current()
+        self._last = node
+        self._node = node.next_node
+        self._index += 1
+
+    def insert_before(self, value):
+        """Insert a new node before the cursor, the cursor stays at the same node.
+
+        Time complexity: :code:`O(1)`.
+
+        :param value: Value of the new node.
+        :type value: Any
+        :rtype: None
+        """
+        ll = self._list
+        new_node = ll._create_node(value)
+        ll._connect_nodes(self._last, new_node)
+        ll._connect_nodes(new_node, self._node)
+        if self._last is None:
+            ll._head = new_node
+        if self._node is None:
+            ll._tail = new_node
+        ll._size += 1
+        if ll._checkpoints is not None:
+            ll._checkpoints.inserted(self._index)
+        self._last = new_node
+        self._index += 1
+
+    def insert_after(self, value):
+        """Insert a new node after the cursor, the cursor stays at the same node.
+
+        Time complexity: :code:`O(1)`.
+
+        :param value: Value of the new node.
+        :type value: Any
+        :rtype: None
+        :raises IndexError: Raised when the cursor is past the last node.
+        """
+        node = self._current()
+        ll = self._list
+        new_node = ll._create_node(value)
+        ll._connect_nodes(new_node, node.next_node)
+        ll._connect_nodes(node, new_node)
+        if node is ll._tail:
+            ll._tail = new_node
+        ll._size += 1
+        if ll._checkpoints is not None:
+            ll._checkpoints.inserted(self._index + 1)
+
+    def remove_here(self):
+        """Remove the node at the cursor and return its value, the cursor moves to the next node. The node is given \
+        back to the pool of the linked list, if any.
+
+        Time complexity: :code:`O(1)`.
+
+        :rtype: Any
+        :raises IndexError: Raised when the cursor is past the last node.
+        """
+        node = self._current()
+        value = node.value
+        next_node = node.next_node
+        self._list._unlink(self._last, node, self._index)
+        self._list._size -= 1
+        self._node = next_node
+        return value
+
+
+class DoublyCursor(Cursor):
+    """A position in a :class:`DoublyLinkedList`, which can also move back. See :class:`Cursor`."""
+    __slots__ = ()
+
+    def prev(self):
+        """Move the cursor to the previous node.
+
+        Time complexity: :code:`O(1)`.
+
+        :rtype: None
+        :raises IndexError: Raised when the cursor is at the first node.
+        """
+        if self._last is None:
+            raise IndexError(f"{type(self).__name__} is at the start of {type(self._list).__name__}")
+        self._node = self._last
+        self._last = self._last.last_node
+        self._index -= 1
+
+
+class _LinkedList(_BaseLinkedList):
     """A one-way linear data structure where elements are separated and non-contiguous objects that linked by \
     pointers.
 
     .. note:: Support all methods from built-in :code:`list`, except indexing / slicing.
 
-    :ivar MAX_ITER: Maximum number of iterations, process will be terminated if it has been exceeded.
-    :type MAX_ITER: int
+    :ivar MAX_ITER: Maximum number of iterations, process will be terminated if it has been exceeded. Default to \
+    None, i.e. no limit.
+    :type MAX_ITER: int or None
     :ivar head: Head of linked list.
     :type head: Node or None
-    :raises ExceededMaxIterations: Raised when maximum iterations has been exceeded to prevent an infinite loop.
+    :ivar pool: Pool new nodes are taken from, see :class:`NodePool`.
+    :type pool: NodePool or None
+    :raises ExceededMaxIterations: Raised when maximum iterations has been exceeded or a cycle is found, to prevent \
+    an infinite loop.
+
+    .. note:: The length and the last node are tracked by the methods of linked list. After relinking nodes by hand, \
+    assign :attr:`head` again to recount them.
+
+    .. note:: Iteration is bounded by the tracked length, so it does not check for cycles step by step. Only if more \
+    nodes than expected are linked (i.e. nodes have been relinked by hand), the rest of the walk looks for a cycle \
+    with Brent's algorithm and fails as soon as one is found.
     """
-    __slots__ = ("MAX_ITER", "head")
+    __slots__ = ("MAX_ITER", "_head", "_tail", "_size", "pool", "_checkpoints", "_reversed")
+    _node_type = SinglyNode
+    _cursor_type = Cursor
 
     @validate_args
-    def __init__(self, iterable: Iterable = None) -> None:
+    def __init__(self, iterable: Iterable = None, pool: [NodePool, None] = None) -> None:
         """Initialize a new linked list from an iterable.
 
         :param iterable: An iterable to be converted into a linked list, default to None.
         :type iterable: Iterable or None
+        :param pool: A pool to recycle nodes with, default to None (nodes are always allocated).
+        :type pool: NodePool or None
         """
-        self.MAX_ITER = 99
-        self.head = None
+        self.MAX_ITER = None
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._checkpoints = None
+        self._reversed = False
+        self.pool = pool
 
         if iterable is not None:
-            self.extend(iterable)
+            self._extend(iterable)
 
     def __add__(self, other):
         if not isinstance(other, self.__class__):
             raise TypeError(
                 "unsupported operand type(s) for +: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
-        new = self.copy()
-        new += other
+        new = self._copy()
+        new._extend([node.value for node in other])
         return new
 
     def __contains__(self, item):
-        try:
-            self.index(item)
-        except ValueError:
-            return False
-        else:
-            return True
+        return item in self.values()
+
+    def __copy__(self):
+        return self._copy()
+
+    def __deepcopy__(self, memodict):
+        return self._copy(True, memodict)
 
     def __delattr__(self, item):
         if item == "head":
@@ -66,12 +649,7 @@ class _LinkedList(ABC):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            if len(self) != len(other):
-                return False
-            for node1, node2 in zip(self, other):
-                if node1 != node2:
-                    return False
-            return True
+            return len(self) == len(other) and all(map(eq, self.values(), other.values()))
         return False
 
     def __ge__(self, other):
@@ -84,12 +662,8 @@ class _LinkedList(ABC):
         if not isinstance(other, self.__class__):
             raise TypeError(
                 "unsupported operand type(s) for +=: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
-        copied = other.copy()
-        if self.head is None:
-            self.head = copied.head
-        else:
-            node = self.traverse(-1)
-            self._connect_nodes(node, copied.head)
+        # Values are read first, other may be self
+        self._extend([node.value for node in other])
         return self
 
     def __imul__(self, other):
@@ -99,29 +673,32 @@ class _LinkedList(ABC):
         if other <= 0:
             self.clear()
         else:
-            new = self.copy()
-            for _ in range(other - 1):
-                self.__iadd__(new)
-                new = new.copy()
+            # All the new nodes are appended in one pass after the tail
+            values = [node.value for node in self]
+            self._extend(chain.from_iterable(repeat(values, other - 1)))
         return self
 
     def __iter__(self):
-        count = 0
-        current = self.head
-        while current is not None:
-            count += 1
-            if count > self.MAX_ITER:
-                raise ExceedMaxIter("maximum number of iteration has been exceeded. Make sure there is no "
-                                            "cycle in the linked list by using detect_cycle() or increase MAX_ITER")
+        if self._reversed:
+            self._materialize()
+        size = self._size
+        if self.MAX_ITER is not None and self.MAX_ITER < size:
+            size = self.MAX_ITER
+        current = self._head
+        for _ in range(size):
+            if current is None:  # Fewer nodes than expected, they have been unlinked by hand
+                return
             yield current
             # noinspection PyUnresolvedReferences
             current = current.next_node
+        if current is not None:
+            yield from self._walk_unexpected(current, size)
 
     def __le__(self, other):
         return self.__lt__(other) or self.__eq__(other)
 
     def __len__(self):
-        return sum(1 for _ in self)
+        return self._size
 
     def __lt__(self, other):
         if not isinstance(other, self.__class__):
@@ -140,7 +717,7 @@ class _LinkedList(ABC):
         if not isinstance(other, int):
             raise TypeError(
                 "unsupported operand type(s) for *: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
-        new = self.copy()
+        new = self._copy()
         new *= other
         return new
 
@@ -148,24 +725,31 @@ class _LinkedList(ABC):
         return not self.__eq__(other)
 
     def __reversed__(self):
-        new_l = self.copy()
-        new_l.reverse()
-        return new_l
+        # Nodes cannot be walked backwards, remember them instead
+        return reversed(list(self))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __setattr__(self, key, value):
-        if key == "head":
-            if isinstance(value, Node) or value is None:
+        if key in ("_head", "_tail", "_size", "_checkpoints", "_reversed"):
+            super().__setattr__(key, value)
+        elif key == "head":
+            if isinstance(value, _BaseNode) or value is None:
                 super().__setattr__(key, value)
             else:
                 raise ValueError(f"Value of '{key}' should be a(n) '{NodeType.__name__}', not '{type(value).__name__}'")
         elif key == "MAX_ITER":
-            if isinstance(value, int):
+            if isinstance(value, int) or value is None:
                 super().__setattr__(key, value)
             else:
-                raise ValueError(f"Value of '{key}' should be a(n) '{NodeType.__name__}', not '{type(value).__name__}'")
+                raise ValueError(f"Value of '{key}' should be a(n) 'int' or None, not '{type(value).__name__}'")
+        elif key == "pool":
+            if value is None or (isinstance(value, NodePool) and issubclass(value.node_type, self._node_type)):
+                super().__setattr__(key, value)
+            else:
+                raise ValueError(f"Value of '{key}' should be a(n) '{NodePool.__name__}' of "
+                                 f"'{self._node_type.__name__}', not {value!r}")
         else:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute {key}")
 
@@ -184,6 +768,26 @@ class _LinkedList(ABC):
         except ExceedMaxIter:
             return f"{type(self).__name__}({'<cannot show node(s)>'})"
 
+    @property
+    def head(self):
+        """First node of linked list, None if it is empty. Assign a node to relink the linked list by hand.
+
+        Time complexity: :code:`O(1)`, or :code:`O(n)` once after :meth:`reverse` on a :class:`DoublyLinkedList`, \
+        which relinks its nodes before giving one away (see :meth:`~DoublyLinkedList.materialize`).
+
+        :type: Node or None
+        """
+        if self._reversed:
+            self._materialize()
+        return self._head
+
+    @head.setter
+    def head(self, value):
+        self._head = value
+        self._reversed = False
+        self._invalidate(0)
+        self._recount()
+
     @abstractmethod
     def _connect_nodes(self, node_a: NodeType, node_b: NodeType) -> None:
         pass
@@ -192,67 +796,367 @@ class _LinkedList(ABC):
     def _create_node(self, value: Any) -> NodeType:
         pass
 
-    @validate_args
-    def append(self, value: Any) -> None:
-        """Append a new node to the end of linked list.
-
-        Time complexity: :code:`O(1)`, but it take :code:`O(n)` to traverse to the last node.
-
-        Space complexity: :code:`O(1)`.
+    # Undecorated cores of the public methods. Arguments are validated once by the public methods, internal callers
+    # call the cores directly.
 
-        :param value: Value for new node.
-        :type value: Any
-        :rtype: None
-        """
+    def _append(self, value):
         new_node = self._create_node(value)
-        if self.head is None:
-            self.head = new_node
+        if self._head is None:
+            self._head = new_node
+        elif self._reversed:
+            self._connect_nodes(new_node, self._tail)
         else:
-            tail_node = self.traverse(-1)
-            self._connect_nodes(tail_node, new_node)
+            self._connect_nodes(self._tail, new_node)
+        self._tail = new_node
+        self._size += 1
+
+    def _copy(self, deep=False, memodict=None):
+        new = self.__class__(pool=self.pool)
+        new.MAX_ITER = self.MAX_ITER
+        if deep:
+            if memodict is None:
+                memodict = {}
+            memodict[id(self)] = new
+            new._extend(deepcopy(node.value, memodict) for node in self)
+        else:
+            new._extend(node.value for node in self)
+        return new
 
-    @validate_args
-    def clear(self) -> None:
-        """Remove all nodes from linked list.
+    def _extend(self, iterable):
+        create_node = self._create_node
+        if self._reversed:
+            # The links point the other way, see _materialize()
+            def connect_nodes(node_a, node_b):
+                self._connect_nodes(node_b, node_a)
+        else:
+            connect_nodes = self._connect_nodes
+        last_node = self._tail
+        size = self._size
+        try:
+            for item in iterable:
+                new_node = create_node(item)
+                if last_node is None:
+                    self._head = new_node
+                else:
+                    connect_nodes(last_node, new_node)
+                last_node = new_node
+                size += 1
+        finally:
+            self._tail = last_node
+            self._size = size
 
-        Time complexity: :code:`O(1)`.
+    def _index(self, value, start, end):
+        if start < 0 or end < 0:
+            # Convert negative indices to positive
+            length = len(self)
+            if length == 0:
+                raise ValueError(f"{value} not in {type(self).__name__}")
+            if start < 0 and end < 0:
+                if -start > length:
+                    start = 0
+                    while end < 0:
+                        end += length
+                else:
+                    start += length
+                    end += length
+            else:
+                while start < 0:
+                    start += length
+                while end < 0:
+                    end += length
 
-        Space complexity: :code:`O(1)`.
+        if start < end:
+            try:
+                node = self._traverse(start)
+            except IndexError:
+                raise ValueError(f"{value} not in {type(self).__name__}")
+            # Only values are read, a lazily reversed list is walked against its links rather than relinked
+            next_of = _last_node_of if self._reversed else _next_node_of
+            while node is not None and start < end:
+                if node.value == value:
+                    return start
+                node = next_of(node)
+                start += 1
+        raise ValueError(f"{value} not in {type(self).__name__}")
 
-        :rtype: None
-        """
-        self.head = None
+    @abstractmethod
+    def _insert(self, index, value):
+        pass
 
-    @validate_args
-    def copy(self):
-        """Return a deep copy of linked list.
+    def _invalidate(self, position):
+        """Drop the checkpoints at or after position, where nodes are rearranged."""
+        if self._checkpoints is not None:
+            self._checkpoints.invalidate(position)
 
-        Time complexity: :code:`O(n)`.
+    def _key_nodes(self, key):
+        """Compute the key of every node for sort(), return a function which reads the key of a node. The keys are \
+        kept in (key, value) tuples in place of the values, the links are left alone."""
+        if key is None:
+            return _value_of
+        done = 0
+        try:
+            for node in self:
+                node.value = (key(node.value), node.value)
+                done += 1
+        except BaseException:
+            for node in islice(self, done):
+                node.value = node.value[1]
+            raise
+        return _key_in_value
+
+    def _materialize(self):
+        """Relink the nodes in the order of linked list. Only :class:`DoublyLinkedList` reverses lazily, i.e. its \
+        links may point the other way, which is tracked by :attr:`_reversed`."""
+        pass
 
-        Space complexity: :code:`O(n)`.
+    @abstractmethod
+    def _pop(self, index):
+        pass
 
-        :rtype: DoublyLinkedList / SinglyLinkedList
-        """
-        return deepcopy(self)
+    def _remove_where(self, condition):
+        if self._reversed:
+            self._materialize()
+        last_kept = None
+        removed = 0
+        node = self._head
+        try:
+            # Bounded by the tracked length, like iteration
+            for index in range(self._size):
+                if node is None:
+                    break
+                next_node = node.next_node
+                if condition(node.value):
+                    if removed == 0:
+                        self._invalidate(index)
+                    self._unlink(last_kept, node, index - removed)
+                    removed += 1
+                else:
+                    last_kept = node
+                node = next_node
+        finally:
+            self._size -= removed
+        return removed
 
-    @validate_args
-    def count(self, value: Any) -> int:
+    def _splice(self, other, at):
+        if not isinstance(other, self.__class__):
+            raise TypeError(f"cannot splice '{type(other).__name__}' into '{type(self).__name__}'")
+        if other is self:
+            raise ValueError(f"cannot splice a {type(self).__name__} into itself")
+        if other._head is None:
+            return
+        if self._reversed:
+            self._materialize()
+        if other._reversed:
+            other._materialize()
+        if at < 0:
+            at = max(at + self._size, 0)
+        at = min(at, self._size)
+
+        if at == 0:
+            before, after = None, self._head
+        elif at == self._size:
+            before, after = self._tail, None
+        else:
+            before = self._traverse(at - 1)
+            after = before.next_node
+        self._connect_nodes(before, other._head)
+        self._connect_nodes(other._tail, after)
+        if before is None:
+            self._head = other._head
+        if after is None:
+            self._tail = other._tail
+        self._size += other._size
+        self._invalidate(at)
+        # The nodes belong to self now
+        other.clear()
+
+    def _split(self, at):
+        if self._reversed:
+            self._materialize()
+        if at < 0:
+            at = max(at + self._size, 0)
+        at = min(at, self._size)
+        new = self.__class__(pool=self.pool)
+        new.MAX_ITER = self.MAX_ITER
+        if at == self._size:
+            return new
+
+        if at == 0:
+            before, first = None, self._head
+            self._head = None
+        else:
+            before = self._traverse(at - 1)
+            first = before.next_node
+            self._connect_nodes(before, None)
+        new._connect_nodes(None, first)
+        new._head = first
+        new._tail = self._tail
+        new._size = self._size - at
+        self._tail = before
+        self._size = at
+        self._invalidate(at)
+        return new
+
+    def _traverse_index(self, index):
+        """Convert a negative index to a positive one and check it is in range."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    def _recount(self):
+        size = 0
+        tail = None
+        if self._head is not None:
+            for tail in self._walk_unexpected(self._head, 0):
+                size += 1
+        self._tail = tail
+        self._size = size
+
+    @abstractmethod
+    def _reverse(self):
+        pass
+
+    @abstractmethod
+    def _swap(self, index1, index2):
+        pass
+
+    @abstractmethod
+    def _traverse(self, index):
+        pass
+
+    def _unkey_nodes(self, key):
+        """Undo _key_nodes() once sort() is done."""
+        if key is not None:
+            for node in self:
+                node.value = node.value[1]
+
+    def _unlink(self, last_node, node, position):
+        """Unlink node, which follows last_node (None for the head) and is at position, and give it back to the pool. \
+        The size is left to the caller."""
+        next_node = node.next_node
+        self._connect_nodes(last_node, next_node)
+        if last_node is None:
+            self._head = next_node
+        if next_node is None:
+            self._tail = last_node
+        if self._checkpoints is not None:
+            self._checkpoints.removed(position, next_node)
+        if self.pool is not None:
+            self.pool.release(node)
+        else:
+            # Detach the unlinked node
+            self._connect_nodes(None, node)
+            self._connect_nodes(node, None)
+
+    def _walk_unexpected(self, node, count, link="next_node"):
+        """Yield node and the nodes after it, where count nodes have been yielded before. Used when the nodes have \
+        been relinked by hand, so the walk looks for a cycle (Brent's algorithm) and honours :attr:`MAX_ITER`. The \
+        walk follows link, last_node for a lazily reversed :class:`DoublyLinkedList`."""
+        tortoise = node
+        power = 1
+        steps = 0
+        while node is not None:
+            if self.MAX_ITER is not None and count >= self.MAX_ITER:
+                raise ExceedMaxIter("maximum number of iteration has been exceeded. Make sure there is no "
+                                    "cycle in the linked list by using detect_cycle() or increase MAX_ITER")
+            yield node
+            count += 1
+            node = getattr(node, link, None)  # A bare Node may have no link attribute
+            steps += 1
+            if node is tortoise:
+                raise ExceedMaxIter("the linked list contains a cycle, find it with detect_cycle()")
+            if steps == power:
+                tortoise = node
+                power *= 2
+                steps = 0
+
+    @validate_args
+    def append(self, value: Any) -> None:
+        """Append a new node to the end of linked list.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value for new node.
+        :type value: Any
+        :rtype: None
+        """
+        self._append(value)
+
+    @validate_args
+    def clear(self) -> None:
+        """Remove all nodes from linked list.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: None
+        """
+        self._invalidate(0)
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._reversed = False
+
+    @validate_args
+    def copy(self, deep: bool = False):
+        """Return a copy of linked list with new nodes, built in one pass. :code:`copy.copy()` and \
+        :code:`copy.deepcopy()` call it as well.
+
+        Time complexity: :code:`O(n)`, plus the time to copy values if deep.
+
+        Space complexity: :code:`O(n)`.
+
+        :param deep: Copy values with :code:`copy.deepcopy()` rather than sharing them, default to False.
+        :type deep: bool
+        :rtype: DoublyLinkedList / SinglyLinkedList
+        """
+        return self._copy(deep)
+
+    @validate_args
+    def count(self, value: Any) -> int:
         """Return number of occurrences of nodes with value.
 
         Time complexity: :code:`O(n)`.
 
-        Space complexity: :code:`O(n)`.
+        Space complexity: :code:`O(1)`.
 
         :param value: Value to count for.
         :type value: Any
         :returns: Number of occurrences.
         :rtype: int
         """
-        counter = 0
-        for item in self:
-            if item == value:
-                counter += 1
-        return counter
+        return countOf(self.values(), value)
+
+    @validate_args
+    def cursor(self, index: int = 0):
+        """Return a cursor at index, from which nodes can be inserted and removed in :code:`O(1)`. Index may be the \
+        length of linked list, i.e. past the last node.
+
+        Time complexity: :code:`O(n)`, :code:`O(1)` at either end. Plus :code:`O(n)` once after :meth:`reverse` on a \
+        :class:`DoublyLinkedList`, which relinks its nodes before giving one away (see \
+        :meth:`~DoublyLinkedList.materialize`).
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Position of the cursor, default to 0. Negative indices count from the end.
+        :type index: int
+        :rtype: Cursor or DoublyCursor
+        :raises IndexError: Raised when index is out of range.
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index <= self._size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        if self._reversed:
+            self._materialize()
+        last_node = None if index == 0 else self._traverse(index - 1)
+        node = self._head if last_node is None else last_node.next_node
+        return self._cursor_type(self, last_node, node, index)
 
     @validate_args
     def detect_cycle(self) -> [NodeType, None]:
@@ -265,38 +1169,65 @@ class _LinkedList(ABC):
         :returns: The start node of the cycle. If there is no cycle, return None.
         :rtype: Node or None
         """
-        if self.head is None:
+        if self._head is None:
             return None
+        # A lazily reversed list is walked against its links rather than relinked
+        next_of = _last_node_of if self._reversed else _next_node_of
+
+        # Phase I
+        fast_ptr = self._head
+        slow_ptr = self._head
+        while next_of(fast_ptr) is not None and next_of(next_of(fast_ptr)) is not None:
+            # fast_ptr moves two steps once while slow_ptr moves one step once
+            # They will finally meet at some point if there is a cycle
+            fast_ptr = next_of(next_of(fast_ptr))
+            slow_ptr = next_of(slow_ptr)
+            if fast_ptr is slow_ptr:
+                # Phase II
+                # Reset one pointer to the head
+                fast_ptr = self._head
+                while fast_ptr is not slow_ptr:
+                    fast_ptr = next_of(fast_ptr)  # fast_ptr is no longer "fast" now
+                    slow_ptr = next_of(slow_ptr)
+                # Two pointers will meet at the node where the cycle begins
+                return fast_ptr  # "return slow_ptr" does the job as well
+        return None
 
-        max_iter_copy = self.MAX_ITER
-        self.MAX_ITER = sys.maxsize
-        try:
-            # Phase I
-            fast_ptr = self.head
-            slow_ptr = self.head
-            while fast_ptr.next_node is not None and fast_ptr.next_node.next_node is not None:
-                # fast_ptr moves two steps once while slow_ptr moves one step once
-                # They will finally meet at some point if there is a cycle
-                fast_ptr = fast_ptr.next_node.next_node
-                slow_ptr = slow_ptr.next_node
-                if fast_ptr is slow_ptr:
-                    # Phase II
-                    # Reset one pointer to the head
-                    fast_ptr = self.head
-                    while fast_ptr is not slow_ptr:
-                        fast_ptr = fast_ptr.next_node  # fast_ptr is no longer "fast" now
-                        slow_ptr = slow_ptr.next_node
-                    # Two pointers will meet at the node where the cycle begins
-                    return fast_ptr  # "return slow_ptr" does the job as well
-            return None
-        finally:
-            self.MAX_ITER = max_iter_copy  # Reset MAX_ITER
+    @validate_args
+    def disable_checkpoints(self) -> None:
+        """Drop the checkpoints built by :meth:`enable_checkpoints`.
+
+        :rtype: None
+        """
+        self._checkpoints = None
+
+    @validate_args
+    def enable_checkpoints(self, stride: PositiveInt = 64, max_checkpoints: [PositiveInt, None] = None) -> None:
+        """Keep a reference to every stride-th node, so that reaching a node by index (e.g. :meth:`traverse`, \
+        :meth:`insert`, :meth:`pop`) walks at most stride nodes from the nearest checkpoint instead of from the head.
+
+        Checkpoints are built lazily while traversing. Inserting, popping and swapping update the positions of the \
+        checkpoints after the change in :code:`O(n / stride)`, without walking any node. Sorting, reversing and \
+        removing duplicates drop all checkpoints.
+
+        Time complexity: :code:`O(1)`, then :code:`O(stride)` per access once checkpoints are built.
+
+        Space complexity: :code:`O(n / stride)`.
+
+        :param stride: Number of nodes between two checkpoints, default to 64.
+        :type stride: int
+        :param max_checkpoints: Maximum number of checkpoints kept, default to None (no limit). When it is reached, \
+        every other checkpoint is dropped and stride is doubled.
+        :type max_checkpoints: int or None
+        :rtype: None
+        """
+        self._checkpoints = _Checkpoints(stride, max_checkpoints)
 
     @validate_args
     def extend(self, iterable: Iterable) -> None:
         """Create nodes with values from iterable and extend them to the end of linked list.
 
-        Time complexity: :code:`O(n)`, but it take :code:`O(n)` to traverse to the last node.
+        Time complexity: :code:`O(k)`, where k is the length of iterable.
 
         Space complexity: :code:`O(n)`.
 
@@ -304,20 +1235,39 @@ class _LinkedList(ABC):
         :type iterable: Iterable
         :rtype: None
         """
-        last_node = None if self.head is None else self.traverse(-1)
-        for item in iterable:
-            new_node = self._create_node(item)
-            if last_node is None:
-                self.head = new_node
-            else:
-                self._connect_nodes(last_node, new_node)
-            last_node = new_node
+        self._extend(iterable)
+
+    @validate_args
+    def extend_from(self, other: Any, move: bool = True) -> None:
+        """Extend linked list with the nodes of other. By default the nodes are moved rather than copied, other is \
+        left empty.
+
+        Time complexity: :code:`O(1)` if move, else :code:`O(k)`, where k is the length of other.
+
+        Space complexity: :code:`O(1)` if move, else :code:`O(k)`.
+
+        :param other: A linked list of the same type.
+        :type other: DoublyLinkedList / SinglyLinkedList
+        :param move: Move the nodes of other (True) or append copies of their values (False), default to True.
+        :type move: bool
+        :rtype: None
+        :raises TypeError: Raised when other is not a linked list of the same type.
+        :raises ValueError: Raised when moving the nodes of linked list itself.
+        """
+        if move:
+            self._splice(other, self._size)
+        else:
+            if not isinstance(other, self.__class__):
+                raise TypeError(f"cannot extend '{type(self).__name__}' with '{type(other).__name__}'")
+            # Values are read first, other may be self
+            self._extend([node.value for node in other])
 
     @validate_args
     def find_middle(self) -> NodeType:
         """Return node at the middle of linked list, i.e. node at index :math:`\\lfloor\\frac{n}{2}\\rfloor`.
 
-        Time complexity: :code:`O(n)`.
+        Time complexity: :code:`O(n)`, plus :code:`O(n)` once after :meth:`reverse` on a :class:`DoublyLinkedList`, \
+        which relinks its nodes before giving one away (see :meth:`~DoublyLinkedList.materialize`).
 
         Space complexity: :code:`O(1)`.
 
@@ -325,11 +1275,13 @@ class _LinkedList(ABC):
         :rtype: Node
         :raises IndexError: Raised when linked list is empty.
         """
-        if self.head is None:
+        if self._head is None:
             raise IndexError("{} is empty".format(type(self).__name__))
+        if self._reversed:
+            self._materialize()
 
-        slow = self.head
-        fast = self.head
+        slow = self._head
+        fast = self._head
         while fast.next_node is not None and fast.next_node.next_node is not None:
             slow = slow.next_node
             fast = fast.next_node.next_node
@@ -355,41 +1307,9 @@ class _LinkedList(ABC):
         :rtype: int
         :raises ValueError: Raised when the value is not present.
         """
+        return self._index(value, start, end)
 
-        def _index():
-            nonlocal start
-            if start < end:
-                try:
-                    node = self.traverse(start)
-                except IndexError:
-                    raise ValueError(f"{value} not in {type(self).__name__}")
-                while node is not None and start < end:
-                    if node == value:
-                        return start
-                    # noinspection PyUnresolvedReferences
-                    node = node.next_node
-                    start += 1
-                raise ValueError(f"{value} not in {type(self).__name__}")
-            else:
-                raise ValueError(f"{value} not in {type(self).__name__}")
-
-        if start >= 0 and end >= 0:
-            # noinspection PyTypeChecker
-            return _index()
-        else:
-            length = len(self)
-            if start < 0 and end < 0:
-                if -start > length:
-                    return self.index(value, end=end)
-                else:
-                    # noinspection PyTypeChecker
-                    return length + _index()  # Convert negative index to positive
-            elif start < 0:  # Negative start, positive end
-                return self.index(value, length + start, end)
-            else:  # Positive start, negative end
-                return self.index(value, start, length + end)
-
-    @abstractmethod
+    @validate_args
     def insert(self, index: int, value: Any) -> None:
         """Create a new node with value and insert it before index.
 
@@ -403,9 +1323,9 @@ class _LinkedList(ABC):
         :type value: Any
         :rtype: None
         """
-        pass
+        self._insert(index, value)
 
-    @abstractmethod
+    @validate_args
     def pop(self, index: int = -1) -> NodeType:
         """Remove and return node at index (default last). Raises :code:`IndexError` if list is empty or index is out \
         of range.
@@ -420,88 +1340,101 @@ class _LinkedList(ABC):
         :rtype: Node
         :raises IndexError: Raised when linked list is empty or index is out of range.
         """
-        pass
+        return self._pop(index)
 
     @validate_args
     def remove(self, value: Any) -> None:
         """Remove first occurrence of node with value.
 
+        Time complexity: :code:`O(n)`, the node is unlinked during the search.
+
+        Space complexity: :code:`O(1)`.
+
         :param value: Value to search for.
         :type value: Any
         :rtype: None
         :raises ValueError: Raised when the value is not present.
         """
-        for idx, item in enumerate(self):
-            if value == item:
-                self.pop(idx)
+        last_node = None
+        for idx, node in enumerate(self):
+            if node.value == value:
+                self._unlink(last_node, node, idx)
+                self._size -= 1
                 return
+            last_node = node
         raise ValueError("{} not in {}".format(value, type(self).__name__))
 
     @validate_args
-    def remove_duplicates(self) -> None:
-        """Remove node(s) with duplicated value(s) in linked list.
+    def remove_duplicates(self, key: Function = None) -> None:
+        """Remove node(s) with duplicated value(s) in linked list, the first occurrence of each value is kept.
 
-        Time complexity: :code:`O(n)`.
+        Values are looked up in a set. Unhashable values are compared by equality with the other unhashable values \
+        kept, which is :code:`O(n)` per lookup.
+
+        Time complexity: :code:`O(n)` for hashable values.
 
         Space complexity: :code:`O(n)`.
 
+        :param key: A function whose result decides whether two values are duplicated, default to None (compare \
+        values themselves).
+        :type key: Callable
         :rtype: None
-        :raises ExceededMaxIterations: Raised when MAX_ITER has been exceeded.
+        :raises ExceededMaxIterations: Raised when MAX_ITER has been exceeded or a cycle is found.
         """
+        self._invalidate(0)
+        seen = set()
+        unhashable = []
+        last_kept = None
+        removed = 0
+        # Unlinked once the walk has moved past it, which detaches it from the node after it
+        duplicate = None
+        try:
+            for index, node in enumerate(self):
+                if duplicate is not None:
+                    self._unlink(*duplicate)
+                    duplicate = None
+                value = node.value if key is None else key(node.value)
+                try:
+                    duplicated = value in seen
+                    if not duplicated:
+                        seen.add(value)
+                except TypeError:  # Unhashable
+                    duplicated = value in unhashable
+                    if not duplicated:
+                        unhashable.append(value)
+
+                if duplicated:
+                    # The first node is never a duplicate, last_kept is not None here
+                    duplicate = (last_kept, node, index - removed)
+                    removed += 1
+                else:
+                    last_kept = node
+        finally:
+            if duplicate is not None:
+                self._unlink(*duplicate)
+            self._size -= removed
 
-        def _remove_duplicates(current=None, previous=None, reference=None, iteration=0):
-            iteration += 1
-            if iteration > self.MAX_ITER:
-                raise ExceedMaxIter("Maximum number of iteration has been exceeded. Make sure there is no "
-                                            "cycle in the linked list by using detect_cycle() or increase MAX_ITER")
-            if current is None:
-                current = self.head
-            if reference is None:
-                reference = []
-
-            if current.value in reference:
-                temp = current.next_node
-                if temp is not None:
-                    inner_iteration = 0
-                    while temp.value in reference:
-                        inner_iteration += 1
-                        if inner_iteration > self.MAX_ITER:
-                            raise ExceedMaxIter(
-                                "Maximum number of iteration has been exceeded. Make sure there is no "
-                                "cycle in the linked list by using detect_cycle() or increase MAX_ITER")
-                        temp = temp.next_node
-                        if temp is None:
-                            break
-                previous.next_node = temp
-            else:
-                reference.append(current.value)
-
-            if current.next_node is None:
-                return
-            return _remove_duplicates(current.next_node, current, reference, iteration)
-
-        if self.head is not None:
-            return _remove_duplicates()
-
-    @abstractmethod
+    @validate_args
     def reverse(self) -> None:
-        """Reverse the linked list in place.
+        """Reverse the linked list in place. :class:`DoublyLinkedList` only flips a flag, its links are rewritten \
+        later by :meth:`~DoublyLinkedList.materialize`, see there.
 
-        Time complexity: :code:`O(n)`.
+        Time complexity: :code:`O(n)`, :code:`O(1)` for :class:`DoublyLinkedList`.
 
         Space complexity: :code:`O(1)`.
 
         :rtype: None
         """
-        pass
+        self._reverse()
 
     @validate_args
     def sort(self, key: Function = None, reverse: bool = False) -> None:
-        """ Perform insertion sort in place.
+        """Perform a stable natural merge sort in place, nodes are relinked rather than copied.
 
-        Time complexity: :code:`O(n^2)`.
+        Time complexity: :code:`O(n log n)`, :code:`O(n)` if linked list is already sorted.
 
-        Space complexity: :code:`O(1)`.
+        Space complexity: :code:`O(1)` without key, else :code:`O(n)`: the key of each node is computed once and \
+        kept until the end in a temporary (key, value) tuple.
 
         :param key: A function that serves as a key for the sort comparison, default to None.
         :type key: Callable
@@ -509,40 +1442,62 @@ class _LinkedList(ABC):
         :type reverse: bool
         :rtype: None
         """
-        if self.head is None or self.head.next_node is None:
+        if self._size < 2:
             return
 
-        if reverse:
-            cmp_func = gt
-        else:
-            cmp_func = lt
-        if key is None:
-            key = lambda x: x  # noqa
+        if self._reversed:
+            self._materialize()
+        self._invalidate(0)
+        get_key = self._key_nodes(key)
+        dummy_node = SinglyNode(None, self._head)
+        tail = None
+        try:
+            tail = _merge_sort(dummy_node, get_key, gt if reverse else lt)
+        finally:
+            self._head = dummy_node.next_node
+            if tail is None:  # A comparison failed, every node is still linked but in no particular order
+                self._recount()
+            else:
+                self._tail = tail
+            self._unkey_nodes(key)
 
-        dummy_node = self._create_node(-1)
-        dummy_node.next_node = self.head
+    @validate_args
+    def splice(self, other: Any, at: [int, None] = None) -> None:
+        """Move the nodes of other before index at, other is left empty. Nodes are relinked rather than copied, only \
+        the nodes at both ends of other are touched.
 
-        next_ = self.head.next_node
-        cur = self.head
-        while next_ is not None:
-            # No action needed, move forward
-            if not cmp_func(key(next_.value), key(cur.value)):
-                next_ = next_.next_node
-                cur = cur.next_node
-                continue
-            # Start from the beginning, find the correct place for insertion
-            correct_place = dummy_node
-            while not cmp_func(key(next_.value), key(correct_place.next_node.value)):
-                correct_place = correct_place.next_node
-            # Insert
-            self._connect_nodes(cur, next_.next_node)
-            self._connect_nodes(next_, correct_place.next_node)
-            self._connect_nodes(correct_place, next_)
-            # Move forward
-            next_ = cur.next_node
-        self.head = dummy_node.next_node
+        Time complexity: :code:`O(1)`, but it takes :code:`O(n)` to traverse to the node before index (except at the \
+        ends).
 
-    @abstractmethod
+        Space complexity: :code:`O(1)`.
+
+        :param other: A linked list of the same type.
+        :type other: DoublyLinkedList / SinglyLinkedList
+        :param at: Index to move the nodes before, clamped like :code:`list.insert()`, default to None (at the end).
+        :type at: int or None
+        :rtype: None
+        :raises TypeError: Raised when other is not a linked list of the same type.
+        :raises ValueError: Raised when other is linked list itself.
+        """
+        self._splice(other, self._size if at is None else at)
+
+    @validate_args
+    def split(self, at: int):
+        """Detach the nodes from index at to the end and return them as a new linked list, sharing the same pool. \
+        Nodes are relinked rather than copied.
+
+        Time complexity: :code:`O(1)`, but it takes :code:`O(n)` to traverse to the node before index.
+
+        Space complexity: :code:`O(1)`.
+
+        :param at: Index of the first node to detach, clamped like slicing (:code:`ll[at:]`).
+        :type at: int
+        :returns: A linked list of the same type holding the detached nodes.
+        :rtype: DoublyLinkedList / SinglyLinkedList
+        """
+        return self._split(at)
+
+    @validate_args
     def swap(self, index1: int, index2: int) -> None:
         """Swap two nodes at indices.
 
@@ -556,13 +1511,15 @@ class _LinkedList(ABC):
         :type index2: int
         :rtype: None
         """
-        pass
+        self._swap(index1, index2)
 
-    @abstractmethod
+    @validate_args
     def traverse(self, index: int) -> NodeType:
         """Loop through the linked list and get the node at index.
 
-        Time complexity: :code:`O(n)`, even for negative index.
+        Time complexity: :code:`O(n)`, even for negative index. :class:`DoublyLinkedList` walks from the nearer end, \
+        :code:`O(min(i, n - i))`, plus :code:`O(n)` once after :meth:`reverse`, as it relinks its nodes before giving \
+        one away (see :meth:`~DoublyLinkedList.materialize`).
 
         Space complexity: :code:`O(1)`.
 
@@ -571,72 +1528,117 @@ class _LinkedList(ABC):
         :returns: Node at index.
         :rtype: Node
         """
-        pass
+        if self._reversed:
+            # The node is given away, its links should lead the right way
+            self._materialize()
+        return self._traverse(index)
+
+    @validate_args
+    def values(self):
+        """Return an iterator over the values of the nodes, in order. The nodes are walked like iterating over linked \
+        list does, but only their values are given.
+
+        Time complexity: :code:`O(1)`, :code:`O(n)` to iterate.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: Iterator
+        :raises ExceededMaxIterations: Raised when MAX_ITER has been exceeded or a cycle is found.
+        """
+        size = self._size
+        if self.MAX_ITER is not None and self.MAX_ITER < size:
+            size = self.MAX_ITER
+        current = self._head
+        if self._reversed:
+            # Only values are given, no need to relink the nodes
+            for _ in range(size):
+                if current is None:
+                    return
+                yield current.value
+                current = current.last_node
+            if current is not None:
+                yield from map(_value_of, self._walk_unexpected(current, size, "last_node"))
+            return
+        for _ in range(size):
+            if current is None:
+                return
+            yield current.value
+            # noinspection PyUnresolvedReferences
+            current = current.next_node
+        if current is not None:
+            yield from map(_value_of, self._walk_unexpected(current, size))
 
 
 # noinspection PyMissingOrEmptyDocstring
 @inherit_docstrings
 class SinglyLinkedList(_LinkedList):
-    def _connect_nodes(self, node_a: NodeType, node_b: NodeType) -> None:
-        node_a.next_node = node_b
+    def _connect_nodes(self, node_a: [NodeType, None], node_b: [NodeType, None]) -> None:
+        if node_a is not None:
+            node_a.next_node = node_b
 
     def _create_node(self, value: Any) -> NodeType:
-        return Node(value, next_node=None)
+        if self.pool is None:
+            return SinglyNode(value)
+        return self.pool.acquire(value)
+
+    def _insert(self, index, value):
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:  # if index >= length, append it at the end, same behavior as list.insert
+            return self._append(value)
 
-    @validate_args
-    def insert(self, index: int, value: Any) -> None:
         new_node = self._create_node(value)
-        if index == 0 or len(self) == 0:
-            # noinspection PyTypeChecker
-            self._connect_nodes(new_node, self.head)
-            self.head = new_node
+        if index == 0:
+            self._connect_nodes(new_node, self._head)
+            self._head = new_node
         else:
-            try:
-                prev_node = self.traverse(index - 1)
-            except IndexError:
-                if index > 0:  # if index (positive) >= length, append it at the end, same behavior as list.insert
-                    return self.append(value)
-                else:
-                    return self.insert(0, value)
+            prev_node = self._traverse(index - 1)
             # noinspection PyTypeChecker
             self._connect_nodes(new_node, prev_node.next_node)
             self._connect_nodes(prev_node, new_node)
+        self._size += 1
+        if self._checkpoints is not None:
+            self._checkpoints.inserted(index)
 
-    @validate_args
-    def pop(self, index: int = -1) -> NodeType:
-        if self.head is None:
+    def _pop(self, index):
+        if self._head is None:
             raise IndexError("pop from empty {}".format(type(self).__name__))
+        if index < 0:
+            index += self._size
+            if index < 0:
+                raise IndexError(f"{type(self).__name__} index out of range")
 
         if index == 0:
-            self.head = self.head.next_node
-            return self.head
+            node = self._head
+            self._head = node.next_node
+            if self._head is None:
+                self._tail = None
         else:
-            try:
-                prev_node = self.traverse(index - 1)
-            except IndexError as e:
-                if self.traverse(index) is self.head:  # Check if node at index (negative) is a head node
-                    return self.pop(0)
-                else:
-                    raise e
-            if prev_node.next_node is None:
+            prev_node = self._traverse(index - 1)
+            node = prev_node.next_node
+            if node is None:
                 raise IndexError(f"{type(self).__name__} index out of range")
-            self._connect_nodes(prev_node, prev_node.next_node.next_node)
-            return prev_node.next_node
-
-    @validate_args
-    def reverse(self) -> None:
+            self._connect_nodes(prev_node, node.next_node)
+            if node is self._tail:
+                self._tail = prev_node
+        if self._checkpoints is not None:
+            self._checkpoints.removed(index, node.next_node)
+        self._connect_nodes(node, None)
+        self._size -= 1
+        return node
+
+    def _reverse(self):
+        self._invalidate(0)
         prev_nd = None
-        iteration = 0
-        while self.head is not None:
-            iteration += 1
-            if iteration > self.MAX_ITER:
-                raise ExceedMaxIter("Maximum number of iteration has been exceeded. Make sure there is no "
-                                            "cycle in the linked list by using detect_cycle() or increase MAX_ITER")
-            next_nd = self.head.next_node
-            self._connect_nodes(self.head, prev_nd)
-            prev_nd = self.head
-            self.head = next_nd
-        self.head = prev_nd
+        cur_nd = self._head
+        self._tail = cur_nd
+        # Bounded by the tracked length rather than checked for cycles
+        for _ in range(self._size):
+            next_nd = cur_nd.next_node
+            self._connect_nodes(cur_nd, prev_nd)
+            prev_nd = cur_nd
+            cur_nd = next_nd
+        self._head = prev_nd
 
         # Recursive solution
         # def _reverse(cur_nd, prev_nd=None):
@@ -647,50 +1649,59 @@ class SinglyLinkedList(_LinkedList):
         #     cur_nd.next_node = prev_nd
         #     return _reverse(next_nd, cur_nd)
         #
-        # self.head = _reverse(self.head)
+        # self._head = _reverse(self._head)
 
-    @validate_args
-    def swap(self, index1: int, index2: int) -> None:
+    def _swap(self, index1, index2):
         if index1 == index2:
             return
-        elif index1 == 0 or index2 == 0:
-            prev2 = self.traverse(index2 - 1 if index1 == 0 else index1 - 1)
-            node2 = prev2.next_node
-            if node2 is None:
-                raise IndexError(f"{type(self).__name__} index out of range")
-            self.head.next_node, node2.next_node = node2.next_node, self.head.next_node
-            self._connect_nodes(prev2, self.head)
-            self.head = node2
-        else:
-            prev1 = self.traverse(index1 - 1)
-            prev2 = self.traverse(index2 - 1)
-            node1 = prev1.next_node
-            node2 = prev2.next_node
-            prev1.next_node, prev2.next_node = node2, node1
-            node1.next_node, node2.next_node = node2.next_node, node1.next_node
+        index1 = self._traverse_index(index1)
+        index2 = self._traverse_index(index2)
+        if index1 == index2:
+            return
+        if index1 > index2:
+            index1, index2 = index2, index1
+
+        prev1 = None if index1 == 0 else self._traverse(index1 - 1)
+        node1 = self._head if prev1 is None else prev1.next_node
+        prev2 = self._traverse(index2 - 1)
+        node2 = prev2.next_node
+        if node2 is None:
+            raise IndexError(f"{type(self).__name__} index out of range")
 
-    @validate_args
-    def traverse(self, index: int) -> NodeType:
+        if prev2 is node1:  # Adjacent nodes
+            node1.next_node, node2.next_node = node2.next_node, node1
+        else:
+            node1.next_node, node2.next_node = node2.next_node, node1.next_node
+            prev2.next_node = node1
+        if prev1 is None:
+            self._head = node2
+        else:
+            prev1.next_node = node2
+        if node2 is self._tail:
+            self._tail = node1
+        if self._checkpoints is not None:
+            self._checkpoints.replaced(index1, node2)
+            self._checkpoints.replaced(index2, node1)
+
+    def _traverse(self, index):
+        index = self._traverse_index(index)
+        if index == self._size - 1:
+            return self._tail
+        if self._checkpoints is not None:
+            return self._checkpoints.find(self._head, index)
         for cur_idx, cur_item in enumerate(self):
-            if index < 0:
-                if cur_idx == abs(index) - 1:
-                    target = self.head
-                elif cur_idx > abs(index) - 1:
-                    # noinspection PyUnboundLocalVariable
-                    target = target.next_node
-            elif cur_idx == index:
-                target = cur_item
-                break
+            if cur_idx == index:
+                return cur_item
+        raise IndexError(f"{type(self).__name__} index out of range")
 
-        if "target" not in locals():  # Check "target" is defined
-            raise IndexError(f"{type(self).__name__} index out of range")
-        # noinspection PyUnboundLocalVariable
-        return target
 
 
 # noinspection PyMissingOrEmptyDocstring
 @inherit_docstrings
 class DoublyLinkedList(_LinkedList):
+    _node_type = DoublyNode
+    _cursor_type = DoublyCursor
+
     def _connect_nodes(self, node_a: [NodeType, None], node_b: [NodeType, None]) -> None:
         if node_a is not None:
             node_a.next_node = node_b
@@ -698,98 +1709,1967 @@ class DoublyLinkedList(_LinkedList):
             node_b.last_node = node_a
 
     def _create_node(self, value: Any) -> NodeType:
-        return Node(value, last_node=None, next_node=None)
-
-    @validate_args
-    def insert(self, index: int, value: Any) -> None:
-        try:
-            node_at_idx = self.traverse(index)
-        except IndexError:
-            if index > 0:
-                self.append(value)
-                return
+        if self.pool is None:
+            return DoublyNode(value)
+        return self.pool.acquire(value)
+
+    def _detach(self, node):
+        """Unlink node, found by reference rather than by position. Its position is unknown, so the checkpoints are \
+        dropped."""
+        last_node = node.last_node
+        next_node = node.next_node
+        if self._reversed:
+            # The links point the other way, see _materialize()
+            last_node, next_node = next_node, last_node
+        # Only the nodes at both ends can be told apart from a node of another linked list
+        if (last_node is None) != (node is self._head) or (next_node is None) != (node is self._tail):
+            raise ValueError(f"node is not in {type(self).__name__}")
+        self._invalidate(0)
+        self._connect_nodes(node.last_node, node.next_node)
+        if last_node is None:
+            self._head = next_node
+        if next_node is None:
+            self._tail = last_node
+        node.last_node = node.next_node = None
+        self._size -= 1
+
+    def _move_to_end(self, node, last):
+        if node is (self._tail if last else self._head):
+            return
+        self._detach(node)
+        if last:
+            if self._reversed:
+                self._connect_nodes(node, self._tail)
+            else:
+                self._connect_nodes(self._tail, node)
+            if self._head is None:
+                self._head = node
+            self._tail = node
+        else:
+            if self._reversed:
+                self._connect_nodes(self._head, node)
             else:
-                node_at_idx = self.head
+                self._connect_nodes(node, self._head)
+            if self._tail is None:
+                self._tail = node
+            self._head = node
+        self._size += 1
+
+    def _insert(self, index, value):
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:
+            return self._append(value)
+
+        node_at_idx = self._traverse(index)
         new_node = self._create_node(value)
-        if node_at_idx is self.head:
-            self.head = new_node
+        if self._reversed:
+            # The node before is linked through next_node
+            self._connect_nodes(new_node, node_at_idx.next_node)
+            self._connect_nodes(node_at_idx, new_node)
         else:
-            last_node = node_at_idx.last_node
             # noinspection PyTypeChecker
-            self._connect_nodes(last_node, new_node)
-        # noinspection PyTypeChecker
-        self._connect_nodes(new_node, node_at_idx)
+            self._connect_nodes(node_at_idx.last_node, new_node)
+            # noinspection PyTypeChecker
+            self._connect_nodes(new_node, node_at_idx)
+        if node_at_idx is self._head:
+            self._head = new_node
+        self._size += 1
+        if self._checkpoints is not None:
+            self._checkpoints.inserted(index)
+
+    def _pop(self, index):
+        node_at_idx = self._traverse(index)
+        last_node = node_at_idx.last_node
+        next_node = node_at_idx.next_node
+        self._connect_nodes(last_node, next_node)
+        if self._reversed:
+            last_node, next_node = next_node, last_node
+        if self._checkpoints is not None:
+            self._checkpoints.removed(self._traverse_index(index), next_node)
+        if last_node is None:
+            self._head = next_node
+        if next_node is None:
+            self._tail = last_node
+        # Detach the popped node
+        node_at_idx.last_node = node_at_idx.next_node = None
+        self._size -= 1
+        return node_at_idx
 
-    @validate_args
-    def pop(self, index: int = -1) -> NodeType:
-        node_at_idx = self.traverse(index)
-        if node_at_idx is self.head:
-            self.head = node_at_idx.next_node
+    def _materialize(self):
+        self._reversed = False
+        cur_node = self._head
+        # Bounded by the tracked length rather than checked for cycles
+        for _ in range(self._size):
+            cur_node.last_node, cur_node.next_node = cur_node.next_node, cur_node.last_node
+            cur_node = cur_node.next_node
+
+    def _reverse(self):
+        # The links are left as they are, the nodes are read the other way round until _materialize()
+        self._invalidate(0)
+        self._head, self._tail = self._tail, self._head
+        self._reversed = not self._reversed
+
+    def _swap(self, index1, index2):
+        if index1 == index2:
+            return
+        node1 = self._traverse(index1)
+        node2 = self._traverse(index2)
+        if node1 is node2:
+            return
+        if self._checkpoints is not None:
+            self._checkpoints.replaced(self._traverse_index(index1), node2)
+            self._checkpoints.replaced(self._traverse_index(index2), node1)
+        if node2.next_node is node1:
+            node1, node2 = node2, node1
+
+        last1, next1 = node1.last_node, node1.next_node
+        last2, next2 = node2.last_node, node2.next_node
+        if next1 is node2:  # Adjacent nodes
+            self._connect_nodes(last1, node2)
+            self._connect_nodes(node2, node1)
+            self._connect_nodes(node1, next2)
         else:
-            last_node = node_at_idx.last_node
-            self._connect_nodes(last_node, node_at_idx.next_node)
-        return node_at_idx
+            self._connect_nodes(last1, node2)
+            self._connect_nodes(node2, next1)
+            self._connect_nodes(last2, node1)
+            self._connect_nodes(node1, next2)
+
+        # The nodes are swapped along the links, which may point the other way, see _materialize()
+        first = last = None
+        if last1 is None:
+            first = node2
+        elif last2 is None:
+            first = node1
+        if next2 is None:
+            last = node1
+        elif next1 is None:
+            last = node2
+        if self._reversed:
+            first, last = last, first
+        if first is not None:
+            self._head = first
+        if last is not None:
+            self._tail = last
+
+    def _traverse(self, index):
+        index = self._traverse_index(index)
+        from_tail = self._size - 1 - index
+        if self._reversed:
+            # Walk from the nearer end against the links, checkpoints are not built meanwhile
+            if index <= from_tail:
+                node = self._head
+                for _ in range(index):
+                    node = node.last_node
+            else:
+                node = self._tail
+                for _ in range(from_tail):
+                    node = node.next_node
+            return node
+        if self._checkpoints is not None and from_tail >= self._checkpoints.stride:
+            return self._checkpoints.find(self._head, index)
+        # Walk from the nearer end
+        if index <= from_tail:
+            node = self._head
+            for _ in range(index):
+                node = node.next_node
+        else:
+            node = self._tail
+            for _ in range(from_tail):
+                node = node.last_node
+        return node
+
+    def __reversed__(self):
+        # Walk the back pointers, bounded by the length like __iter__. A lazily reversed list is walked along
+        # next_node instead, its links are left as they are
+        last_of = _next_node_of if self._reversed else _last_node_of
+        current = self._tail
+        for _ in range(self._size):
+            if current is None:
+                return
+            yield current
+            current = last_of(current)
+
+    def _unkey_nodes(self, key):
+        super()._unkey_nodes(key)
+        # Only next_node is relinked by sort(), rebuild the back pointers in one pass
+        last_node = None
+        for node in self:
+            node.last_node = last_node
+            last_node = node
 
     @validate_args
-    def reverse(self) -> None:
-        if self.head is not None:
-            cur_node = self.traverse(-1)
-            self.head = cur_node
+    def materialize(self) -> None:
+        """Rewrite the links of the nodes after :meth:`reverse`, which only flips the direction the nodes are read \
+        in. Values can be appended, inserted, popped, swapped, searched (:meth:`index`) and read without it, nodes \
+        can be moved or removed by reference (:meth:`move_to_end`, :meth:`remove_node`) and walked backwards \
+        (:code:`reversed()`, which leaves the links of the nodes as they are). Methods which give away nodes to be \
+        walked forwards (iterating, :attr:`head`, :meth:`traverse`, :meth:`cursor`, :meth:`find_middle`) or relink a \
+        whole run of them (e.g. :meth:`sort`, :meth:`splice`, :meth:`remove_if`) call it first. Call it beforehand to \
+        choose when the cost is paid.
+
+        Time complexity: :code:`O(n)` once after reversing an odd number of times, else :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
 
-            while cur_node is not None:
-                cur_node.last_node, cur_node.next_node = cur_node.next_node, cur_node.last_node
-                cur_node = cur_node.next_node
+        :rtype: None
+        """
+        if self._reversed:
+            self._materialize()
 
     @validate_args
-    def swap(self, index1: int, index2: int) -> None:
-        if index1 == index2:
-            return
-        elif index1 == 0 or index2 == 0:
-            node = self.traverse(index2 if index1 == 0 else index1)
-            prev = node.last_node
-
-            self.head.next_node, node.next_node = node.next_node, self.head.next_node
-            prev.next_node = self.head
-            if self.head.next_node is not None:
-                self.head.next_node.last_node = self.head
-            self.head.last_node = prev
-            node.next_node.last_node = node
-            node.last_node = None
-
-            self.head = node
-        else:
-            node1 = self.traverse(index1)
-            node2 = self.traverse(index2)
-            prev1 = node1.last_node
-            prev2 = node2.last_node
-
-            prev1.next_node, prev2.next_node = node2, node1
-            node1.next_node, node2.next_node = node2.next_node, node1.next_node
-            if node1.next_node is not None:
-                node1.next_node.last_node = node1
-            node1.last_node = prev2
-            node2.next_node.last_node = node2
-            node2.last_node = prev1
+    def move_to_end(self, node: NodeType, last: bool = True) -> None:
+        """Move node to the end of linked list (to the start if last is False) by relinking it, like \
+        :code:`collections.OrderedDict.move_to_end()`. References to the node stay valid, e.g. to keep an LRU order.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param node: A node of linked list, e.g. returned by :meth:`traverse`.
+        :type node: DoublyNode
+        :param last: Move to the end (True) or to the start (False), default to True.
+        :type last: bool
+        :rtype: None
+        :raises ValueError: Raised when node is not in linked list. This is only detected for a node which looks like \
+        it is at either end, any other node is assumed to be in linked list.
+        """
+        self._move_to_end(node, last)
 
     @validate_args
-    def traverse(self, index: int) -> NodeType:
-        if index >= 0:
-            for idx, node in enumerate(self):
-                if idx == index:
-                    return node
-                elif idx > index:
-                    break
-            raise IndexError("{} index out of range".format(type(self).__name__))
-        else:
-            end_node = None
-            for end_node in self:
-                pass
-            # Traversing backwards
-            idx = -1
-            while end_node is not None:
-                if idx == index:
-                    return end_node
-                # noinspection PyUnresolvedReferences
-                end_node = end_node.last_node
-                idx -= 1
-            raise IndexError("{} index out of range".format(type(self).__name__))
+    def remove_node(self, node: NodeType) -> None:
+        """Unlink node, given by reference rather than by value or index. Like :meth:`pop`, the node is detached and \
+        left to the caller, it is not given back to the pool.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param node: A node of linked list, e.g. returned by :meth:`traverse`.
+        :type node: DoublyNode
+        :rtype: None
+        :raises ValueError: Raised when node is not in linked list, see :meth:`move_to_end`.
+        """
+        self._detach(node)
+
+
+class _HeldLocks:
+    """Hold locks, taken in the given order and released the other way round."""
+    __slots__ = ("_locks",)
+
+    def __init__(self, locks):
+        self._locks = locks
+
+    def __enter__(self):
+        taken = []
+        try:
+            for lock in self._locks:
+                lock.acquire()
+                taken.append(lock)
+        except BaseException:
+            for lock in reversed(taken):
+                lock.release()
+            raise
+
+    def __exit__(self, *exc_info):
+        for lock in reversed(self._locks):
+            lock.release()
+
+
+def _synchronized(method):
+    """Run method of :class:`ConcurrentDoublyLinkedList` while holding both locks of linked list, i.e. while no other \
+    thread works on it."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._head_lock, self._tail_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _synchronized_with(method):
+    """Run method of :class:`ConcurrentDoublyLinkedList` while holding the locks of linked list and of its first \
+    argument."""
+    @wraps(method)
+    def wrapper(self, other, *args, **kwargs):
+        with _HeldLocks(self._locks_with(other)):
+            return method(self, other, *args, **kwargs)
+    return wrapper
+
+
+# noinspection PyMissingOrEmptyDocstring
+@inherit_docstrings
+class ConcurrentDoublyLinkedList(DoublyLinkedList):
+    """A :class:`DoublyLinkedList` which can be shared between threads.
+
+    Each end of linked list has its own reentrant lock. :meth:`append`, :meth:`extend` and :code:`pop()` only hold \
+    the tail lock, :meth:`append_left`, :meth:`pop_left` and :code:`pop(0)` only the head lock, so that producers at \
+    one end and consumers at the other end do not wait for each other. This holds while the ends are at least three \
+    nodes apart and no pool, checkpoints or pending :meth:`reverse` is involved, otherwise the two ends may share \
+    nodes and these methods hold both locks. Every other method holds both locks, i.e. works on linked list alone, so \
+    each call is atomic. A lock per node (hand-over-hand locking) is not used: Python code does not run in parallel, \
+    it would only add two lock operations per visited node.
+
+    Iterating, :meth:`values` and :code:`reversed()` walk a snapshot taken under the locks, so the locks are not held \
+    while the caller loops and other threads are free to change linked list meanwhile. Methods which involve two \
+    linked lists (e.g. :meth:`splice`, :code:`==`) hold the locks of both, always taken in the same order, so that two \
+    threads working on the same pair cannot wait for each other forever.
+
+    For compound operations, :meth:`pop_left_append` and :meth:`rotate` are atomic, and any sequence of calls is \
+    atomic inside :code:`with linked_list.locked():`.
+
+    .. warning:: Nodes given away (e.g. by :attr:`head`, :meth:`traverse` or a :meth:`cursor`) are not protected, \
+    relink them only inside :meth:`locked`. A :class:`NodePool` is not protected either, do not share one between \
+    linked lists used by different threads.
+    """
+    __slots__ = ("_head_lock", "_tail_lock", "_size_lock")
+
+    @validate_args
+    def __init__(self, iterable: Iterable = None, pool: [NodePool, None] = None) -> None:
+        from threading import Lock, RLock
+
+        # Not attributes users may assign, __setattr__ rejects them
+        object.__setattr__(self, "_head_lock", RLock())
+        object.__setattr__(self, "_tail_lock", RLock())
+        # Only held to count nodes in / out, the two ends may be relinked by two threads at once
+        object.__setattr__(self, "_size_lock", Lock())
+        super().__init__(pool=pool)
+        if iterable is not None:
+            self._extend(iterable)
+
+    __add__ = _synchronized_with(DoublyLinkedList.__add__)
+    __copy__ = _synchronized(DoublyLinkedList.__copy__)
+    __deepcopy__ = _synchronized(DoublyLinkedList.__deepcopy__)
+    __eq__ = _synchronized_with(DoublyLinkedList.__eq__)
+    __ge__ = _synchronized_with(DoublyLinkedList.__ge__)
+    __gt__ = _synchronized_with(DoublyLinkedList.__gt__)
+    __iadd__ = _synchronized_with(DoublyLinkedList.__iadd__)
+    __imul__ = _synchronized(DoublyLinkedList.__imul__)
+
+    def __iter__(self):
+        with self._head_lock, self._tail_lock:
+            return iter(list(super().__iter__()))
+
+    __le__ = _synchronized_with(DoublyLinkedList.__le__)
+    __lt__ = _synchronized_with(DoublyLinkedList.__lt__)
+    __mul__ = _synchronized(DoublyLinkedList.__mul__)
+
+    def __reversed__(self):
+        with self._head_lock, self._tail_lock:
+            return iter(list(super().__reversed__()))
+
+    @property
+    def head(self):
+        with self._head_lock, self._tail_lock:
+            return DoublyLinkedList.head.fget(self)
+
+    @head.setter
+    def head(self, value):
+        with self._head_lock, self._tail_lock:
+            DoublyLinkedList.head.fset(self, value)
+
+    # Either end is relinked holding its lock only if _apart() is true. Nodes are counted out before they are unlinked
+    # and counted in after they are linked, so that another thread never sees more nodes than there are.
+
+    def _apart(self):
+        """Return whether the end of linked list whose lock is held can be relinked while another thread relinks the \
+        other end."""
+        return self._size >= 3 and self.pool is None and self._checkpoints is None and not self._reversed
+
+    def _count_in(self, n):
+        with self._size_lock:
+            self._size += n
+
+    def _count_out(self):
+        """Count out the node at the end whose lock is held, return False (nothing is counted) if not _apart()."""
+        with self._size_lock:
+            if not self._apart():
+                return False
+            self._size -= 1
+            return True
+
+    def _link_first(self, node):
+        head = self._head
+        node.next_node = head
+        head.last_node = node
+        self._head = node
+
+    def _link_last(self, node):
+        tail = self._tail
+        tail.next_node = node
+        node.last_node = tail
+        self._tail = node
+
+    def _locks_with(self, other):
+        """Return the locks to hold to work on linked list and other, in the order every thread takes them: linked \
+        lists ordered by id, the head lock before the tail lock of each."""
+        if not isinstance(other, ConcurrentDoublyLinkedList) or other is self:
+            return self._head_lock, self._tail_lock
+        first, second = sorted((self, other), key=id)
+        return first._head_lock, first._tail_lock, second._head_lock, second._tail_lock
+
+    def _unlink_first(self):
+        node = self._head
+        next_node = node.next_node
+        next_node.last_node = None
+        self._head = next_node
+        node.next_node = None
+        return node
+
+    def _unlink_last(self):
+        node = self._tail
+        last_node = node.last_node
+        last_node.next_node = None
+        self._tail = last_node
+        node.last_node = None
+        return node
+
+    @validate_args
+    def append(self, value: Any) -> None:
+        with self._tail_lock:
+            if self._apart():
+                self._link_last(DoublyNode(value))
+                self._count_in(1)
+                return
+        with self._head_lock, self._tail_lock:
+            self._append(value)
+
+    @validate_args
+    def append_left(self, value: Any) -> None:
+        """Insert a new node at the start of linked list.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value of the new node.
+        :type value: Any
+        :rtype: None
+        """
+        with self._head_lock:
+            if self._apart():
+                self._link_first(DoublyNode(value))
+                self._count_in(1)
+                return
+        with self._head_lock, self._tail_lock:
+            self._insert(0, value)
+
+    clear = _synchronized(DoublyLinkedList.clear)
+    copy = _synchronized(DoublyLinkedList.copy)
+    cursor = _synchronized(DoublyLinkedList.cursor)
+    detect_cycle = _synchronized(DoublyLinkedList.detect_cycle)
+    disable_checkpoints = _synchronized(DoublyLinkedList.disable_checkpoints)
+    enable_checkpoints = _synchronized(DoublyLinkedList.enable_checkpoints)
+
+    @validate_args
+    def extend(self, iterable: Iterable) -> None:
+        # Read first, iterable may be a linked list shared with other threads
+        values = list(iterable)
+        with self._tail_lock:
+            if self._apart():
+                for value in values:
+                    self._link_last(DoublyNode(value))
+                self._count_in(len(values))
+                return
+        with self._head_lock, self._tail_lock:
+            self._extend(values)
+
+    extend_from = _synchronized_with(DoublyLinkedList.extend_from)
+    find_middle = _synchronized(DoublyLinkedList.find_middle)
+    index = _synchronized(DoublyLinkedList.index)
+    insert = _synchronized(DoublyLinkedList.insert)
+
+    def locked(self):
+        """Return a context manager which holds both locks of linked list, to make a sequence of calls atomic, e.g. \
+        :code:`with linked_list.locked(): ...`. The locks are reentrant, the calls inside take them again.
+
+        :rtype: ContextManager
+        """
+        return _HeldLocks((self._head_lock, self._tail_lock))
+
+    materialize = _synchronized(DoublyLinkedList.materialize)
+    move_to_end = _synchronized(DoublyLinkedList.move_to_end)
+
+    @validate_args
+    def pop(self, index: int = -1) -> NodeType:
+        if index == -1:
+            with self._tail_lock:
+                if self._count_out():
+                    return self._unlink_last()
+        elif index == 0:
+            with self._head_lock:
+                if self._count_out():
+                    return self._unlink_first()
+        with self._head_lock, self._tail_lock:
+            return self._pop(index)
+
+    @validate_args
+    def pop_left(self) -> NodeType:
+        """Remove and return the first node.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: DoublyNode
+        :raises IndexError: Raised when linked list is empty.
+        """
+        with self._head_lock:
+            if self._count_out():
+                return self._unlink_first()
+        with self._head_lock, self._tail_lock:
+            if self._head is None:
+                raise IndexError(f"pop from empty {type(self).__name__}")
+            return self._pop(0)
+
+    @validate_args
+    def pop_left_append(self, other: Any = None) -> Any:
+        """Remove the first node and append its value to other in one atomic step, e.g. to hand a task over from \
+        one queue to another. The value is never missing from both linked lists, nor in both at once. Only the head \
+        lock of linked list and the tail lock of other are held, unless either of them is short.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param other: A :class:`ConcurrentDoublyLinkedList`, default to None, i.e. linked list itself.
+        :type other: ConcurrentDoublyLinkedList or None
+        :returns: The moved value.
+        :rtype: Any
+        :raises TypeError: Raised when other is not a :class:`ConcurrentDoublyLinkedList`.
+        :raises IndexError: Raised when linked list is empty.
+        """
+        if other is None:
+            other = self
+        elif not isinstance(other, self.__class__):
+            raise TypeError(f"cannot append to '{type(other).__name__}' from '{type(self).__name__}'")
+        if other is not self:
+            # In the order of _locks_with()
+            ends = (self._head_lock, other._tail_lock) if id(self) < id(other) else (other._tail_lock, self._head_lock)
+            with _HeldLocks(ends):
+                if other._apart() and self._count_out():
+                    # The node itself is moved, neither linked list has a pool
+                    node = self._unlink_first()
+                    other._link_last(node)
+                    other._count_in(1)
+                    return node.value
+        with _HeldLocks(self._locks_with(other)):
+            if self._head is None:
+                raise IndexError(f"pop from empty {type(self).__name__}")
+            node = self._pop(0)
+            value = node.value
+            other._append(value)
+            if self.pool is not None:
+                self.pool.release(node)
+            return value
+
+    remove = _synchronized(DoublyLinkedList.remove)
+    remove_all = _synchronized(DoublyLinkedList.remove_all)
+    remove_duplicates = _synchronized(DoublyLinkedList.remove_duplicates)
+    remove_if = _synchronized(DoublyLinkedList.remove_if)
+    remove_node = _synchronized(DoublyLinkedList.remove_node)
+    retain_if = _synchronized(DoublyLinkedList.retain_if)
+    reverse = _synchronized(DoublyLinkedList.reverse)
+
+    @validate_args
+    def rotate(self, n: int = 1) -> None:
+        """Move the last n nodes to the start of linked list (the first -n nodes to the end if n is negative), like \
+        :code:`collections.deque.rotate()`. Nodes are relinked rather than copied.
+
+        Time complexity: :code:`O(min(k, n - k))`, where k is the number of nodes moved.
+
+        Space complexity: :code:`O(1)`.
+
+        :param n: Number of steps to the right, default to 1.
+        :type n: int
+        :rtype: None
+        """
+        with self._head_lock, self._tail_lock:
+            if self._size < 2:
+                return
+            n %= self._size
+            if n:
+                self._splice(self._split(self._size - n), 0)
+
+    sort = _synchronized(DoublyLinkedList.sort)
+    splice = _synchronized_with(DoublyLinkedList.splice)
+    split = _synchronized(DoublyLinkedList.split)
+    swap = _synchronized(DoublyLinkedList.swap)
+    traverse = _synchronized(DoublyLinkedList.traverse)
+
+    @validate_args
+    def values(self):
+        with self._head_lock, self._tail_lock:
+            return iter(list(super().values()))
+
+
+class _ValueLinkedList(_BaseLinkedList):
+    """A linked list which stores values directly rather than in node objects: iteration, :meth:`pop` and \
+    :meth:`traverse` give values. Its links are not exposed, so they cannot be relinked by hand and there is no \
+    :code:`head`, cursor, :code:`MAX_ITER`, checkpoints nor cycle detection.
+
+    .. note:: Support all methods from built-in :code:`list`, except indexing / slicing.
+    """
+    __slots__ = ()
+
+    def __add__(self, other):
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                "unsupported operand type(s) for +: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
+        new = self._copy()
+        new._extend(list(other))
+        return new
+
+    def __copy__(self):
+        return self._copy()
+
+    def __deepcopy__(self, memodict):
+        return self._copy(True, memodict)
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return len(self) == len(other) and all(map(eq, self, other))
+        return False
+
+    def __ge__(self, other):
+        return not self.__lt__(other)
+
+    def __gt__(self, other):
+        return (not self.__lt__(other)) and (not self.__eq__(other))
+
+    def __iadd__(self, other):
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                "unsupported operand type(s) for +=: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
+        # Values are read first, other may be self
+        self._extend(list(other))
+        return self
+
+    def __imul__(self, other):
+        if not isinstance(other, int):
+            raise TypeError(
+                "unsupported operand type(s) for *=: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
+        if other <= 0:
+            self.clear()
+        else:
+            values = list(self)
+            self._extend(chain.from_iterable(repeat(values, other - 1)))
+        return self
+
+    @abstractmethod
+    def __iter__(self):
+        pass
+
+    def __le__(self, other):
+        return self.__lt__(other) or self.__eq__(other)
+
+    def __len__(self):
+        return self._size
+
+    def __lt__(self, other):
+        if not isinstance(other, self.__class__):
+            raise TypeError("'<' not supported between instances of '{}' and '{}'".format(type(self).__name__,
+                                                                                          type(other).__name__))
+        return list(self) < list(other)
+
+    def __mul__(self, other):
+        if not isinstance(other, int):
+            raise TypeError(
+                "unsupported operand type(s) for *: '{}' and '{}'".format(type(self).__name__, type(other).__name__))
+        new = self._copy()
+        new *= other
+        return new
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __str__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    @abstractmethod
+    def _append(self, value):
+        pass
+
+    @abstractmethod
+    def _copy(self, deep=False, memodict=None):
+        pass
+
+    @abstractmethod
+    def _extend(self, iterable):
+        pass
+
+    def _index_of(self, index):
+        """Convert a negative index to a positive one and check it is in range."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    @validate_args
+    def append(self, value: Any) -> None:
+        """Append value to the end of linked list.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to append.
+        :type value: Any
+        :rtype: None
+        """
+        self._append(value)
+
+    @validate_args
+    def copy(self, deep: bool = False):
+        """Return a copy of linked list, built in one pass. :code:`copy.copy()` and :code:`copy.deepcopy()` call it as \
+        well.
+
+        Time complexity: :code:`O(n)`, plus the time to copy values if deep.
+
+        Space complexity: :code:`O(n)`.
+
+        :param deep: Copy values with :code:`copy.deepcopy()` rather than sharing them, default to False.
+        :type deep: bool
+        :rtype: CompactLinkedList / UnrolledLinkedList
+        """
+        return self._copy(deep)
+
+    @validate_args
+    def count(self, value: Any) -> int:
+        """Return number of occurrences of value.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to count for.
+        :type value: Any
+        :returns: Number of occurrences.
+        :rtype: int
+        """
+        return countOf(self, value)
+
+    @validate_args
+    def extend(self, iterable: Iterable) -> None:
+        """Extend linked list with the values from iterable.
+
+        Time complexity: :code:`O(k)`, where k is the length of iterable.
+
+        Space complexity: :code:`O(k)`.
+
+        :param iterable: An iterable of values to extend after the linked list.
+        :type iterable: Iterable
+        :rtype: None
+        """
+        self._extend(iterable)
+
+    @validate_args
+    def values(self):
+        """Return an iterator over the values, in order, same as :code:`iter()`.
+
+        Time complexity: :code:`O(1)`, :code:`O(n)` to iterate.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: Iterator
+        """
+        return iter(self)
+
+
+# noinspection PyMissingOrEmptyDocstring
+@inherit_docstrings
+class UnrolledLinkedList(_ValueLinkedList):
+    """A linked list whose nodes each hold a block of up to :attr:`block_size` values, stored in a built-in \
+    :code:`list`. Values of a block sit next to each other in memory, so iterating over them is nearly as fast as \
+    iterating over a :code:`list`, and the overhead of a node is shared by the values of its block.
+
+    A block is split in halves once it overflows, and it is merged with or refilled from a neighbouring block once it \
+    is less than half full, so that every block except a lone one is at least half full.
+
+    .. note:: Unlike :class:`SinglyLinkedList` and :class:`DoublyLinkedList`, values are not wrapped in nodes: \
+    iteration, :meth:`pop`, :meth:`traverse` and :meth:`find_middle` give values rather than nodes, and \
+    :meth:`splice`, :meth:`split` and :meth:`extend_from` move whole blocks. The node-level API is left out on \
+    purpose: there is no :code:`head`, :code:`cursor()`, :code:`detect_cycle()`, :code:`MAX_ITER`, node pool nor \
+    checkpoints, as the blocks are not exposed and :meth:`traverse` already skips a block at a time.
+    """
+    __slots__ = ("_head", "_tail", "_size", "_block_size")
+
+    @validate_args
+    def __init__(self, iterable: Iterable = None, block_size: PositiveInt = 64) -> None:
+        """Initialize a new unrolled linked list from an iterable.
+
+        :param iterable: An iterable to be converted into a linked list, default to None.
+        :type iterable: Iterable or None
+        :param block_size: Maximum number of values in a block, default to 64.
+        :type block_size: int
+        """
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._block_size = block_size
+
+        if iterable is not None:
+            self._extend(iterable)
+
+    def __contains__(self, item):
+        return any(item in values for values in self._blocks())
+
+    def __iter__(self):
+        # Only the blocks are walked in Python, their values are iterated over by chain
+        return chain.from_iterable(self._blocks())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({' -> '.join(map(repr, self._blocks()))})"
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, self._blocks(True)))
+
+    @property
+    def block_size(self):
+        """Maximum number of values in a block, cannot be changed after initializing.
+
+        :type: int
+        """
+        return self._block_size
+
+    def _append(self, value):
+        block = self._tail
+        if block is None or len(block.value) >= self._block_size:
+            block = self._insert_block(block, [])
+        block.value.append(value)
+        self._size += 1
+
+    def _blocks(self, backward=False):
+        """Yield the list of values of every block."""
+        if backward:
+            block = self._tail
+            while block is not None:
+                yield block.value
+                block = block.last_node
+        else:
+            block = self._head
+            while block is not None:
+                yield block.value
+                block = block.next_node
+
+    def _copy(self, deep=False, memodict=None):
+        new = self.__class__(block_size=self._block_size)
+        if deep:
+            if memodict is None:
+                memodict = {}
+            memodict[id(self)] = new
+        block = self._head
+        while block is not None:
+            # The blocks are copied as they are, no value is moved
+            if deep:
+                new._insert_block(new._tail, [deepcopy(value, memodict) for value in block.value])
+            else:
+                new._insert_block(new._tail, block.value[:])
+            block = block.next_node
+        new._size = self._size
+        return new
+
+    def _delete(self, block, offset):
+        """Remove and return the value at offset of block."""
+        values = block.value
+        value = values.pop(offset)
+        self._size -= 1
+        if len(values) * 2 < self._block_size:
+            self._rebalance(block)
+        return value
+
+    def _extend(self, iterable):
+        iterator = iter(iterable)
+        block_size = self._block_size
+        try:
+            while True:
+                block = self._tail
+                if block is None or len(block.value) >= block_size:
+                    block = self._insert_block(block, [])
+                values = block.value
+                filled = len(values)
+                try:
+                    # list.extend() keeps the values taken before iterable fails
+                    values.extend(islice(iterator, block_size - filled))
+                finally:
+                    self._size += len(values) - filled
+                if len(values) < block_size:  # iterable is exhausted
+                    return
+        finally:
+            if self._tail is not None and not self._tail.value:
+                self._unlink_block(self._tail)
+
+    def _find(self, index):
+        """Return the block holding the value at index, which should be in range, and the offset of the value in the \
+        block. The blocks are walked from the nearer end."""
+        if index * 2 < self._size:
+            block = self._head
+            while index >= len(block.value):
+                index -= len(block.value)
+                block = block.next_node
+            return block, index
+        from_tail = self._size - index
+        block = self._tail
+        while from_tail > len(block.value):
+            from_tail -= len(block.value)
+            block = block.last_node
+        return block, len(block.value) - from_tail
+
+    def _insert_block(self, after, values):
+        """Link a new block holding values after the block after, or in front of the head if after is None."""
+        next_block = self._head if after is None else after.next_node
+        block = DoublyNode(values, after, next_block)
+        if after is None:
+            self._head = block
+        else:
+            after.next_node = block
+        if next_block is None:
+            self._tail = block
+        else:
+            next_block.last_node = block
+        return block
+
+    def _rebalance(self, block):
+        """Merge a block which is less than half full with a neighbour, or move values from the neighbour if both do \
+        not fit in one block."""
+        if block.next_node is not None:
+            first, second = block, block.next_node
+        elif block.last_node is not None:
+            first, second = block.last_node, block
+        else:
+            if not block.value:
+                self._unlink_block(block)
+            return
+        self._balance(first, second)
+
+    def _balance(self, first, second):
+        """Merge two neighbouring blocks if they fit in one, otherwise share their values evenly. Return whether they \
+        have been merged."""
+        total = len(first.value) + len(second.value)
+        if total <= self._block_size:
+            first.value.extend(second.value)
+            self._unlink_block(second)
+            return True
+        moved = total // 2 - len(first.value)
+        if moved > 0:
+            first.value.extend(second.value[:moved])
+            del second.value[:moved]
+        elif moved < 0:
+            second.value[:0] = first.value[moved:]
+            del first.value[moved:]
+        return False
+
+    def _remove_where(self, condition):
+        removed = 0
+        try:
+            block = self._head
+            while block is not None:
+                values = block.value
+                # The block is left as it is if condition fails
+                kept = [value for value in values if not condition(value)]
+                if len(kept) != len(values):
+                    removed += len(values) - len(kept)
+                    self._size -= len(values) - len(kept)
+                    values[:] = kept
+                next_block = block.next_node
+                if not values:
+                    self._unlink_block(block)
+                block = next_block
+        finally:
+            if removed:
+                # Merge or even out the blocks which are less than half full
+                block = self._head
+                while block is not None and block.next_node is not None:
+                    second = block.next_node
+                    if len(block.value) * 2 < self._block_size or len(second.value) * 2 < self._block_size:
+                        if self._balance(block, second):
+                            continue  # block may take values from its new neighbour as well
+                    block = second
+        return removed
+
+    def _splice(self, other, at):
+        if not isinstance(other, self.__class__):
+            raise TypeError(f"cannot splice '{type(other).__name__}' into '{type(self).__name__}'")
+        if other is self:
+            raise ValueError(f"cannot splice a {type(self).__name__} into itself")
+        if other._head is None:
+            return
+        rest = self._split(at)
+        self._take_blocks(other)
+        self._take_blocks(rest)
+
+    def _split(self, at):
+        if at < 0:
+            at = max(at + self._size, 0)
+        at = min(at, self._size)
+        new = self.__class__(block_size=self._block_size)
+        if at == self._size:
+            return new
+
+        if at == 0:
+            new._head, new._tail, new._size = self._head, self._tail, self._size
+            self._head = self._tail = None
+            self._size = 0
+            return new
+        block, offset = self._find(at)
+        if offset:
+            # The block holding index at is cut in two, the blocks after it are moved as they are
+            block = self._insert_block(block, block.value[offset:])
+            del block.last_node.value[offset:]
+        last_block = block.last_node
+        last_block.next_node = None
+        block.last_node = None
+        new._head, new._tail, new._size = block, self._tail, self._size - at
+        self._tail = last_block
+        self._size = at
+        # Only the blocks at the cut may be less than half full
+        if len(last_block.value) * 2 < self._block_size:
+            self._rebalance(last_block)
+        if len(block.value) * 2 < new._block_size:
+            new._rebalance(block)
+        return new
+
+    def _take_blocks(self, other):
+        """Link the blocks of other after the tail, other is left empty. Values are copied instead if other has \
+        another block size."""
+        if other._head is None:
+            return
+        if other._block_size != self._block_size:
+            self._extend(list(other))
+        else:
+            last_block = self._tail
+            if last_block is None:
+                self._head = other._head
+            else:
+                last_block.next_node = other._head
+                other._head.last_node = last_block
+            self._tail = other._tail
+            self._size += other._size
+            if last_block is not None and (len(last_block.value) * 2 < self._block_size
+                                           or len(other._head.value) * 2 < self._block_size):
+                self._balance(last_block, other._head)
+        other._head = other._tail = None
+        other._size = 0
+
+    def _unlink_block(self, block):
+        last_block, next_block = block.last_node, block.next_node
+        if last_block is None:
+            self._head = next_block
+        else:
+            last_block.next_node = next_block
+        if next_block is None:
+            self._tail = last_block
+        else:
+            next_block.last_node = last_block
+
+    @validate_args
+    def clear(self) -> None:
+        """Remove all values from linked list.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: None
+        """
+        self._head = None
+        self._tail = None
+        self._size = 0
+
+    @validate_args
+    def count(self, value: Any) -> int:
+        """Return number of occurrences of value.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to count for.
+        :type value: Any
+        :returns: Number of occurrences.
+        :rtype: int
+        """
+        return sum(values.count(value) for values in self._blocks())
+
+    @validate_args
+    def extend_from(self, other: Any, move: bool = True) -> None:
+        """Extend linked list with the values of other. By default the blocks of other are moved rather than copied, \
+        other is left empty.
+
+        Time complexity: :code:`O(1)` if move, else :code:`O(k)`, where k is the length of other.
+
+        Space complexity: :code:`O(1)` if move, else :code:`O(k)`.
+
+        :param other: An unrolled linked list.
+        :type other: UnrolledLinkedList
+        :param move: Move the blocks of other (True) or append copies of its values (False), default to True.
+        :type move: bool
+        :rtype: None
+        :raises TypeError: Raised when other is not an unrolled linked list.
+        :raises ValueError: Raised when moving the blocks of linked list itself.
+        """
+        if move:
+            self._splice(other, self._size)
+        else:
+            if not isinstance(other, self.__class__):
+                raise TypeError(f"cannot extend '{type(self).__name__}' with '{type(other).__name__}'")
+            # Values are read first, other may be self
+            self._extend(list(other))
+
+    @validate_args
+    def find_middle(self) -> Any:
+        """Return value at the middle of linked list, i.e. value at index :math:`\\lfloor\\frac{n}{2}\\rfloor`.
+
+        Time complexity: :code:`O(n / block_size)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :returns: Value at the middle of linked list.
+        :rtype: Any
+        :raises IndexError: Raised when linked list is empty.
+        """
+        if self._head is None:
+            raise IndexError("{} is empty".format(type(self).__name__))
+        block, offset = self._find(self._size // 2)
+        return block.value[offset]
+
+    @validate_args
+    def index(self, value: Any, start: int = 0, end: int = sys.maxsize) -> NonNegativeInt:
+        """Return first index of value. The optional arguments start and end are used to limit the search to a \
+        particular subsequence of the linked list, as for :code:`list.index()`.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to search for.
+        :type value: Any
+        :param start: Start of subsequence (inclusive), default to 0.
+        :type start: int
+        :param end: End of subsequence (exclusive), default to :code:`sys.maxsize`.
+        :type end: int
+        :returns: Index of value relative to the beginning of the full sequence.
+        :rtype: int
+        :raises ValueError: Raised when the value is not present.
+        """
+        start, end, _ = slice(start, end).indices(self._size)
+        position = 0
+        block = self._head
+        while block is not None and position < end:
+            values = block.value
+            if position + len(values) > start:
+                try:
+                    return position + values.index(value, max(start - position, 0), end - position)
+                except ValueError:
+                    pass
+            position += len(values)
+            block = block.next_node
+        raise ValueError(f"{value} not in {type(self).__name__}")
+
+    @validate_args
+    def insert(self, index: int, value: Any) -> None:
+        """Insert value before index, the block holding index is split if it overflows.
+
+        Time complexity: :code:`O(n / block_size + block_size)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index to insert value.
+        :type index: int
+        :param value: Value to insert.
+        :type value: Any
+        :rtype: None
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:  # Same behavior as list.insert
+            return self._append(value)
+
+        block, offset = self._find(index)
+        values = block.value
+        values.insert(offset, value)
+        self._size += 1
+        if len(values) > self._block_size:
+            half = len(values) // 2
+            self._insert_block(block, values[half:])
+            del values[half:]
+
+    @validate_args
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return value at index (default last). Raises :code:`IndexError` if list is empty or index is \
+        out of range.
+
+        Time complexity: :code:`O(n / block_size + block_size)`, :code:`O(1)` for the last value.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index of value to pop, default to -1.
+        :type index: int
+        :returns: Value at index.
+        :rtype: Any
+        :raises IndexError: Raised when linked list is empty or index is out of range.
+        """
+        if self._head is None:
+            raise IndexError("pop from empty {}".format(type(self).__name__))
+        return self._delete(*self._find(self._index_of(index)))
+
+    @validate_args
+    def remove(self, value: Any) -> None:
+        """Remove first occurrence of value.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to search for.
+        :type value: Any
+        :rtype: None
+        :raises ValueError: Raised when the value is not present.
+        """
+        block = self._head
+        while block is not None:
+            if value in block.value:
+                self._delete(block, block.value.index(value))
+                return
+            block = block.next_node
+        raise ValueError("{} not in {}".format(value, type(self).__name__))
+
+    @validate_args
+    def remove_duplicates(self, key: Function = None) -> None:
+        """Remove duplicated value(s), the first occurrence of each value is kept. The blocks left less than half \
+        full are merged afterwards.
+
+        Values are looked up in a set. Unhashable values are compared by equality with the other unhashable values \
+        kept, which is :code:`O(n)` per lookup.
+
+        Time complexity: :code:`O(n)` for hashable values.
+
+        Space complexity: :code:`O(n)`.
+
+        :param key: A function whose result decides whether two values are duplicated, default to None (compare \
+        values themselves).
+        :type key: Callable
+        :rtype: None
+        """
+        seen = set()
+        unhashable = []
+
+        def duplicated(value):
+            if key is not None:
+                value = key(value)
+            try:
+                if value in seen:
+                    return True
+                seen.add(value)
+            except TypeError:  # Unhashable
+                if value in unhashable:
+                    return True
+                unhashable.append(value)
+            return False
+
+        self._remove_where(duplicated)
+
+    @validate_args
+    def reverse(self) -> None:
+        """Reverse the linked list in place, by reversing the order of blocks and the values in each block.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: None
+        """
+        block = self._head
+        self._head, self._tail = self._tail, self._head
+        while block is not None:
+            block.value.reverse()
+            block.last_node, block.next_node = block.next_node, block.last_node
+            block = block.last_node
+
+    @validate_args
+    def sort(self, key: Function = None, reverse: bool = False) -> None:
+        """Sort the values with :code:`list.sort()` (stable) and put them back into the blocks, which are kept as \
+        they are. Linked list is left unchanged if a comparison fails.
+
+        Time complexity: :code:`O(n log n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :param key: A function that serves as a key for the sort comparison, default to None.
+        :type key: Callable
+        :param reverse: The order of sorting, default to False i.e. ascending.
+        :type reverse: bool
+        :rtype: None
+        """
+        values = list(self)
+        values.sort(key=key, reverse=reverse)
+        position = 0
+        block = self._head
+        while block is not None:
+            block.value[:] = values[position:position + len(block.value)]
+            position += len(block.value)
+            block = block.next_node
+
+    @validate_args
+    def splice(self, other: Any, at: [int, None] = None) -> None:
+        """Move the values of other before index at, other is left empty. The blocks of other are relinked rather \
+        than copied, only the block holding index at is cut in two.
+
+        Time complexity: :code:`O(n / block_size + block_size)`.
+
+        Space complexity: :code:`O(block_size)`.
+
+        :param other: An unrolled linked list. Its values are copied rather than its blocks moved if its block size \
+        differs.
+        :type other: UnrolledLinkedList
+        :param at: Index to move the values before, clamped like :code:`list.insert()`, default to None (at the end).
+        :type at: int or None
+        :rtype: None
+        :raises TypeError: Raised when other is not an unrolled linked list.
+        :raises ValueError: Raised when other is linked list itself.
+        """
+        self._splice(other, self._size if at is None else at)
+
+    @validate_args
+    def split(self, at: int):
+        """Detach the values from index at to the end and return them as a new unrolled linked list with the same \
+        block size. The blocks after index at are relinked rather than copied.
+
+        Time complexity: :code:`O(n / block_size + block_size)`.
+
+        Space complexity: :code:`O(block_size)`.
+
+        :param at: Index of the first value to detach, clamped like slicing (:code:`ll[at:]`).
+        :type at: int
+        :returns: An unrolled linked list holding the detached values.
+        :rtype: UnrolledLinkedList
+        """
+        return self._split(at)
+
+    @validate_args
+    def swap(self, index1: int, index2: int) -> None:
+        """Swap two values at indices.
+
+        Time complexity: :code:`O(n / block_size)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index1: Index of value 1.
+        :type index1: int
+        :param index2: Index of value 2.
+        :type index2: int
+        :rtype: None
+        """
+        block1, offset1 = self._find(self._index_of(index1))
+        block2, offset2 = self._find(self._index_of(index2))
+        block1.value[offset1], block2.value[offset2] = block2.value[offset2], block1.value[offset1]
+
+    @validate_args
+    def traverse(self, index: int) -> Any:
+        """Walk the blocks from the nearer end and get the value at index.
+
+        Time complexity: :code:`O(n / block_size)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index of value.
+        :type index: int
+        :returns: Value at index.
+        :rtype: Any
+        :raises IndexError: Raised when index is out of range.
+        """
+        block, offset = self._find(self._index_of(index))
+        return block.value[offset]
+
+
+# noinspection PyMissingOrEmptyDocstring
+@inherit_docstrings
+class CompactLinkedList(_ValueLinkedList):
+    """A linked list stored in parallel columns instead of node objects: a :code:`list` of values, and \
+    :code:`array.array` columns holding the index (slot) of the next and, if doubly, of the previous value. A value \
+    takes 16 bytes (12 if singly) instead of a node object, and the garbage collector tracks a single list instead of \
+    every node.
+
+    Slots freed by :meth:`pop` and :meth:`remove` are kept in a free list and reused by the next insertions. \
+    :meth:`compact` renumbers the slots into traversal order and drops the free ones. While the slots are in order, \
+    which is also the case after building, copying or sorting, iteration runs over the values column directly and \
+    :meth:`traverse` takes :code:`O(1)`.
+
+    .. note:: Unlike :class:`SinglyLinkedList` and :class:`DoublyLinkedList`, values are not wrapped in nodes: \
+    iteration, :meth:`pop`, :meth:`traverse` and :meth:`find_middle` give values rather than nodes, and \
+    :meth:`splice`, :meth:`split` and :meth:`extend_from` copy values into the slots of the receiving linked list. \
+    The node-level API is left out on purpose: there is no :code:`head`, :code:`cursor()`, :code:`detect_cycle()`, \
+    :code:`MAX_ITER`, node pool nor checkpoints, as the slots are not exposed and a walk always stops after \
+    :code:`len()` steps. A linked list holds at most :code:`2 ** 31 - 1` slots.
+    """
+    __slots__ = ("_values", "_next", "_prev", "_free", "_head", "_tail", "_size", "_ordered")
+
+    @validate_args
+    def __init__(self, iterable: Iterable = None, doubly: bool = True) -> None:
+        """Initialize a new compact linked list from an iterable.
+
+        :param iterable: An iterable to be converted into a linked list, default to None.
+        :type iterable: Iterable or None
+        :param doubly: Keep the previous slot of every value, like :class:`DoublyLinkedList`, default to True. A \
+        singly linked one (False) is smaller but walks from the head only.
+        :type doubly: bool
+        """
+        self._rebuild([], doubly)
+        if iterable is not None:
+            self._extend(iterable)
+
+    def __iter__(self):
+        if self._ordered:
+            return islice(self._values, self._size)
+        return map(self._values.__getitem__, self._slots())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({' -> '.join(map(repr, self))})"
+
+    def __reversed__(self):
+        if self._ordered:
+            return islice(reversed(self._values), len(self._values) - self._size, None)
+        if self._prev is None:
+            return reversed(list(self))
+        return map(self._values.__getitem__, self._slots(True))
+
+    @property
+    def doubly(self):
+        """Whether the previous slot of every value is kept, cannot be changed after initializing.
+
+        :type: bool
+        """
+        return self._prev is not None
+
+    def _allocate(self, value):
+        """Store value in a free slot, or in a new one, and return the slot."""
+        if self._free:
+            slot = self._free.pop()
+            self._values[slot] = value
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+            self._next.append(-1)
+            if self._prev is not None:
+                self._prev.append(-1)
+        return slot
+
+    def _append(self, value):
+        slot = self._allocate(value)
+        if slot != self._size:
+            self._ordered = False
+        self._link(self._tail, slot)
+        self._link(slot, -1)
+        self._size += 1
+
+    def _copy(self, deep=False, memodict=None):
+        new = self.__class__(doubly=self._prev is not None)
+        if deep:
+            if memodict is None:
+                memodict = {}
+            memodict[id(self)] = new
+            new._rebuild([deepcopy(value, memodict) for value in self])
+        else:
+            new._rebuild(list(self))
+        return new
+
+    def _delete(self, last_slot, slot):
+        """Unlink slot, which follows last_slot (-1 for the head), free it and return its value."""
+        value = self._values[slot]
+        self._link(last_slot, self._next[slot])
+        self._size -= 1
+        if self._size == 0:
+            self._rebuild([])
+            return value
+        if slot != self._size:  # Only popping the last value keeps the slots in order
+            self._ordered = False
+        self._values[slot] = None
+        self._free.append(slot)
+        return value
+
+    def _extend(self, iterable):
+        iterator = iter(iterable)
+        # Reuse the free slots first, then the rest of the values are stored in a row
+        for value in islice(iterator, len(self._free)):
+            self._append(value)
+        values = self._values
+        first = len(values)
+        try:
+            # list.extend() keeps the values taken before iterable fails
+            values.extend(iterator)
+        finally:
+            added = len(values) - first
+            if added:
+                self._next.extend(range(first + 1, first + added + 1))
+                self._next[-1] = -1
+                if self._prev is not None:
+                    self._prev.extend(range(first - 1, first + added - 1))
+                if first != self._size:
+                    self._ordered = False
+                self._link(self._tail, first)
+                self._tail = first + added - 1
+                self._size += added
+
+    def _link(self, slot_a, slot_b):
+        """Link slot_a to slot_b, -1 stands for no slot, i.e. slot_b becomes the head or slot_a becomes the tail."""
+        if slot_a == -1:
+            self._head = slot_b
+        else:
+            self._next[slot_a] = slot_b
+        if slot_b == -1:
+            self._tail = slot_a
+        elif self._prev is not None:
+            self._prev[slot_b] = slot_a
+
+    def _rebuild(self, values, doubly=None):
+        """Replace the content by values, stored in slots 0 to n - 1 in order, without any free slot."""
+        from array import array
+
+        if doubly is None:
+            doubly = self._prev is not None
+        size = len(values)
+        self._values = values
+        # Indices are stored as C ints, 4 bytes each
+        self._next = array("i", range(1, size + 1))
+        if size:
+            self._next[-1] = -1
+        self._prev = array("i", range(-1, size - 1)) if doubly else None
+        self._free = array("i")
+        self._head = 0 if size else -1
+        self._tail = size - 1
+        self._size = size
+        self._ordered = True
+
+    def _remove_where(self, condition):
+        values = self._values
+        next_slots = self._next
+        removed = 0
+        last_slot = -1
+        slot = self._head
+        for _ in range(self._size):
+            next_slot = next_slots[slot]
+            if condition(values[slot]):
+                # Emptying the linked list replaces the columns, but then the walk is over anyway
+                self._delete(last_slot, slot)
+                removed += 1
+            else:
+                last_slot = slot
+            slot = next_slot
+        return removed
+
+    def _slot_at(self, index):
+        """Return the slot of the value at index, which should be in range."""
+        if self._ordered:
+            return index
+        if index == self._size - 1:
+            return self._tail
+        if self._prev is not None and index * 2 >= self._size:
+            # Walk from the nearer end
+            prev_slots = self._prev
+            slot = self._tail
+            for _ in range(self._size - 1 - index):
+                slot = prev_slots[slot]
+            return slot
+        next_slots = self._next
+        slot = self._head
+        for _ in range(index):
+            slot = next_slots[slot]
+        return slot
+
+    def _slots(self, backward=False):
+        """Yield the slots in traversal order, or in reverse order if backward."""
+        links = self._prev if backward else self._next
+        slot = self._tail if backward else self._head
+        for _ in range(self._size):
+            yield slot
+            slot = links[slot]
+
+    def _splice(self, other, at):
+        if not isinstance(other, self.__class__):
+            raise TypeError(f"cannot splice '{type(other).__name__}' into '{type(self).__name__}'")
+        if other is self:
+            raise ValueError(f"cannot splice a {type(self).__name__} into itself")
+        if not other._size:
+            return
+        if at < 0:
+            at = max(at + self._size, 0)
+        at = min(at, self._size)
+
+        values = list(other)
+        if at == self._size:
+            self._extend(values)
+        else:
+            last_slot = -1 if at == 0 else self._slot_at(at - 1)
+            next_slot = self._head if last_slot == -1 else self._next[last_slot]
+            for value in values:
+                slot = self._allocate(value)
+                self._link(last_slot, slot)
+                last_slot = slot
+            self._link(last_slot, next_slot)
+            self._size += len(values)
+            self._ordered = False
+        other._rebuild([])
+
+    def _split(self, at):
+        if at < 0:
+            at = max(at + self._size, 0)
+        at = min(at, self._size)
+        new = self.__class__(doubly=self._prev is not None)
+        if at == self._size:
+            return new
+
+        if at == 0:
+            new._rebuild(list(self))
+            self._rebuild([])
+            return new
+        last_slot = self._slot_at(at - 1)
+        slots = []
+        slot = self._next[last_slot]
+        while slot != -1:
+            slots.append(slot)
+            slot = self._next[slot]
+        new._rebuild([self._values[slot] for slot in slots])
+        if self._ordered:
+            # The values from index at sit at the end of the columns, after them there are only free slots
+            del self._values[at:], self._next[at:], self._free[:]
+            if self._prev is not None:
+                del self._prev[at:]
+        else:
+            for slot in slots:
+                self._values[slot] = None
+            self._free.extend(slots)
+        self._link(last_slot, -1)
+        self._size = at
+        return new
+
+    @validate_args
+    def clear(self) -> None:
+        """Remove all values from linked list and release the columns.
+
+        Time complexity: :code:`O(1)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: None
+        """
+        self._rebuild([])
+
+    @validate_args
+    def compact(self) -> None:
+        """Renumber the slots into traversal order and drop the free slots, so that iteration runs over the values \
+        column directly and :meth:`traverse` takes :code:`O(1)` until values are inserted or removed in the middle \
+        again.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :rtype: None
+        """
+        if not self._ordered or self._free:
+            self._rebuild(list(self))
+
+    @validate_args
+    def extend_from(self, other: Any, move: bool = True) -> None:
+        """Extend linked list with the values of other. By default other is left empty afterwards. The values are \
+        copied into the slots of linked list either way, as the columns cannot be shared.
+
+        Time complexity: :code:`O(k)`, where k is the length of other.
+
+        Space complexity: :code:`O(k)`.
+
+        :param other: A compact linked list.
+        :type other: CompactLinkedList
+        :param move: Empty other (True) or leave it as it is (False), default to True.
+        :type move: bool
+        :rtype: None
+        :raises TypeError: Raised when other is not a compact linked list.
+        :raises ValueError: Raised when moving the values of linked list itself.
+        """
+        if move:
+            self._splice(other, self._size)
+        else:
+            if not isinstance(other, self.__class__):
+                raise TypeError(f"cannot extend '{type(self).__name__}' with '{type(other).__name__}'")
+            # Values are read first, other may be self
+            self._extend(list(other))
+
+    @validate_args
+    def find_middle(self) -> Any:
+        """Return value at the middle of linked list, i.e. value at index :math:`\\lfloor\\frac{n}{2}\\rfloor`.
+
+        Time complexity: :code:`O(1)` while the slots are in order, else :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :returns: Value at the middle of linked list.
+        :rtype: Any
+        :raises IndexError: Raised when linked list is empty.
+        """
+        if not self._size:
+            raise IndexError("{} is empty".format(type(self).__name__))
+        return self._values[self._slot_at(self._size // 2)]
+
+    @validate_args
+    def index(self, value: Any, start: int = 0, end: int = sys.maxsize) -> NonNegativeInt:
+        """Return first index of value. The optional arguments start and end are used to limit the search to a \
+        particular subsequence of the linked list, as for :code:`list.index()`.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to search for.
+        :type value: Any
+        :param start: Start of subsequence (inclusive), default to 0.
+        :type start: int
+        :param end: End of subsequence (exclusive), default to :code:`sys.maxsize`.
+        :type end: int
+        :returns: Index of value relative to the beginning of the full sequence.
+        :rtype: int
+        :raises ValueError: Raised when the value is not present.
+        """
+        start, end, _ = slice(start, end).indices(self._size)
+        if start < end:
+            if self._ordered:
+                try:
+                    return self._values.index(value, start, end)
+                except ValueError:
+                    pass
+            else:
+                values = self._values
+                next_slots = self._next
+                slot = self._slot_at(start)
+                for index in range(start, end):
+                    if values[slot] is value or values[slot] == value:
+                        return index
+                    slot = next_slots[slot]
+        raise ValueError(f"{value} not in {type(self).__name__}")
+
+    @validate_args
+    def insert(self, index: int, value: Any) -> None:
+        """Insert value before index, in a free slot if there is one.
+
+        Time complexity: :code:`O(1)`, but it takes :code:`O(n)` to walk to index.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index to insert value.
+        :type index: int
+        :param value: Value to insert.
+        :type value: Any
+        :rtype: None
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:  # Same behavior as list.insert
+            return self._append(value)
+
+        last_slot = -1 if index == 0 else self._slot_at(index - 1)
+        next_slot = self._head if last_slot == -1 else self._next[last_slot]
+        slot = self._allocate(value)
+        self._link(last_slot, slot)
+        self._link(slot, next_slot)
+        self._size += 1
+        self._ordered = False
+
+    @validate_args
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return value at index (default last), its slot is freed. Raises :code:`IndexError` if list is \
+        empty or index is out of range.
+
+        Time complexity: :code:`O(1)`, but it takes :code:`O(n)` to walk to index. Popping the last value of a singly \
+        linked one takes :code:`O(n)` as well, unless the slots are in order.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index of value to pop, default to -1.
+        :type index: int
+        :returns: Value at index.
+        :rtype: Any
+        :raises IndexError: Raised when linked list is empty or index is out of range.
+        """
+        if self._size == 0:
+            raise IndexError("pop from empty {}".format(type(self).__name__))
+        index = self._index_of(index)
+        if self._prev is not None:
+            slot = self._slot_at(index)
+            return self._delete(self._prev[slot], slot)
+        last_slot = -1 if index == 0 else self._slot_at(index - 1)
+        return self._delete(last_slot, self._head if last_slot == -1 else self._next[last_slot])
+
+    @validate_args
+    def remove(self, value: Any) -> None:
+        """Remove first occurrence of value, its slot is freed.
+
+        Time complexity: :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :param value: Value to search for.
+        :type value: Any
+        :rtype: None
+        :raises ValueError: Raised when the value is not present.
+        """
+        values = self._values
+        last_slot = -1
+        for slot in self._slots():
+            if values[slot] is value or values[slot] == value:
+                self._delete(last_slot, slot)
+                return
+            last_slot = slot
+        raise ValueError("{} not in {}".format(value, type(self).__name__))
+
+    @validate_args
+    def remove_duplicates(self, key: Function = None) -> None:
+        """Remove duplicated value(s), the first occurrence of each value is kept and the slots of the others are \
+        freed.
+
+        Values are looked up in a set. Unhashable values are compared by equality with the other unhashable values \
+        kept, which is :code:`O(n)` per lookup.
+
+        Time complexity: :code:`O(n)` for hashable values.
+
+        Space complexity: :code:`O(n)`.
+
+        :param key: A function whose result decides whether two values are duplicated, default to None (compare \
+        values themselves).
+        :type key: Callable
+        :rtype: None
+        """
+        seen = set()
+        unhashable = []
+        values = self._values
+        last_slot = -1
+        # The slots are listed first, as removing them changes the links
+        for slot in list(self._slots()):
+            value = values[slot] if key is None else key(values[slot])
+            try:
+                duplicated = value in seen
+                if not duplicated:
+                    seen.add(value)
+            except TypeError:  # Unhashable
+                duplicated = value in unhashable
+                if not duplicated:
+                    unhashable.append(value)
+
+            if duplicated:
+                # The first value is never a duplicate, so the linked list is never emptied here
+                self._delete(last_slot, slot)
+            else:
+                last_slot = slot
+
+    @validate_args
+    def reverse(self) -> None:
+        """Reverse the linked list in place. A doubly linked one only swaps its next and previous columns.
+
+        Time complexity: :code:`O(1)` if doubly, else :code:`O(n)`.
+
+        Space complexity: :code:`O(1)`.
+
+        :rtype: None
+        """
+        if self._size < 2:
+            return
+        if self._prev is not None:
+            self._next, self._prev = self._prev, self._next
+        else:
+            next_slots = self._next
+            last_slot = -1
+            slot = self._head
+            for _ in range(self._size):
+                next_slots[slot], last_slot, slot = last_slot, slot, next_slots[slot]
+        self._head, self._tail = self._tail, self._head
+        self._ordered = False
+
+    @validate_args
+    def sort(self, key: Function = None, reverse: bool = False) -> None:
+        """Sort the values with :code:`list.sort()` (stable) and store them in order, which compacts the linked list \
+        as well. Linked list is left unchanged if a comparison fails.
+
+        Time complexity: :code:`O(n log n)`.
+
+        Space complexity: :code:`O(n)`.
+
+        :param key: A function that serves as a key for the sort comparison, default to None.
+        :type key: Callable
+        :param reverse: The order of sorting, default to False i.e. ascending.
+        :type reverse: bool
+        :rtype: None
+        """
+        values = list(self)
+        values.sort(key=key, reverse=reverse)
+        self._rebuild(values)
+
+    @validate_args
+    def splice(self, other: Any, at: [int, None] = None) -> None:
+        """Move the values of other before index at, other is left empty. The values are stored in free or new \
+        slots of linked list and linked in after the value before index at.
+
+        Time complexity: :code:`O(k)`, where k is the length of other, but it takes :code:`O(n)` to walk to index.
+
+        Space complexity: :code:`O(k)`.
+
+        :param other: A compact linked list.
+        :type other: CompactLinkedList
+        :param at: Index to move the values before, clamped like :code:`list.insert()`, default to None (at the end).
+        :type at: int or None
+        :rtype: None
+        :raises TypeError: Raised when other is not a compact linked list.
+        :raises ValueError: Raised when other is linked list itself.
+        """
+        self._splice(other, self._size if at is None else at)
+
+    @validate_args
+    def split(self, at: int):
+        """Detach the values from index at to the end and return them as a new compact linked list, in ordered slots. \
+        Their slots in linked list are dropped if they sit at the end of the columns, else freed.
+
+        Time complexity: :code:`O(n - at)`, but it takes :code:`O(n)` to walk to index.
+
+        Space complexity: :code:`O(n - at)`.
+
+        :param at: Index of the first value to detach, clamped like slicing (:code:`ll[at:]`).
+        :type at: int
+        :returns: A compact linked list holding the detached values, doubly if linked list is.
+        :rtype: CompactLinkedList
+        """
+        return self._split(at)
+
+    @validate_args
+    def swap(self, index1: int, index2: int) -> None:
+        """Swap two values at indices.
+
+        Time complexity: :code:`O(n)`, :code:`O(1)` if the slots are in order.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index1: Index of value 1.
+        :type index1: int
+        :param index2: Index of value 2.
+        :type index2: int
+        :rtype: None
+        """
+        slot1 = self._slot_at(self._index_of(index1))
+        slot2 = self._slot_at(self._index_of(index2))
+        values = self._values
+        values[slot1], values[slot2] = values[slot2], values[slot1]
+
+    @validate_args
+    def traverse(self, index: int) -> Any:
+        """Walk the slots and get the value at index, a doubly linked one walks from the nearer end.
+
+        Time complexity: :code:`O(n)`, :code:`O(1)` if the slots are in order.
+
+        Space complexity: :code:`O(1)`.
+
+        :param index: Index of value.
+        :type index: int
+        :returns: Value at index.
+        :rtype: Any
+        :raises IndexError: Raised when index is out of range.
+        """
+        return self._values[self._slot_at(self._index_of(index))]
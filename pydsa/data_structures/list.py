@@ -2,7 +2,7 @@
 import math
 
 from pydsa import Any, Iterable, NonNegativeInt, inherit_docstrings, validate_args
-from copy import deepcopy, copy
+from copy import deepcopy
 
 __all__ = ["ExceedMaxLengthError", "ConstantError", "StaticList", "DynamicList"]
 
@@ -57,10 +57,16 @@ class StaticList(list):
             raise ExceedMaxLengthError(f"exceed static list maximum length: {self.max_length}")
 
     def __add__(self, other):
-        new = deepcopy(self)
+        new = self._copy()
         new.__iadd__(other)
         return new
 
+    def __copy__(self):
+        return self._copy()
+
+    def __deepcopy__(self, memodict):
+        return self._copy(True, memodict)
+
     def __eq__(self, other):
         return isinstance(other, self.__class__) and super().__eq__(other)
 
@@ -89,10 +95,10 @@ class StaticList(list):
             self.clear()
             return self
 
-        content = self[:]
-        for _ in range(other - 1):
-            self.extend(content)
-        return self
+        # Check the length once, then let list repeat the items in one go
+        if len(self) * other > self.max_length:
+            raise ExceedMaxLengthError(f"exceed static list maximum length: {self.max_length}")
+        return super().__imul__(other)
 
     def __le__(self, other):
         return self.__eq__(other) or self.__lt__(other)
@@ -101,7 +107,7 @@ class StaticList(list):
         return isinstance(other, self.__class__) and super().__lt__(other)
 
     def __mul__(self, other):
-        new = deepcopy(self)
+        new = self._copy()
         new.__imul__(other)
         return new
 
@@ -134,15 +140,33 @@ class StaticList(list):
         else:
             raise ConstantError(f"{self.__class__.__name__}.max_length is a constant")
 
+    def _copy(self, deep=False, memodict=None):
+        new = self.__class__.__new__(self.__class__)
+        if deep:
+            if memodict is None:
+                memodict = {}
+            memodict[id(self)] = new
+            list.extend(new, [deepcopy(item, memodict) for item in self])
+        else:
+            list.extend(new, self)
+        new.max_length = self.max_length
+        return new
+
     @validate_args
-    def copy(self):
-        return copy(self)  # shallow copy
+    def copy(self, deep: bool = False):
+        """Return a copy of static list with the same maximum length.
+
+        :param deep: Copy items with :code:`copy.deepcopy()` rather than sharing them, default to False.
+        :type deep: bool
+        :rtype: StaticList
+        """
+        return self._copy(deep)
 
     @validate_args
     def extend(self, iterable: Iterable) -> None:
         for item in iterable:
             if len(self) + 1 > self.max_length:
-                raise ExceedMaxLengthError(f"exceed StaticList maximum length: {self.max_length}")
+                raise ExceedMaxLengthError(f"exceed static list maximum length: {self.max_length}")
             super().append(item)
 
 
@@ -174,19 +198,15 @@ class DynamicList(metaclass=_DynamicListMetaclass):
         self.__container = iterable if isinstance(iterable, StaticList) else StaticList(iterable)
 
     def __add__(self, other):
-        new = deepcopy(self)
+        new = self._copy()
         new.__iadd__(other)
         return new
 
     def __copy__(self):
-        new = self.__class__.__new__(self.__class__)
-        new.__container = self.__container
-        return new
+        return self._copy()
 
     def __deepcopy__(self, memodict):
-        new = self.__class__.__new__(self.__class__)
-        new.__container = self.__container.__class__(self.__container[:], self.max_length)
-        return new
+        return self._copy(True, memodict)
 
     def __delattr__(self, item):
         try:
@@ -262,7 +282,7 @@ class DynamicList(metaclass=_DynamicListMetaclass):
             return False
 
     def __mul__(self, other):
-        new = deepcopy(self)
+        new = self._copy()
         new.__imul__(other)
         return new
 
@@ -305,9 +325,27 @@ class DynamicList(metaclass=_DynamicListMetaclass):
             length = self.__len__()
         self.__container = StaticList(content, 0 if length == 0 else 2 ** math.ceil(math.log2(length)))
 
+    def _copy(self, deep=False, memodict=None):
+        new = self.__class__.__new__(self.__class__)
+        if deep:
+            if memodict is None:
+                memodict = {}
+            memodict[id(self)] = new
+            new.__container = self.__container._copy(True, memodict)
+        else:
+            # A container of its own, only the items are shared
+            new.__container = self.__container._copy()
+        return new
+
     @validate_args
-    def copy(self):
-        return copy(self)
+    def copy(self, deep: bool = False):
+        """Return a copy of dynamic list.
+
+        :param deep: Copy items with :code:`copy.deepcopy()` rather than sharing them, default to False.
+        :type deep: bool
+        :rtype: DynamicList
+        """
+        return self._copy(deep)
 
     @validate_args
     def clear(self) -> None:
@@ -0,0 +1,157 @@
+import random
+from collections import OrderedDict
+
+from pytest import mark
+
+from pydsa.data_structures.cache import *
+from tests import is_error
+
+ds = [LRUCache, LFUCache]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@mark.parametrize("item", ds)
+def test_init(item):
+    cache = item()
+    assert cache.capacity == 128 and cache.size == 0 and len(cache) == 0 and cache.ttl is None
+    assert repr(cache) == f"{item.__name__}(size=0, capacity=128)"
+    is_error(ValueError, item, 0)
+    is_error(TypeError, item, 1.5)
+    is_error(ValueError, item, ttl=0)
+    is_error(TypeError, item, ttl="1")
+
+
+@mark.parametrize("item", ds)
+def test_mapping(item):
+    cache = item(3)
+    cache["a"] = 1
+    cache.put("b", 2)
+    assert cache["a"] == 1 and cache.get("b") == 2 and cache.get("c") is None and cache.get("c", 0) == 0
+    is_error(KeyError, lambda: cache["c"])
+    assert "a" in cache and "c" not in cache and len(cache) == 2 and sorted(cache) == ["a", "b"]
+    cache["a"] = 10
+    assert cache["a"] == 10 and len(cache) == 2 and cache.size == 2
+    del cache["a"]
+    is_error(KeyError, cache.__delitem__, "a")
+    assert cache.pop("b") == 2 and cache.pop("b", None) is None and len(cache) == 0
+    is_error(KeyError, cache.pop, "b")
+    assert cache.stats() == {"hits": 3, "misses": 3, "evictions": 0, "expirations": 0, "hit_rate": 0.5,
+                             "length": 0, "size": 0}
+    cache["c"] = 3
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0 and cache.hits == 0 and cache.misses == 0 and "c" not in cache
+    cache["c"] = 3
+    assert cache["c"] == 3
+
+
+def test_lru():
+    cache = LRUCache(3)
+    for key in "abc":
+        cache[key] = key.upper()
+    assert cache["a"] == "A"
+    cache["d"] = "D"
+    assert list(cache) == ["c", "a", "d"] and "b" not in cache and cache.evictions == 1
+    cache["c"] = "C2"  # Setting counts as a use
+    cache["e"] = "E"
+    assert list(cache) == ["d", "c", "e"] and cache.evictions == 2
+
+    # Against an OrderedDict used as an LRU cache
+    random.seed(0)
+    cache = LRUCache(50)
+    reference = OrderedDict()
+    for _ in range(5000):
+        key = random.randrange(100)
+        if random.random() < 0.5:
+            value = cache.get(key, -1)
+            assert value == reference.get(key, -1)
+            if key in reference:
+                reference.move_to_end(key)
+        else:
+            cache[key] = key * 2
+            reference[key] = key * 2
+            reference.move_to_end(key)
+            if len(reference) > 50:
+                reference.popitem(last=False)
+        assert list(cache) == list(reference)
+
+
+def test_lfu():
+    cache = LFUCache(3)
+    for key in "abc":
+        cache[key] = key.upper()
+    assert cache["a"] == "A" and cache["a"] == "A" and cache["b"] == "B"
+    cache["d"] = "D"  # c has been used the least
+    assert "c" not in cache and list(cache) == ["d", "b", "a"]
+    cache["e"] = "E"  # d has been used once, b twice
+    assert "d" not in cache and list(cache) == ["e", "b", "a"]
+    assert cache["e"] == "E"
+    cache["f"] = "F"  # e and b have been used twice, b less recently
+    assert "b" not in cache and list(cache) == ["f", "e", "a"] and cache.evictions == 3
+
+    # Against a brute force LFU cache
+    random.seed(1)
+    cache = LFUCache(20)
+    uses, last_used = {}, {}
+    for step in range(5000):
+        key = int(random.paretovariate(1)) % 60
+        if random.random() < 0.6:
+            value = cache.get(key, -1)
+            assert value == (key * 3 if key in uses else -1)
+            if key in uses:
+                uses[key] += 1
+                last_used[key] = step
+        else:
+            if key not in uses and len(uses) == 20:
+                victim = min(uses, key=lambda k: (uses[k], last_used[k]))
+                del uses[victim], last_used[victim]
+            uses[key] = uses.get(key, 0) + 1
+            last_used[key] = step
+            cache[key] = key * 3
+        assert sorted(cache) == sorted(uses)
+    assert list(cache) == sorted(uses, key=lambda k: (uses[k], last_used[k]))
+
+
+@mark.parametrize("item", ds)
+def test_size_of(item):
+    cache = item(10, size_of=len)
+    cache["a"] = "aaaa"
+    cache["b"] = "bbbb"
+    assert cache.size == 8 and len(cache) == 2
+    cache["c"] = "ccc"
+    assert cache.size == 7 and "a" not in cache and cache.evictions == 1
+    cache["b"] = "bbbbbbb"  # Grown, still fits
+    assert cache.size == 10 and len(cache) == 2 and cache.evictions == 1
+    cache["b"] = "bbbbbbbb"  # Only c is evicted, not b itself
+    assert cache.size == 8 and list(cache) == ["b"] and cache.evictions == 2
+    is_error(ValueError, cache.put, "d", "d" * 11)
+    assert list(cache) == ["b"]
+    cache["e"] = ""
+    assert cache.size == 8 and len(cache) == 2
+
+
+@mark.parametrize("item", ds)
+def test_ttl(item):
+    clock = _Clock()
+    cache = item(10, ttl=5, timer=clock)
+    cache["a"] = 1
+    clock.now = 3
+    cache["b"] = 2
+    assert cache["a"] == 1 and "a" in cache
+    clock.now = 5
+    assert "a" not in cache and cache.get("a") is None and cache.expirations == 1 and len(cache) == 1
+    assert cache["b"] == 2
+    cache["b"] = 3  # Setting again restarts the time to live
+    clock.now = 9
+    cache["c"] = 4
+    assert cache.pop("b") == 3
+    clock.now = 14
+    assert cache.expire() == 1 and len(cache) == 0 and cache.size == 0 and cache.expirations == 2
+    assert cache.stats()["misses"] == 1
+    assert item(1).expire() == 0
@@ -1,6 +1,8 @@
 import random
+from array import array
+from copy import copy, deepcopy
 
-from pydsa.data_structures import Node
+from pydsa.data_structures import DoublyNode, Node, SinglyNode, set_debug
 from pydsa.data_structures.linked_list import *
 from tests import is_error
 
@@ -68,6 +70,15 @@ def test_op():
         a *= 2
         assert a == ds([2, 4, "a", 2, 4, "a"])
 
+        # Values are shared, the nodes are new
+        a = ds([[1], 2])
+        b = a * 3
+        assert len(b) == 6 and b.traverse(4).value is a.head.value
+        assert len({id(node) for node in b}) == 6 and b.traverse(-1) == 2
+        a *= 10 ** 4
+        assert len(a) == 2 * 10 ** 4 and a.traverse(-1) == 2 and a.traverse(-1).next_node is None
+        assert list(a) == [[1], 2] * 10 ** 4
+
 
 def test_in():
     for ds in to_test:
@@ -144,11 +155,16 @@ def test_reversed():
     for ds in to_test:
         a = [1, "Test", set(), [], {1: "10"}, 3.2]
         ll = ds(a)
-        assert reversed(ll) == ds(reversed(a))
-        assert reversed(reversed(ll)) == ds(a)  # noqa
+        assert list(reversed(ll)) == list(reversed(a))
+        assert [node.value for node in reversed(ll)] == a[::-1]
+        assert ll == ds(a)  # Not modified
 
         b = ds([])
-        assert reversed(b) == ds([])
+        assert list(reversed(b)) == []
+
+        c = ds(range(10 ** 4))
+        for expected, node in enumerate(reversed(c), start=-(10 ** 4 - 1)):
+            assert node == -expected
 
 
 def test_set():
@@ -221,6 +237,21 @@ def test_copy():
         assert c == d == ds()
         assert c.head is None and d.head is None
 
+        e = ds([[1], [2]])
+        f = e.copy()
+        assert f.head.value is e.head.value
+        g = e.copy(deep=True)
+        assert g == e and g.head.value is not e.head.value
+        assert copy(e) == e and copy(e).head is not e.head
+        h = deepcopy(e)
+        assert h == e and h.head.value is not e.head.value and h._tail.value is not e._tail.value
+        assert len(h) == 2 and h._tail.next_node is None
+
+        # Long lists are copied without recursion
+        long = ds(range(10 ** 5))
+        assert list(deepcopy(long)) == list(long)
+        assert len(copy(long)) == 10 ** 5 and long.copy()._tail == 10 ** 5 - 1
+
 
 def test_count():
     for ds in to_test:
@@ -233,6 +264,95 @@ def test_count():
         assert sll1.count(10) == 0
 
 
+def test_cursor():
+    for ds in to_test:
+        ll = ds([1, 2, 3])
+        cur = ll.cursor()
+        assert cur.index == 0 and cur.value == 1 and not cur.at_end
+        cur.insert_before(0)
+        assert cur.index == 1 and cur.value == 1 and ll.head == 0
+        cur.insert_after(1.5)
+        cur.next()
+        assert cur.value == 1.5
+        assert cur.remove_here() == 1.5 and cur.value == 2 and cur.index == 2
+        cur.value = 20
+        cur.next()
+        cur.next()
+        assert cur.at_end and cur.index == len(ll) and repr(cur) == f"{cur.__class__.__name__}(<end>, index=4)"
+        is_error(IndexError, lambda: cur.value)
+        is_error(IndexError, cur.next)
+        is_error(IndexError, cur.insert_after, 5)
+        is_error(IndexError, cur.remove_here)
+        cur.insert_before(4)
+        assert ll._tail == 4 and cur.at_end
+        _check([0, 1, 20, 3, 4], ll, ds)
+        assert len(ll) == 5
+
+        cur = ll.cursor(-1)
+        assert cur.index == 4 and cur.remove_here() == 4 and cur.at_end
+        assert ll._tail == 3 and len(ll) == 4
+        is_error(IndexError, ll.cursor, 5)
+        is_error(IndexError, ll.cursor, -5)
+        assert ll.cursor(4).at_end and ll.cursor(-4).value == 0
+
+        # Emptying and refilling the linked list
+        cur = ll.cursor()
+        while not cur.at_end:
+            cur.remove_here()
+        assert len(ll) == 0 and ll.head is None and ll._tail is None
+        for value in range(3):
+            cur.insert_before(value)
+        _check([0, 1, 2], ll, ds)
+        assert ll._tail == 2
+
+    ll = DoublyLinkedList([1, 2, 3])
+    cur = ll.cursor(len(ll))
+    cur.prev()
+    assert cur.value == 3 and cur.index == 2
+    cur.prev()
+    cur.remove_here()
+    cur.prev()
+    assert cur.value == 1
+    is_error(IndexError, cur.prev)
+    cur.insert_before(0)
+    cur.prev()
+    assert cur.value == 0 and ll.head is cur.node
+    _check([0, 1, 3], ll, DoublyLinkedList)
+    assert not hasattr(SinglyLinkedList().cursor(), "prev")
+
+    random.seed(1)
+    for ds in to_test:
+        # Nodes go to / come from the pool, checkpoints are kept up to date
+        pool = NodePool()
+        ll = ds(range(200), pool=pool)
+        ll.enable_checkpoints(8)
+        ref = list(range(200))
+        assert ll.traverse(150) == 150
+        cur = ll.cursor(3)
+        for _ in range(300):
+            op = random.randrange(5)
+            if op == 0 and not cur.at_end:
+                cur.next()
+            elif op == 1 and not cur.at_end:
+                ref.pop(cur.index)
+                cur.remove_here()
+            elif op == 2:
+                ref.insert(cur.index, -1)
+                cur.insert_before(-1)
+            elif op == 3 and not cur.at_end:
+                ref.insert(cur.index + 1, -2)
+                cur.insert_after(-2)
+            elif op == 4 and ds == DoublyLinkedList and cur.index > 0:
+                cur.prev()
+            assert len(ll) == len(ref)
+            if not cur.at_end:
+                assert cur.value == ref[cur.index]
+        _check(ref, ll, ds)
+        for idx in range(0, len(ref), 7):
+            assert ll.traverse(idx) == ref[idx]
+        assert ll._tail is ll.traverse(-1) and pool.hits > 0
+
+
 def test_extend():
     for ds in to_test:
         a = ds([1, 2, 3])
@@ -248,6 +368,25 @@ def test_extend():
         assert b == ds(["a", "b", "c"])
 
 
+def test_extend_from():
+    for ds in to_test:
+        a = ds([1, 2])
+        b = ds([3, 4])
+        nodes = list(b)
+        a.extend_from(b)
+        assert list(a) == [1, 2, 3, 4] and list(a)[2:] == nodes
+        assert len(a) == 4 and a.traverse(-1) is nodes[-1]
+        assert len(b) == 0 and b.head is None and list(b) == []
+
+        c = ds([5])
+        a.extend_from(c, move=False)
+        assert a == ds([1, 2, 3, 4, 5]) and c == ds([5]) and a.traverse(-1) is not c.head
+        a.extend_from(a, move=False)
+        assert a == ds([1, 2, 3, 4, 5] * 2)
+        is_error(ValueError, lambda: a.extend_from(a))
+        is_error(TypeError, lambda: a.extend_from([1]))
+
+
 def test_find_middle():
     for ds in to_test:
         a = ds([1, 2, 3, 4, 5])
@@ -270,9 +409,65 @@ def test_detect_cycle():
         assert a.detect_cycle() is None
 
         b = ds(range(100))
-        b.MAX_ITER = 110
         b.traverse(-1).next_node = b.head
         assert b.detect_cycle() is b.head
+        is_error(ExceedMaxIter, lambda: list(b))
+        is_error(ExceedMaxIter, lambda: setattr(b, "head", b.head))
+
+
+def test_max_iter():
+    for ds in to_test:
+        a = ds(range(10 ** 4))
+        assert a.MAX_ITER is None
+        assert sum(1 for _ in a) == 10 ** 4
+
+        a.MAX_ITER = 100
+        is_error(ExceedMaxIter, lambda: list(a))
+        a.MAX_ITER = None
+
+        # Nodes linked by hand past the tracked length are still visited
+        a.traverse(-1).next_node = ds._node_type(-1)
+        assert a.traverse(-1).next_node == -1
+        assert list(a)[-1] == -1
+        a.head = a.head
+        assert len(a) == 10 ** 4 + 1
+
+
+def test_move_to_end():
+    for ds in (DoublyLinkedList, ConcurrentDoublyLinkedList):
+        ll = ds(range(5))
+        nodes = list(ll)
+        ll.move_to_end(nodes[2])
+        ll.move_to_end(nodes[4], last=False)
+        ll.move_to_end(nodes[2])
+        ll.move_to_end(nodes[4], last=False)
+        _check([4, 0, 1, 3, 2], ll, DoublyLinkedList)
+        assert list(ll) == [nodes[4], nodes[0], nodes[1], nodes[3], nodes[2]] and ll._tail is nodes[2]
+        ll.remove_node(nodes[4])
+        ll.remove_node(nodes[1])
+        ll.remove_node(nodes[2])
+        assert nodes[1].last_node is None and nodes[1].next_node is None
+        _check([0, 3], ll, DoublyLinkedList)
+        assert len(ll) == 2 and ll._tail is nodes[3]
+        is_error(ValueError, ll.remove_node, nodes[1])
+        is_error(ValueError, ll.move_to_end, DoublyNode(0))
+        ll.move_to_end(nodes[0])
+        ll.remove_node(nodes[0])
+        ll.remove_node(nodes[3])
+        assert len(ll) == 0 and ll.head is None and ll._tail is None
+        is_error(ValueError, ll.remove_node, nodes[3])
+
+        # The links are rewritten first if the linked list has been reversed lazily, checkpoints are dropped
+        ll = ds(range(100))
+        ll.enable_checkpoints(4)
+        assert ll.traverse(50) == 50
+        node = ll.traverse(10)
+        ll.reverse()
+        ll.move_to_end(node)
+        assert ll.to_list() == [i for i in range(99, -1, -1) if i != 10] + [10]
+        assert ll.traverse(60) == 39 and ll.traverse(-1) is node
+        ll.remove_node(node)
+        assert ll.to_list() == [i for i in range(99, -1, -1) if i != 10] and ll.traverse(-1) == 0
 
 
 def test_index():
@@ -353,6 +548,15 @@ def test_pop():
         assert a == ds([10, 3.4, True])
         assert a.head == 10
 
+        b = ds([1, 2, 3])
+        node = b.pop(0)
+        assert node == 1 and node.next_node is None
+        node = b.pop(1)
+        assert node == 3 and node.next_node is None
+        assert b == ds([2])
+        if ds == DoublyLinkedList:
+            assert b.head.last_node is None
+
         is_error(IndexError, lambda: ds().pop())
         is_error(IndexError, lambda: ds([""]).pop(1))
         is_error(IndexError, lambda: ds([""]).pop(-2))
@@ -378,6 +582,48 @@ def test_remove():
         is_error(ValueError, lambda: a.remove(1011))
         is_error(ValueError, lambda: ds().remove(10))
 
+        # The node is unlinked where it is found, tail and checkpoints follow
+        a = ds(range(10))
+        a.enable_checkpoints(2)
+        assert a.traverse(8) == 8
+        a.remove(9)
+        a.remove(3)
+        assert a.traverse(-1) == 8 and a.traverse(7) == 8 and a.traverse(3) == 4 and len(a) == 8
+        a.append(10)
+        assert list(a.values()) == [0, 1, 2, 4, 5, 6, 7, 8, 10]
+
+
+def test_remove_if():
+    for ds in to_test + [UnrolledLinkedList, CompactLinkedList]:
+        ll = ds([1, 2, 3, 2, 1, 2])
+        assert ll.remove_all(2) == 3 and ll.to_list() == [1, 3, 1] and len(ll) == 3
+        assert ll.remove_all(4) == 0 and ll.to_list() == [1, 3, 1]
+        assert ll.remove_if(lambda x: x == 1) == 2 and ll.to_list() == [3]
+        ll.extend(range(10))
+        assert ll.retain_if(lambda x: x % 3 == 0) == 6 and ll.to_list() == [3, 0, 3, 6, 9]
+        assert ll.remove_if(lambda x: True) == 5 and ll.to_list() == [] and len(ll) == 0
+        ll.append(1)
+        assert ll.to_list() == [1] and len(ll) == 1
+
+        # Values checked before a failing predicate are removed already (a whole block for UnrolledLinkedList)
+        ll = ds([1, 2, "a", 3])
+        is_error(TypeError, lambda: ll.remove_if(lambda x: x < 3))
+        assert ll.to_list() == ([1, 2, "a", 3] if ds == UnrolledLinkedList else ["a", 3])
+        assert len(ll) == len(ll.to_list())
+
+    for ds in to_test:
+        # Removed nodes go back to the pool
+        pool = NodePool()
+        ll = ds(range(100), pool=pool)
+        ll.enable_checkpoints(8)
+        assert ll.traverse(90) == 90
+        assert ll.remove_if(lambda x: x % 2) == 50 and len(pool) == 50
+        assert ll.to_list() == list(range(0, 100, 2)) and ll.traverse(45) == 90 and ll.traverse(-1) == 98
+        ll.extend([100, 101])
+        assert pool.hits == 2 and ll.to_list()[-3:] == [98, 100, 101]
+        if ds == DoublyLinkedList:
+            assert [node.value for node in reversed(ll)] == ll.to_list()[::-1]
+
 
 def test_remove_duplicates():
     for ds in to_test:
@@ -414,6 +660,36 @@ def test_remove_duplicates():
         circular.head.next_node.next_node = circular.head
         is_error(ExceedMaxIter, circular.remove_duplicates)
 
+        h = ds([[1], "a", [1], {2: 3}, "A", (1,), {2: 3}, "a"])
+        h.remove_duplicates()
+        assert h == ds([[1], "a", {2: 3}, "A", (1,)])
+        h.remove_duplicates(key=lambda x: str(x).lower())
+        assert h == ds([[1], "a", {2: 3}, (1,)])
+        _check([[1], "a", {2: 3}, (1,)], h, ds)
+        assert h._tail == (1,) and len(h) == 4
+
+        i = ds(range(10 ** 5))
+        i.extend(range(10 ** 5))
+        i.remove_duplicates(key=lambda x: x // 2)
+        assert len(i) == 5 * 10 ** 4 and i._tail == 10 ** 5 - 2
+
+        # Duplicates go back to the pool, or are detached without one
+        pool = NodePool()
+        j = ds([1, 2, 1, 1, 3, 2, 4, 3], pool=pool)
+        j.remove_duplicates()
+        assert j.to_list() == [1, 2, 3, 4] and len(pool) == 4 and j._tail == 4
+        _check([1, 2, 3, 4], j, ds)
+        k = ds([5, 6, 5, 7, 6])
+        nodes = [k.traverse(idx) for idx in range(5)]
+        k.remove_duplicates()
+        assert k.to_list() == [5, 6, 7] and k._tail is nodes[3]
+        assert nodes[2].next_node is None and nodes[4].next_node is None
+        if ds == DoublyLinkedList:
+            assert nodes[2].last_node is None and nodes[4].last_node is None and nodes[3].last_node is nodes[1]
+        m = ds([1, 2, 1, 3])
+        is_error(ZeroDivisionError, lambda: m.remove_duplicates(key=lambda x: 1 / (x - 3)))
+        assert m.to_list() == [1, 2, 3] and len(m) == 3
+
 
 def test_reverse():
     for ds in to_test:
@@ -430,7 +706,7 @@ def test_reverse():
         assert c == ds([2, 1])
 
         d = ds([1, 2, 3, 4, 5, 6, 7])
-        e = reversed(d)
+        e = ds(node.value for node in reversed(d))
         d.reverse()
         assert d == e
 
@@ -444,16 +720,130 @@ def test_reverse():
         g.reverse()
         assert g == copied
 
+    # Reversing a doubly linked list leaves the links alone until they are needed
+    ll = DoublyLinkedList(range(5))
+    first_node = ll._head
+    ll.reverse()
+    assert ll._reversed and first_node.next_node == 1 and ll.to_list() == [4, 3, 2, 1, 0]
+    ll.append(-1)
+    ll.insert(0, 5)
+    ll.insert(3, 2.5)
+    assert ll.pop(1) == 4 and ll.pop(-1) == -1 and ll.pop(0) == 5
+    assert ll._reversed and ll.to_list() == [3, 2.5, 2, 1, 0] and len(ll) == 5
+    assert 2.5 in ll and ll.count(2) == 1 and ll == DoublyLinkedList([3, 2.5, 2, 1, 0]) and ll._reversed
+    assert ll.index(1) == 3 and ll.index(3, -5, -3) == 0 and ll._reversed
+    is_error(ValueError, ll.index, 2.5, 2)
+    # Walking backwards, swapping and moving nodes by reference do not relink the whole list either
+    assert [node.value for node in reversed(ll)] == [0, 1, 2, 2.5, 3] and ll._reversed
+    assert ll.detect_cycle() is None and ll._reversed
+    ll.swap(0, 4)
+    ll.swap(1, 2)
+    assert ll.to_list() == [0, 2, 2.5, 1, 3] and ll._reversed
+    ll.swap(0, 4)
+    ll.swap(1, 2)
+    ll.move_to_end(ll._traverse(1))
+    ll.move_to_end(ll._traverse(-1), last=False)
+    ll.remove_node(ll._traverse(2))
+    assert ll.to_list() == [2.5, 3, 1, 0] and ll._reversed and ll._tail == 0
+    is_error(ValueError, ll.remove_node, DoublyLinkedList([1])._head)
+    ll.insert(2, 2)
+    assert ll.to_list() == [2.5, 3, 2, 1, 0] and ll._reversed
+    ll.move_to_end(ll._traverse(1), last=False)
+    ll.MAX_ITER = 3  # Honoured like on a list which is not reversed
+    is_error(ExceedMaxIter, ll.to_list)
+    ll.MAX_ITER = None
+    assert ll._reversed
+    ll.materialize()
+    assert not ll._reversed
+    _check([3, 2.5, 2, 1, 0], ll, DoublyLinkedList)
+    ll.materialize()
+    ll.reverse()
+    assert ll.head == 0 and not ll._reversed  # head gives a node away
+    _check([0, 1, 2, 2.5, 3], ll, DoublyLinkedList)
+    ll.reverse()
+    ll.reverse()
+    assert not ll._reversed and ll.to_list() == [0, 1, 2, 2.5, 3]
+    ll.reverse()
+    ll.clear()
+    assert not ll._reversed and ll.to_list() == []
+
+    random.seed(2)
+    pool = NodePool()
+    ll = DoublyLinkedList(range(50), pool=pool)
+    ll.enable_checkpoints(4)
+    ref = list(range(50))
+    reversed_steps = 0
+    for step in range(600):
+        op = random.randrange(11)
+        if op == 0:
+            ll.reverse()
+            ref.reverse()
+        elif op == 1:
+            ll.append(step)
+            ref.append(step)
+        elif op == 2:
+            idx = random.randint(-len(ref) - 2, len(ref) + 2)
+            ll.insert(idx, step)
+            ref.insert(idx, step)
+        elif op == 3 and ref:
+            idx = random.randrange(-len(ref), len(ref))
+            assert ll.pop(idx) == ref.pop(idx)
+        elif op == 4 and ref:
+            idx = random.randrange(len(ref))
+            assert ll._traverse(idx) == ref[idx]  # traverse() would relink the nodes
+        elif op == 5 and len(ref) > 1:
+            idx1, idx2 = random.randrange(len(ref)), random.randrange(len(ref))
+            ll.swap(idx1, idx2)
+            ref[idx1], ref[idx2] = ref[idx2], ref[idx1]
+        elif op == 6:
+            values = [random.randrange(100) for _ in range(random.randrange(3))]
+            ll.extend(values)
+            ref.extend(values)
+        elif op == 7 and ref:
+            value = random.choice(ref)
+            assert ll.index(value) == ref.index(value)
+        elif op == 8:
+            assert ll.remove_all(step % 7) == ref.count(step % 7)
+            ref = [value for value in ref if value != step % 7]
+        elif op == 9 and ref:
+            idx = random.randrange(len(ref))
+            last = random.random() < 0.5
+            ll.move_to_end(ll._traverse(idx), last)
+            value = ref.pop(idx)
+            if last:
+                ref.append(value)
+            else:
+                ref.insert(0, value)
+        elif op == 10 and ref:
+            idx = random.randrange(len(ref))
+            ll.remove_node(ll._traverse(idx))
+            del ref[idx]
+        assert len(ll) == len(ref) and ll.to_list() == ref
+        assert [node.value for node in reversed(ll)] == ref[::-1]
+        if ref:
+            assert ll._tail == ref[-1] and ll._traverse(-1) == ref[-1]
+        reversed_steps += ll._reversed
+    assert reversed_steps > 100
+    ll.reverse()
+    ref.reverse()
+    ll.sort()
+    ref.sort()
+    _check(ref, ll, DoublyLinkedList)
+    assert [node.value for node in reversed(ll)] == ref[::-1]
+
 
 def test_sort():
     def test_func(tc, key=None, reverse=False):
         tc = list(tc)
         a = ds(tc)
         a.sort(key=key, reverse=reverse)
-        ref = ds(sorted(tc, key=key, reverse=reverse))
+        ref = sorted(tc, key=key, reverse=reverse)
+        assert a == ds(ref)
+        _check(ref, a, ds)
+        if ref:
+            assert a._tail is a.traverse(len(ref) - 1)
 
     for ds in to_test:
-        ds.MAX_ITER = 999
         test_func([])
         test_func([100])
         for _ in range(50):
@@ -462,6 +852,75 @@ def test_sort():
         test_func("`1234567890-=~!@#$%^&*()_+qwertyuiop[]QWERTYUIOP{}asdfghjkl;'\\ASDFGHJKL:\"|zxcvbnm,./ZXCVBNM<>?",
                   key=ord)
         test_func("This is a test string AA", key=str.lower, reverse=True)
+        test_func(range(1000))
+        test_func(range(1000, 0, -1), reverse=True)
+
+        # Stable, the key is computed once per node
+        calls = []
+        pairs = [(random.randrange(5), i) for i in range(200)]
+        a = ds(pairs)
+        a.sort(key=lambda x: calls.append(x) or x[0], reverse=True)
+        assert len(calls) == 200
+        assert a == ds(sorted(pairs, key=lambda x: x[0], reverse=True))
+
+        # Nodes are kept when a comparison fails
+        b = ds([3, 1, "a", 2, None, 0])
+        is_error(TypeError, b.sort)
+        assert sorted(b.count(x) for x in [3, 1, "a", 2, None, 0]) == [1] * 6 and len(b) == 6
+        is_error(ZeroDivisionError, lambda: b.sort(key=lambda x: 1 / 0))
+        assert len(b) == 6 and b.count("a") == 1
+
+        # The keys are kept apart from the links, which debug mode validates
+        set_debug(True)
+        try:
+            test_func([3, 1, 2], key=lambda x: -x)
+            test_func(range(100), key=lambda x: x % 7, reverse=True)
+        finally:
+            set_debug(False)
+
+
+def test_splice_split():
+    for ds in to_test:
+        for at, expected in [(0, [3, 4, 0, 1, 2]), (1, [0, 3, 4, 1, 2]), (3, [0, 1, 2, 3, 4]), (None, [0, 1, 2, 3, 4]),
+                             (-1, [0, 1, 3, 4, 2]), (10, [0, 1, 2, 3, 4]), (-10, [3, 4, 0, 1, 2])]:
+            a = ds(range(3))
+            b = ds([3, 4])
+            a.splice(b, at)
+            assert list(a) == expected and len(a) == 5 and a.traverse(4) == expected[-1]
+            assert len(b) == 0 and b.head is None
+            if ds == DoublyLinkedList:
+                assert list(reversed(a)) == expected[::-1]
+            a.append(5)
+            assert list(a) == expected + [5]
+
+        a = ds([1])
+        a.splice(ds())
+        assert a == ds([1])
+        is_error(ValueError, lambda: a.splice(a))
+        is_error(TypeError, lambda: a.splice(SinglyLinkedList() if ds == DoublyLinkedList else DoublyLinkedList()))
+
+        for at, left in [(0, 0), (2, 2), (5, 5), (-1, 4), (10, 5), (-10, 0)]:
+            a = ds(range(5), pool=NodePool())
+            a.MAX_ITER = 100
+            nodes = list(a)
+            b = a.split(at)
+            assert type(b) is ds and b.pool is a.pool and b.MAX_ITER == 100
+            assert list(a) == nodes[:left] and list(b) == nodes[left:]
+            assert len(a) == left and len(b) == 5 - left
+            if ds == DoublyLinkedList:
+                assert list(reversed(a)) == nodes[:left][::-1] and list(reversed(b)) == nodes[left:][::-1]
+            a.append(5)
+            b.append(6)
+            assert list(a) == list(range(left)) + [5] and list(b) == list(range(left, 5)) + [6]
+
+        # Checkpoints after the change are dropped
+        a = ds(range(100))
+        a.enable_checkpoints(4)
+        assert a.traverse(90) == 90
+        a.splice(ds(range(5)), 50)
+        assert a.traverse(90) == 85 and a.traverse(52) == 2
+        b = a.split(60)
+        assert a.traverse(59) == 54 and b.traverse(0) == 55 and len(a) == 60
 
 
 def test_swap():
@@ -506,4 +965,580 @@ def test_traverse():
 
         b = [10] * 100
         ll2 = ds(b)
-        is_error(ExceedMaxIter, lambda: ll2.traverse(100))
+        assert ll2.traverse(99) == 10
+        is_error(IndexError, lambda: ll2.traverse(100))
+
+
+def test_pool():
+    for ds in to_test:
+        pool = NodePool(ds._node_type, max_size=3)
+        pool.reserve(2)
+        assert pool.stats() == {"hits": 0, "misses": 0, "size": 2}
+
+        a = ds([1, 2, 3], pool=pool)
+        assert pool.stats() == {"hits": 2, "misses": 1, "size": 0}
+        a.remove(2)
+        assert len(pool) == 1
+        pool.release(a.pop(0))
+        assert len(pool) == 2
+        assert a == ds([3])
+
+        a.append(4)
+        a.insert(0, 5)
+        assert a == ds([5, 3, 4])
+        assert pool.hits == 4
+        _check([5, 3, 4], a, ds)
+
+        for node in [a.pop(), a.pop(), a.pop()]:
+            pool.release(node)
+        assert len(pool) == 3  # Bounded by max_size
+        assert a.copy().pool is pool
+
+        is_error(TypeError, lambda: pool.release(Node(1)))
+    is_error(ValueError, lambda: DoublyLinkedList(pool=NodePool(SinglyNode)))
+    is_error(TypeError, lambda: NodePool(Node))
+    SinglyLinkedList(pool=NodePool(DoublyNode))
+
+
+def test_size_and_tail():
+    def _consistent(ll, ref):
+        assert len(ll) == len(ref)
+        assert ll == ds(ref)
+        _check(ref, ll, ds)
+        if ref:
+            assert ll._tail is ll.traverse(len(ref) - 1)
+            assert ll._tail.next_node is None
+        else:
+            assert ll.head is None and ll._tail is None
+
+    random.seed(0)
+    for ds in to_test:
+        ll = ds()
+        ref = []
+        for _ in range(300):
+            op = random.randrange(7)
+            if op == 0:
+                value = random.randrange(10)
+                ll.append(value)
+                ref.append(value)
+            elif op == 1:
+                idx, value = random.randint(-len(ref) - 2, len(ref) + 2), random.randrange(10)
+                ll.insert(idx, value)
+                ref.insert(idx, value)
+            elif op == 2 and ref:
+                idx = random.randrange(-len(ref), len(ref))
+                assert ll.pop(idx) == ref.pop(idx)
+            elif op == 3 and len(ref) > 1:
+                idx1, idx2 = random.randrange(len(ref)), random.randrange(-len(ref), 0)
+                ll.swap(idx1, idx2)
+                ref[idx1], ref[idx2] = ref[idx2], ref[idx1]
+            elif op == 4:
+                ll.reverse()
+                ref.reverse()
+            elif op == 5 and ref:
+                value = random.choice(ref)
+                ll.remove(value)
+                ref.remove(value)
+            elif op == 6:
+                values = [random.randrange(10) for _ in range(random.randrange(3))]
+                ll.extend(values)
+                ref.extend(values)
+            if len(ref) > 40:
+                ll.sort()
+                ref.sort()
+                ll.remove_duplicates()
+                ref = sorted(set(ref))
+            _consistent(ll, ref)
+
+        ll += ds([1, 2])
+        ll *= 2
+        ref = (ref + [1, 2]) * 2
+        _consistent(ll, ref)
+        ll.clear()
+        _consistent(ll, [])
+
+        ll.head = ds._node_type(1, next_node=ds._node_type(2))
+        assert len(ll) == 2 and ll._tail == 2
+
+
+def test_checkpoints():
+    random.seed(1)
+    for ds in to_test:
+        for stride, max_checkpoints in [(1, None), (3, None), (2, 4)]:
+            ref = list(range(50))
+            ll = ds(ref)
+            ll.enable_checkpoints(stride, max_checkpoints)
+            for _ in range(300):
+                op = random.randrange(6)
+                if op == 0:
+                    idx = random.randint(-len(ref), len(ref))
+                    ll.insert(idx, -idx)
+                    ref.insert(idx, -idx)
+                elif op == 1 and ref:
+                    idx = random.randrange(-len(ref), len(ref))
+                    assert ll.pop(idx) == ref.pop(idx)
+                elif op == 2 and len(ref) > 1:
+                    idx1, idx2 = random.randrange(len(ref)), random.randrange(len(ref))
+                    ll.swap(idx1, idx2)
+                    ref[idx1], ref[idx2] = ref[idx2], ref[idx1]
+                elif op == 3:
+                    ll.append(op)
+                    ref.append(op)
+                elif op == 4 and random.random() < 0.1:
+                    random.choice([ll.reverse, ll.sort])()
+                    ref = list(ll.traverse(i).value for i in range(len(ll)))
+                for idx in random.sample(range(len(ref)), min(5, len(ref))):
+                    assert ll.traverse(idx) == ref[idx]
+                    assert ll.index(ref[idx], idx) == idx
+            if max_checkpoints is not None:
+                assert len(ll._checkpoints.nodes) <= max_checkpoints
+            ll.disable_checkpoints()
+            assert ll == ds(ref)
+
+
+def _check_blocks(ull):
+    blocks = []
+    block = ull._head
+    while block is not None:
+        blocks.append(block.value)
+        block = block.next_node
+    assert sum(map(len, blocks)) == len(ull)
+    assert all(0 < len(values) <= ull.block_size for values in blocks)
+    assert (ull._tail.value if blocks else None) is (blocks[-1] if blocks else None)
+    return blocks
+
+
+def test_unrolled():
+    ull = UnrolledLinkedList(range(10), block_size=4)
+    assert repr(ull) == "UnrolledLinkedList([0, 1, 2, 3] -> [4, 5, 6, 7] -> [8, 9])"
+    assert str(ull) == "UnrolledLinkedList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])"
+    assert list(reversed(ull)) == list(range(9, -1, -1))
+    assert ull.traverse(5) == 5 and ull.traverse(-1) == 9
+    assert 7 in ull and 10 not in ull
+    assert ull.count(3) == 1 and ull.index(8) == 8 and ull.index(2, -10, -7) == 2
+    is_error(ValueError, lambda: ull.index(2, 3))
+    is_error(IndexError, lambda: ull.traverse(10))
+    is_error(IndexError, lambda: UnrolledLinkedList().pop())
+    is_error(AttributeError, lambda: setattr(ull, "block_size", 2))
+    is_error(ValueError, lambda: UnrolledLinkedList(block_size=0))
+
+    ull.insert(1, "a")
+    assert _check_blocks(ull) == [[0, "a"], [1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert ull.pop(1) == "a" and ull.pop(1) == 1
+    assert _check_blocks(ull) == [[0, 2, 3], [4, 5, 6, 7], [8, 9]]
+    ull.remove(9)
+    ull.remove(8)
+    assert _check_blocks(ull) == [[0, 2, 3], [4, 5], [6, 7]]
+
+    ull.reverse()
+    assert list(ull) == [7, 6, 5, 4, 3, 2, 0]
+    ull.sort()
+    assert list(ull) == [0, 2, 3, 4, 5, 6, 7]
+    is_error(TypeError, lambda: ull.sort(key=lambda x: None if x == 5 else x))
+    assert list(ull) == [0, 2, 3, 4, 5, 6, 7]
+    ull.sort(key=lambda x: x % 2, reverse=True)
+    assert list(ull) == [3, 5, 7, 0, 2, 4, 6]
+    ull.swap(0, -1)
+    assert list(ull) == [6, 5, 7, 0, 2, 4, 3]
+
+    assert ull + ull == UnrolledLinkedList(list(ull) * 2)
+    assert 2 * ull == ull * 2 == ull + ull and ull * 0 == UnrolledLinkedList()
+    nested = UnrolledLinkedList([[1], [2]])
+    assert copy(nested) == nested and copy(nested)._head.value[0] is nested._head.value[0]
+    assert deepcopy(nested) == nested and deepcopy(nested)._head.value[0] is not nested._head.value[0]
+    assert ull != UnrolledLinkedList() and UnrolledLinkedList([1, 2]) < UnrolledLinkedList([1, 3])
+    ull.clear()
+    assert len(ull) == 0 and list(ull) == [] and _check_blocks(ull) == []
+
+
+def test_unrolled_random_ops():
+    for block_size in (1, 2, 3, 16):
+        ref = []
+        ull = UnrolledLinkedList(block_size=block_size)
+        for _ in range(2000):
+            op = random.randrange(8)
+            if op == 0:
+                idx = random.randint(-len(ref) - 2, len(ref) + 2)
+                ull.insert(idx, idx)
+                ref.insert(idx, idx)
+            elif op == 1 and ref:
+                idx = random.randrange(-len(ref), len(ref))
+                assert ull.pop(idx) == ref.pop(idx)
+            elif op == 2 and ref:
+                value = random.choice(ref)
+                ull.remove(value)
+                ref.remove(value)
+            elif op == 3:
+                ull.append(op)
+                ref.append(op)
+            elif op == 4:
+                values = range(random.randrange(2 * block_size))
+                ull.extend(values)
+                ref.extend(values)
+            elif op == 5 and random.random() < 0.2:
+                ull.reverse()
+                ref.reverse()
+            assert list(ull) == ref
+            blocks = _check_blocks(ull)
+            # Only the blocks at either end may be less than half full after popping or removing
+            assert all(len(values) * 2 >= block_size for values in blocks[1:-1]) or op in (0, 3, 4)
+        assert list(reversed(ull)) == ref[::-1]
+        for idx in random.sample(range(len(ref)), min(20, len(ref))):
+            assert ull.traverse(idx) == ref[idx]
+            assert ull.index(ref[idx]) == ref.index(ref[idx])
+
+    # A failing iterable keeps the values taken so far, like list.extend()
+    def values():
+        yield from range(5)
+        raise KeyError
+
+    ull = UnrolledLinkedList([0], block_size=2)
+    is_error(KeyError, lambda: ull.extend(values()))
+    assert list(ull) == [0, 0, 1, 2, 3, 4] and len(_check_blocks(ull)) == 3
+
+
+def test_unrolled_splice_split():
+    ull = UnrolledLinkedList(range(10), block_size=4)
+    assert ull.find_middle() == 5 and UnrolledLinkedList([1]).find_middle() == 1
+    is_error(IndexError, lambda: UnrolledLinkedList().find_middle())
+
+    tail = ull.split(5)
+    assert list(ull) == [0, 1, 2, 3, 4] and list(tail) == [5, 6, 7, 8, 9] and tail.block_size == 4
+    assert _check_blocks(ull) == [[0, 1], [2, 3, 4]] and _check_blocks(tail) == [[5, 6, 7], [8, 9]]
+    assert list(ull.split(10)) == [] and list(ull.split(-100)) == [0, 1, 2, 3, 4] and len(ull) == 0
+    ull.extend(range(3))
+    ull.splice(tail, 1)
+    assert list(ull) == [0, 5, 6, 7, 8, 9, 1, 2] and len(tail) == 0 and _check_blocks(tail) == []
+    # Blocks of another size are copied into blocks of this one
+    ull.splice(UnrolledLinkedList(["a"] * 10, block_size=16), -1)
+    assert list(ull) == [0, 5, 6, 7, 8, 9, 1] + ["a"] * 10 + [2]
+    assert all(len(values) <= 4 for values in _check_blocks(ull))
+    is_error(TypeError, lambda: ull.splice(SinglyLinkedList([1])))
+    is_error(ValueError, lambda: ull.splice(ull))
+
+    ull = UnrolledLinkedList([1, 2], block_size=4)
+    other = UnrolledLinkedList([3, 4], block_size=4)
+    ull.extend_from(other, move=False)
+    assert list(ull) == [1, 2, 3, 4] and list(other) == [3, 4]
+    ull.extend_from(ull, move=False)
+    ull.extend_from(other)
+    assert list(ull) == [1, 2, 3, 4, 1, 2, 3, 4, 3, 4] and len(other) == 0
+    is_error(TypeError, lambda: ull.extend_from([1], move=False))
+
+    ull.remove_duplicates()
+    assert list(ull) == [1, 2, 3, 4] and _check_blocks(ull) == [[1, 2, 3, 4]]
+    ull = UnrolledLinkedList([[1], 1, [1], "a", "A", 2], block_size=2)
+    ull.remove_duplicates(key=lambda x: x.lower() if isinstance(x, str) else x)
+    assert list(ull) == [[1], 1, "a", 2]
+
+    # Values rather than nodes, and none of the node-level API
+    assert UnrolledLinkedList([1, 2]).pop() == 2 and UnrolledLinkedList([1, 2]).traverse(0) == 1
+    for name in ("head", "cursor", "detect_cycle", "MAX_ITER", "pool", "enable_checkpoints"):
+        assert not hasattr(ull, name)
+
+
+def test_unrolled_splice_split_random():
+    for block_size in (1, 2, 3, 8):
+        ref = []
+        ull = UnrolledLinkedList(block_size=block_size)
+        for _ in range(500):
+            op = random.randrange(4)
+            at = random.randint(-len(ref) - 2, len(ref) + 2)
+            if op == 0:
+                values = list(range(random.randrange(3 * block_size)))
+                ull.splice(UnrolledLinkedList(values, block_size=random.choice((block_size, 4))), at)
+                ref[at:at] = values
+            elif op == 1:
+                tail = ull.split(at)
+                assert list(tail) == ref[at:] and all(len(values) <= block_size for values in _check_blocks(tail))
+                if random.random() < 0.5:
+                    ull.extend_from(tail)
+                    assert len(tail) == 0
+                else:
+                    del ref[at:]
+            elif op == 2:
+                values = range(random.randrange(2 * block_size))
+                ull.extend(values)
+                ref.extend(values)
+            elif op == 3 and ref:
+                assert ull.find_middle() == ref[len(ref) // 2]
+            assert list(ull) == ref
+            blocks = _check_blocks(ull)
+            assert all(len(values) * 2 >= block_size for values in blocks[1:-1])
+
+
+def test_compact():
+    for doubly in (True, False):
+        cll = CompactLinkedList(range(5), doubly=doubly)
+        assert cll.doubly is doubly
+        assert repr(cll) == "CompactLinkedList(0 -> 1 -> 2 -> 3 -> 4)"
+        assert str(cll) == "CompactLinkedList([0, 1, 2, 3, 4])"
+        is_error(AttributeError, lambda: setattr(cll, "doubly", True))
+        is_error(IndexError, lambda: cll.traverse(5))
+        is_error(IndexError, lambda: CompactLinkedList().pop())
+        is_error(ValueError, lambda: cll.remove(5))
+
+        # Freed slots are reused
+        assert cll.pop(1) == 1 and cll.pop(0) == 0
+        assert list(cll._free) == [1, 0] and cll._ordered is False
+        cll.insert(1, "a")
+        cll.append("b")
+        assert list(cll) == [2, "a", 3, 4, "b"] and len(cll._values) == 5 and not cll._free
+        assert list(reversed(cll)) == ["b", 4, 3, "a", 2]
+        assert cll.traverse(-2) == 4 and cll.index(4) == 3 and "a" in cll and cll.count(3) == 1
+
+        cll.compact()
+        assert cll._values == [2, "a", 3, 4, "b"] and cll._ordered is True
+        assert list(cll._next) == [1, 2, 3, 4, -1]
+        assert cll.pop() == "b" and cll._ordered is True
+        cll.reverse()
+        assert list(cll) == [4, 3, "a", 2] and list(reversed(cll)) == [2, "a", 3, 4]
+        cll.sort(key=str)
+        assert list(cll) == [2, 3, 4, "a"] and cll._ordered is True
+        cll.extend([2, 3, [1], [1]])
+        cll.remove_duplicates()
+        assert list(cll) == [2, 3, 4, "a", [1]]
+
+        copied = deepcopy(cll)
+        assert copied == cll and copied.doubly is doubly and copied.traverse(-1) is not cll.traverse(-1)
+        assert cll + cll == CompactLinkedList(list(cll) * 2) and cll * 2 == cll + cll
+        while cll:
+            cll.pop(0)
+        assert cll._values == [] and cll._head == -1 and cll._tail == -1 and not cll._free
+
+
+def test_compact_random_ops():
+    for doubly in (True, False):
+        ref = []
+        cll = CompactLinkedList(doubly=doubly)
+        for _ in range(2000):
+            op = random.randrange(9)
+            if op == 0:
+                idx = random.randint(-len(ref) - 2, len(ref) + 2)
+                cll.insert(idx, idx)
+                ref.insert(idx, idx)
+            elif op == 1 and ref:
+                idx = random.randrange(-len(ref), len(ref))
+                assert cll.pop(idx) == ref.pop(idx)
+            elif op == 2 and ref:
+                value = random.choice(ref)
+                cll.remove(value)
+                ref.remove(value)
+            elif op == 3:
+                cll.append(op)
+                ref.append(op)
+            elif op == 4:
+                values = range(random.randrange(5))
+                cll.extend(values)
+                ref.extend(values)
+            elif op == 5 and random.random() < 0.2:
+                cll.reverse()
+                ref.reverse()
+            elif op == 6 and random.random() < 0.1:
+                cll.compact()
+            elif op == 7 and len(ref) > 1:
+                idx1, idx2 = random.randrange(len(ref)), random.randrange(len(ref))
+                cll.swap(idx1, idx2)
+                ref[idx1], ref[idx2] = ref[idx2], ref[idx1]
+            assert list(cll) == ref and len(cll) == len(ref)
+            assert len(cll._values) == len(cll._next) == len(ref) + len(cll._free)
+        assert list(reversed(cll)) == ref[::-1]
+        for idx in random.sample(range(len(ref)), min(20, len(ref))):
+            assert cll.traverse(idx) == ref[idx]
+            assert cll.index(ref[idx]) == ref.index(ref[idx])
+
+
+def test_compact_splice_split():
+    for doubly in (True, False):
+        cll = CompactLinkedList(range(10), doubly=doubly)
+        assert cll.find_middle() == 5 and CompactLinkedList([1]).find_middle() == 1
+        is_error(IndexError, lambda: CompactLinkedList().find_middle())
+
+        # Ordered slots at the end of the columns are dropped, the others are freed
+        tail = cll.split(7)
+        assert list(cll) == list(range(7)) and list(tail) == [7, 8, 9] and tail.doubly is doubly
+        assert len(cll._values) == 7 and cll._ordered and tail._ordered
+        cll.pop(0)
+        tail = cll.split(-2)
+        assert list(cll) == [1, 2, 3, 4] and list(tail) == [5, 6] and sorted(cll._free) == [0, 5, 6]
+        assert list(cll.split(10)) == [] and list(cll.split(-100)) == [1, 2, 3, 4] and cll._values == []
+
+        cll.extend(range(3))
+        cll.splice(tail, 1)
+        assert list(cll) == [0, 5, 6, 1, 2] and len(tail) == 0 and tail._values == []
+        cll.splice(CompactLinkedList(["a", "b"], doubly=not doubly), 0)
+        cll.splice(CompactLinkedList(["c"]))
+        assert list(cll) == ["a", "b", 0, 5, 6, 1, 2, "c"] and list(reversed(cll)) == list(cll)[::-1]
+        assert cll.find_middle() == 6 and cll.traverse(-1) == "c"
+        is_error(TypeError, lambda: cll.splice(SinglyLinkedList([1])))
+        is_error(ValueError, lambda: cll.splice(cll))
+
+        cll = CompactLinkedList([1, 2], doubly=doubly)
+        other = CompactLinkedList([3, 4])
+        cll.extend_from(other, move=False)
+        assert list(cll) == [1, 2, 3, 4] and list(other) == [3, 4]
+        cll.extend_from(cll, move=False)
+        cll.extend_from(other)
+        assert list(cll) == [1, 2, 3, 4, 1, 2, 3, 4, 3, 4] and len(other) == 0
+        is_error(TypeError, lambda: cll.extend_from([1], move=False))
+        is_error(ValueError, lambda: cll.extend_from(cll))
+
+        # Values rather than nodes, and none of the node-level API
+        assert cll.pop() == 4 and cll.traverse(0) == 1
+        for name in ("head", "cursor", "detect_cycle", "MAX_ITER", "pool", "enable_checkpoints"):
+            assert not hasattr(cll, name)
+
+    ref = []
+    cll = CompactLinkedList()
+    for _ in range(1000):
+        op = random.randrange(4)
+        at = random.randint(-len(ref) - 2, len(ref) + 2)
+        if op == 0:
+            values = list(range(random.randrange(5)))
+            cll.splice(CompactLinkedList(values), at)
+            ref[at:at] = values
+        elif op == 1:
+            assert list(cll.split(at)) == ref[at:]
+            del ref[at:]
+        elif op == 2 and ref:
+            idx = random.randrange(len(ref))
+            assert cll.pop(idx) == ref.pop(idx)
+        elif op == 3:
+            values = range(random.randrange(8))
+            cll.extend(values)
+            ref.extend(values)
+        assert list(cll) == ref and list(reversed(cll)) == ref[::-1]
+        assert len(cll._values) == len(cll._next) == len(cll._prev) == len(ref) + len(cll._free)
+        if ref:
+            assert cll.find_middle() == ref[len(ref) // 2]
+
+
+def test_values():
+    for ds in to_test + [UnrolledLinkedList, CompactLinkedList]:
+        ll = ds([1, 2, 3, 4, 5])
+        assert list(ll.values()) == ll.to_list() == [1, 2, 3, 4, 5]
+        assert ll.to_array("i") == array("i", [1, 2, 3, 4, 5])
+        assert list(ll.iter_chunks(2)) == [[1, 2], [3, 4], [5]]
+        assert list(ll.iter_chunks(5)) == [[1, 2, 3, 4, 5]]
+        assert list(ds().iter_chunks(3)) == [] and ds().to_list() == [] and ds().to_array("d") == array("d")
+        is_error(ValueError, lambda: ll.iter_chunks(0))
+        is_error(ValueError, lambda: ll.to_array("?"))
+        is_error(TypeError, lambda: ds(["a"]).to_array("i"))
+        is_error(OverflowError, lambda: ds([2 ** 70]).to_array("q"))
+
+    for ds in to_test:
+        # Nodes linked by hand after the tail are walked as well
+        ll = ds([1, 2, 3])
+        extra = ll._node_type(4)
+        ll.traverse(2).next_node = extra
+        assert list(ll.values()) == [node.value for node in ll] == [1, 2, 3, 4]
+        extra.next_node = ll.head
+        is_error(ExceedMaxIter, lambda: list(ll.values()))
+        is_error(ExceedMaxIter, lambda: ll.to_list())
+
+        # Values are compared directly, not through the nodes
+        ll = ds([[1], 1.0, "a", None])
+        assert ll.count(1) == 1 and ll.count([1]) == 1 and ll.index(None) == 3 and "a" in ll and 2 not in ll
+        assert ll == ds([[1], 1, "a", None]) and ll != ds([[1], 1, "a"]) and ll != ds([[1], 1, "b", None])
+
+
+def test_concurrent():
+    ll = ConcurrentDoublyLinkedList(range(5))
+    assert ll == ConcurrentDoublyLinkedList(range(5)) and ll != DoublyLinkedList(range(5))
+    ll.append_left(-1)
+    assert ll.pop_left() == -1
+    ll.rotate(2)
+    assert ll.to_list() == [3, 4, 0, 1, 2]
+    ll.rotate(-7)
+    assert ll.to_list() == [0, 1, 2, 3, 4]
+    _check([0, 1, 2, 3, 4], ll, DoublyLinkedList)
+    assert ll.pop_left_append() == 0 and ll.to_list() == [1, 2, 3, 4, 0]
+    other = ConcurrentDoublyLinkedList()
+    assert ll.pop_left_append(other) == 1 and other.to_list() == [1] and len(ll) == 4
+    is_error(TypeError, ll.pop_left_append, DoublyLinkedList())
+    is_error(IndexError, ConcurrentDoublyLinkedList().pop_left)
+    is_error(IndexError, ConcurrentDoublyLinkedList().pop_left_append)
+    assert type(ll.copy()) is ConcurrentDoublyLinkedList and type(ll.split(2)) is ConcurrentDoublyLinkedList
+    is_error(AttributeError, setattr, ll, "_head_lock", None)
+
+    # Iterators walk a snapshot
+    ll = ConcurrentDoublyLinkedList(range(5))
+    values, nodes = ll.values(), iter(ll)
+    ll.clear()
+    assert list(values) == [0, 1, 2, 3, 4] and [node.value for node in nodes] == [0, 1, 2, 3, 4]
+
+    # A sequence of calls is atomic inside locked()
+    with ll.locked():
+        ll.extend([1, 2])
+        ll.append(ll.pop_left().value)
+    assert ll.to_list() == [2, 1]
+
+    # Each end has its own lock, a producer at one end does not wait for a consumer at the other end
+    from threading import Thread
+    ll = ConcurrentDoublyLinkedList(range(10))
+    with ll._head_lock:
+        producer = Thread(target=lambda: (ll.extend([10, 11]), ll.append(12), ll.pop()))
+        producer.start()
+        producer.join(timeout=10)
+        assert not producer.is_alive()
+    with ll._tail_lock:
+        consumer = Thread(target=lambda: (ll.pop_left(), ll.pop(0), ll.append_left(1), ll.append_left(0)))
+        consumer.start()
+        consumer.join(timeout=10)
+        assert not consumer.is_alive()
+    assert ll.to_list() == list(range(12)) and len(ll) == 12
+    _check(list(range(12)), ll, DoublyLinkedList)
+    # Unless the ends are too close to each other
+    ll = ConcurrentDoublyLinkedList([1, 2])
+    with ll._head_lock:
+        producer = Thread(target=ll.append, args=(3,))
+        producer.start()
+        producer.join(timeout=0.1)
+        assert producer.is_alive()
+    producer.join(timeout=10)
+    assert ll.to_list() == [1, 2, 3]
+
+    # Nothing is lost nor duplicated while threads hand values over
+    n_threads, n_values = 8, 500
+    source = ConcurrentDoublyLinkedList(range(n_threads * n_values))
+    target = ConcurrentDoublyLinkedList()
+    shared = ConcurrentDoublyLinkedList()
+    errors = []
+
+    def worker(thread_id):
+        try:
+            for i in range(n_values):
+                try:
+                    source.pop_left_append(target)
+                except IndexError:  # The values are in target, or on their way between the two linked lists
+                    pass
+                shared.append(thread_id)
+                if i % 2:
+                    shared.pop_left()
+                # Both ends at once, while other threads append and pop
+                shared.append_left(thread_id)
+                shared.pop()
+                if i % 50 == 0:
+                    source.rotate(i)
+                    target.reverse()
+                    shared.sort()
+                    assert len(source.to_list()) + len(target.to_list()) >= 0
+                    # Moved back and forth, the two linked lists are locked in the same order
+                    if thread_id % 2:
+                        source.extend_from(target.split(len(target) // 2))
+                    else:
+                        target.splice(source.split(len(source) // 2), 0)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker, args=(thread_id,)) for thread_id in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    assert not any(thread.is_alive() for thread in threads) and errors == []
+    assert sorted(source.to_list() + target.to_list()) == list(range(n_threads * n_values))
+    assert len(shared) == n_threads * n_values // 2
+    for ll in (source, target, shared):
+        _check(ll.to_list(), ll, DoublyLinkedList)
+        assert len(ll) == len(ll.to_list())
@@ -108,6 +108,20 @@ def test_op_mul(item):
 
         is_error(ExceedMaxLengthError, _test)
 
+        # Nothing is repeated if the result would not fit
+        b = item([1, 2], 5)
+
+        def _test1():
+            b.__imul__(3)
+
+        is_error(ExceedMaxLengthError, _test1)
+        assert b == item([1, 2], 5)
+    else:
+        # The result never shares its container with the operand
+        b = item(StaticList([1], 4))
+        assert b * 2 == item([1, 1]) and b + item([2]) == item([1, 2])
+        assert b == item([1])
+
 
 @mark.parametrize("item", ds)
 def test_in(item):
@@ -266,11 +280,17 @@ def test_copy(item):
     assert a == b
     assert a is not b
     if item == DynamicList:
-        assert a._DynamicList__container is b._DynamicList__container
+        assert a._DynamicList__container is not b._DynamicList__container
     b.append(2)
     assert b == item([1, 2])
     assert a == item([1])
 
+    c = item([1, 2, 3, 4]) if item == DynamicList else item([1, 2, 3, 4], max_length=8)
+    d = c.copy()
+    d.pop()
+    assert c == item([1, 2, 3, 4])
+    assert d == item([1, 2, 3])
+
 
 @mark.parametrize("item", ds)
 def test_deepcopy(item):
@@ -287,6 +307,12 @@ def test_deepcopy(item):
     assert b == item([1, 2])
     assert a == item([1])
 
+    c = item([[1]]) if item == DynamicList else item([[1]], max_length=2)
+    d = c.copy(deep=True)
+    assert c == d and c[0] is not d[0]
+    assert c.copy()[0] is c[0]
+    assert d.max_length == c.max_length
+
 
 @mark.parametrize("item", ds)
 def test_count(item):
@@ -1,4 +1,4 @@
-from pydsa.data_structures import Node, NodeType
+from pydsa.data_structures import DoublyNode, Node, NodeType, SinglyNode, get_debug, set_debug
 from tests import is_error
 
 
@@ -68,3 +68,27 @@ def test_set_annotations():
         a.something_float = 1.2
 
     is_error(AttributeError, _test2)
+
+
+def test_slotted_nodes():
+    a = SinglyNode(10)
+    b = DoublyNode(20, next_node=a)
+    assert a.next_node is None
+    assert b.last_node is None and b.next_node is a
+    assert repr(a) == "SinglyNode(10)"
+    assert a == Node(10) and b > a
+    assert NodeType.__supertype__ == SinglyNode and NodeType.__supertype__ == DoublyNode
+    is_error(AttributeError, lambda: setattr(a, "smth_else", 1))
+    is_error(TypeError, lambda: delattr(a, "next_node"))
+
+    a.next_node = 123  # Not validated by default
+    set_debug(True)
+    try:
+        assert get_debug()
+        is_error(TypeError, lambda: setattr(a, "next_node", 123))
+        is_error(TypeError, lambda: setattr(b, "last_node", "123"))
+        b.last_node = a
+        a.value = "anything"
+    finally:
+        set_debug(False)
+    assert not get_debug()
@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+
+import pydsa
+from pydsa import IntList, NonNegativeInt, validate_args, validation
+from pydsa.algorithms.sorting import counting_sort, radix_sort
+from tests import is_error
+
+
+@validate_args
+def _f(arr: IntList, n: NonNegativeInt = 0) -> int:
+    return n
+
+
+def test_full():
+    assert pydsa.get_validation() == "full"
+    is_error(TypeError, _f, (1, 2))
+    is_error(ValueError, _f, [1, "2"])
+    is_error(ValueError, _f, [1, 2], -1)
+    is_error(ValueError, radix_sort, [1, 2.5])
+
+
+def test_shallow():
+    with validation("shallow"):
+        assert pydsa.get_validation() == "shallow"
+        is_error(TypeError, _f, (1, 2))
+        is_error(ValueError, _f, [1, 2], n=-1)
+        assert _f([1, "2"]) == 0
+        assert counting_sort([3, 1, 2]) == [1, 2, 3]
+    assert pydsa.get_validation() == "full"
+
+
+def test_off():
+    with validation("off"):
+        assert _f((1, 2), -1) == -1
+        with validation("full"):
+            is_error(TypeError, _f, (1, 2))
+        assert pydsa.get_validation() == "off"
+    assert pydsa.get_validation() == "full"
+
+
+def test_set_validation():
+    is_error(ValueError, pydsa.set_validation, "none")
+    pydsa.set_validation("off")
+    try:
+        assert _f("anything") == 0
+    finally:
+        pydsa.set_validation("full")
+
+
+def test_environ():
+    code = "import pydsa; print(pydsa.get_validation())"
+    env = dict(os.environ, PYDSA_VALIDATION="shallow")
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.check_output([sys.executable, "-c", code], env=env, cwd=cwd).strip() == b"shallow"
+
+
+def test_element_check():
+    assert pydsa.get_element_check() == ("all", 64)
+    is_error(ValueError, pydsa.set_element_check, "random")
+    is_error(ValueError, pydsa.set_element_check, "prefix", 0)
+
+    arr = list(range(100)) + ["x"]
+    is_error(ValueError, _f, arr)
+    try:
+        pydsa.set_element_check("prefix", 10)
+        assert _f(arr) == 0
+        is_error(ValueError, _f, ["x"] + arr)
+        is_error(ValueError, radix_sort, ["x"] + arr)
+
+        pydsa.set_element_check("sample", 10)
+        assert _f(arr[:-1]) == 0
+        is_error(ValueError, _f, ["x"] * 20)
+        assert radix_sort([3, 1, 2]) == [1, 2, 3]
+    finally:
+        pydsa.set_element_check("all")
+
+
+def test_known_element_type():
+    from array import array
+    from pydsa.algorithms.searching import interpolation_search
+
+    assert interpolation_search(array("i", [1, 2, 3]), 2, pre_check=False) == 1
+    assert interpolation_search(array("d", [1.0, 2.5]), 2.5, pre_check=False) == 1
+    assert interpolation_search(range(10), 7, pre_check=False) == 7
+    is_error(ValueError, interpolation_search, array("u", "abc"), "b", pre_check=False)
+
+
+def test_profile():
+    import json
+
+    pydsa.reset_profile()
+    _f([1, 2])
+    assert pydsa.get_profile() == {}
+
+    pydsa.enable_profiling()
+    try:
+        _f([1, 2])
+        _f([1, 2], n=3)
+        is_error(ValueError, _f, [1, 2], -1)
+    finally:
+        pydsa.disable_profiling()
+    _f([1, 2])
+
+    name = _f.__module__ + "._f"
+    report = pydsa.get_profile()
+    assert list(report) == [name]
+    assert report[name]["calls"] == 3
+    assert report[name]["validation_time"] > 0
+    assert report[name]["body_time"] > 0
+    assert json.loads(pydsa.get_profile(as_json=True)) == report
+
+    pydsa.reset_profile()
+    assert pydsa.get_profile() == {}